@@ -1,21 +1,24 @@
 """nbforager."""
 
 from nbforager import ami
+from nbforager.async_nb_api import AsyncNbApi
 from nbforager.exceptions import NbApiError, NbParserError, NbVersionError
 from nbforager.foragers.joiner import Joiner
 from nbforager.nb_api import NbApi
 from nbforager.nb_forager import NbForager
 from nbforager.nb_tree import NbTree
-from nbforager.parser.nb_parser import NbParser
+from nbforager.parser.nb_parser import NbParser, NbPredicate
 from nbforager.parser.nb_value import NbValue
 
 __all__ = [
+    "AsyncNbApi",
     "Joiner",
     "NbApi",
     "NbApiError",
     "NbForager",
     "NbParser",
     "NbParserError",
+    "NbPredicate",
     "NbTree",
     "NbValue",
     "NbVersionError",
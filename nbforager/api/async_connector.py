@@ -0,0 +1,329 @@
+"""Asyncio connector to Netbox entry point for different models."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import urllib
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Optional
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+from vhelpers import vlist, vparam
+
+from nbforager import helpers
+from nbforager.api.connector import Connector
+from nbforager.types import DAny, LDAny, LDList, LParam, DList, LLDAny
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None  # type: ignore
+
+if TYPE_CHECKING:
+    from nbforager.async_nb_api import AsyncNbApi
+
+
+class AsyncConnector:
+    """Asyncio connector to Netbox entry point for different models.
+
+    For example, ``AsyncNbApi.ipam.ip_addresses.{method}``, where ``{method}``
+    is awaitable and has the same parameters as in ``NbApi.ipam.ip_addresses.{method}``.
+    Parameters validation and slicing are done by the related NbApi Connector.
+    """
+
+    def __init__(self, connector: Connector, api: AsyncNbApi):
+        """Initialize AsyncConnector.
+
+        :param connector: NbApi Connector of the same app/model, used to validate parameters.
+        :param api: AsyncNbApi object that holds the session and the concurrency semaphore.
+        """
+        self.connector: Connector = connector
+        self.api: AsyncNbApi = api
+
+    def __repr__(self) -> str:
+        """__repr__."""
+        name = self.__class__.__name__
+        return f"<{name}: {self.connector.host}>"
+
+    # ============================= property =============================
+
+    @property
+    def path(self) -> str:
+        """Section of the URL that points to the model."""
+        return self.connector.path
+
+    @property
+    def url(self) -> str:
+        """URL to the API endpoint of the Netbox object."""
+        return self.connector.url
+
+    # ============================= methods ==============================
+
+    async def create(self, **kwargs) -> Response:
+        """Create an object in Netbox.
+
+        :param kwargs: Parameters for creating a new object.
+
+        :return: Session response.
+
+            - <Response [201]> Object successfully created,
+            - <Response [400]> Object already exists.
+        :rtype: Response
+        """
+        return await self._request(method="POST", url=self.url, data=json.dumps(kwargs))
+
+    async def create_d(self, **kwargs) -> DAny:
+        """Create an object in Netbox.
+
+        :param kwargs: Parameters for creating a new object.
+
+        :return: Data of newly created object.
+        :rtype: dict
+        """
+        response: Response = await self.create(**kwargs)
+        if not response.status_code == 201:
+            return {}
+        return helpers.decode_response_d(response)
+
+    # noinspection PyShadowingBuiltins
+    async def delete(self, id: int) -> Response:  # pylint: disable=redefined-builtin
+        """Delete an object in Netbox.
+
+        :param id: Object ID.
+        :type id: int
+
+        :return: Session response.
+
+            - <Response [204]> Object successfully deleted,
+            - <Response [404]> Object not found.
+        :rtype: Response
+        """
+        if not id:
+            raise ValueError("id is required.")
+        return await self._request(method="DELETE", url=f"{self.url}{id}")
+
+    # noinspection PyProtectedMember
+    async def get(self, **kwargs) -> LDAny:
+        """Request data from Netbox.
+
+        The filtering parameters are identical to those in ``NbApi.{app}.{model}.get()``.
+        All pages of all sliced parameters are requested concurrently,
+        the count of requests in flight is limited by ``AsyncNbApi.concurrency``.
+
+        :param kwargs: Filtering parameters.
+
+        :return: List of dictionaries containing Netbox objects.
+        :rtype: List[dict]
+        """
+        connector = self.connector
+        # extended filtering parameters may request Netbox in blocking mode
+        params_ld: LDList = await asyncio.to_thread(connector._validate_params, **kwargs)
+        params_ld = helpers.slice_params_ld(
+            url=connector.url,
+            max_len=connector.url_length,
+            keys=connector._slices,  # pylint: disable=W0212
+            params_ld=params_ld,
+        )
+
+        results_l: LLDAny = await asyncio.gather(*[self._query_pages(d) for d in params_ld])
+        results: LDAny = [d for results_ in results_l for d in results_]
+        items: LDAny = sorted(results, key=itemgetter("id"))
+        items = vlist.no_dupl(items)
+        helpers.pop_excluded_keys(items, params_ld)
+        connector._check_extra_keys(items=items)  # pylint: disable=W0212
+        return items
+
+    # noinspection PyProtectedMember
+    async def get_count(self, **kwargs) -> int:
+        """Get the count of Netbox objects based on the provided filtering parameters.
+
+        :param kwargs: Filtering parameters.
+        :return: Count of Netbox objects based on the provided parameters.
+        :raises ValueError: If count for loners parameters is not supported.
+        """
+        skip = ["brief", "limit", "offset", "fields", "exclude"]
+        kwargs = {k: v for k, v in kwargs.items() if k not in skip}
+        connector = self.connector
+        params_ld: LDList = await asyncio.to_thread(connector._validate_params, **kwargs)
+        if len(params_ld) > 1:
+            raise ValueError("Count for loners parameters is not supported.")
+        params_d: DAny = {**kwargs, "brief": 1, "limit": 1}
+        data: DAny = await self._query_page(params_d)
+        return int(data.get("count") or 0)
+
+    # noinspection PyIncorrectDocstring
+    async def update(self, **kwargs) -> Response:
+        """Update an object in Netbox.
+
+        :param id: Netbox object ID to update.
+        :type id: int
+
+        :param kwargs: Parameters to update an object in Netbox.
+
+        :return: Session response.
+
+            - <Response [200]> Object successfully updated,
+            - <Response [400]> Invalid data.
+        :rtype: Response
+        """
+        id_ = kwargs.pop("id")
+        if not id_:
+            raise ValueError("id is required in the data.")
+        return await self._request(method="PATCH", url=f"{self.url}{id_}/", data=json.dumps(kwargs))
+
+    # noinspection PyIncorrectDocstring
+    async def update_d(self, **kwargs) -> DAny:
+        """Update an object in Netbox.
+
+        :param id: Netbox object ID to update.
+        :type id: int
+
+        :param kwargs: Parameters to update an object in Netbox.
+
+        :return: Data of updated object.
+        :rtype: dict
+        """
+        response: Response = await self.update(**kwargs)
+        if not response.status_code == 200:
+            return {}
+        return helpers.decode_response_d(response)
+
+    # ============================= helpers ==============================
+
+    # noinspection PyProtectedMember
+    async def _query_pages(self, params_d: DList) -> LDAny:
+        """Retrieve all pages of interested objects from the Netbox concurrently.
+
+        Request the first page, read the count of objects from it,
+        and then request the remaining offsets concurrently.
+
+        :param params_d: Parameters to request from the Netbox.
+
+        :return: Netbox objects.
+        """
+        is_offset: bool = "offset" in params_d
+        params_d = self.connector._add_default_limit_offset(params_d)  # pylint: disable=W0212
+        data: DAny = await self._query_page(params_d)
+        results: LDAny = list(data.get("results") or [])
+        if is_offset:
+            return results
+
+        count = int(data.get("count") or 0)
+        if count <= len(results):
+            return results
+
+        limit = int(_first(params_d["limit"]))
+        params_ld: LDAny = helpers.generate_offsets(count, limit, params_d)[1:]
+        pages: LLDAny = await asyncio.gather(*[self._query_results(d) for d in params_ld])
+        for results_ in pages:
+            results.extend(results_)
+        return results
+
+    async def _query_results(self, params_d: DAny) -> LDAny:
+        """Retrieve one page of objects from the Netbox.
+
+        :param params_d: Parameters to request from the Netbox, with limit and offset.
+
+        :return: Netbox objects.
+        """
+        data: DAny = await self._query_page(params_d)
+        return list(data.get("results") or [])
+
+    async def _query_page(self, params_d: DAny) -> DAny:
+        """Retrieve one page from the Netbox.
+
+        :param params_d: Parameters to request from the Netbox.
+
+        :return: Decoded page data, or empty data if strict is False and status is 400.
+
+        :raises HTTPError: Response status is not 2xx.
+        :raises ConnectionError: Connection issue occurs or the limit of retries is reached.
+        """
+        params_l: LParam = vparam.from_dict(params_d)
+        url = f"{self.connector.url_api}{self.path}?{urllib.parse.urlencode(params_l)}"
+        response: Response = await self._request(method="GET", url=url)
+        if not response.ok:
+            return {}
+        return helpers.decode_response_d(response)
+
+    async def _request(self, method: str, url: str, data: Optional[str] = None) -> Response:
+        """Perform an HTTP request with automatic retry logic.
+
+        Works like ``BaseMC._retry_requests()``. Each attempt waits for the
+        ``AsyncNbApi.semaphore``, so the count of requests in flight is limited.
+
+        :param method: HTTP method.
+        :param url: The URL to send the request to.
+        :param data: JSON data to send in the body of the request.
+
+        :return: Response object.
+
+        :raises HTTPError: GET Response status is not 2xx.
+        :raises ConnectionError: Connection issue occurs.
+        """
+        connector = self.connector
+        max_retries = connector.max_retries + 1
+        sleep = connector.sleep
+        counter = 0
+        session = self.api.session()
+
+        while counter < max_retries:
+            counter += 1
+            try:
+                async with self.api.semaphore:
+                    async with session.request(
+                        method=method,
+                        url=url,
+                        data=data,
+                        headers=connector._headers(),  # pylint: disable=W0212
+                    ) as resp:
+                        content: bytes = await resp.read()
+            except asyncio.TimeoutError:
+                attempts = f"{counter} of {connector.max_retries}"
+                msg = f"Session timeout={connector.timeout!r}sec reached, {attempts=}."
+                logging.warning(msg)
+                if counter < max_retries:
+                    msg = f"Next attempt after {sleep=} sec."
+                    logging.warning(msg)
+                    await asyncio.sleep(sleep)
+                continue
+            except aiohttp.ClientConnectionError as ex:
+                raise ConnectionError(f"Netbox connection error: {ex}") from ex
+
+            response: Response = _init_response(resp, content)
+            if method == "GET" and not response.ok:
+                helpers.raise_for_status(response, strict=connector.strict)
+            return response
+
+        return connector._response_gateway_timeout()  # pylint: disable=W0212
+
+
+# ============================= helpers ==============================
+
+
+def _first(value: Any) -> Any:
+    """Get the first item if value is a list."""
+    if isinstance(value, (list, tuple)):
+        return value[0]
+    return value
+
+
+def _init_response(resp: Any, content: bytes) -> Response:
+    """Convert aiohttp response to requests Response.
+
+    :param resp: aiohttp ClientResponse object.
+    :param content: Body of the response.
+
+    :return: Response object.
+    """
+    response = Response()
+    response.status_code = int(resp.status)
+    response.reason = str(resp.reason or "")
+    response.url = str(resp.url)
+    response.headers = CaseInsensitiveDict(dict(resp.headers))
+    response.encoding = "utf-8"
+    response._content = content  # pylint: disable=protected-access
+    return response
@@ -2,16 +2,93 @@
 
 from __future__ import annotations
 
-from nbforager import ami
+from threading import Lock
+from typing import Generic, Type, TypeVar, overload
+
+from nbforager.api.connector import Connector
+from nbforager.types import DAny, LStr
+
+ConnectorT = TypeVar("ConnectorT", bound=Connector)
+
+
+class LazyConnector(Generic[ConnectorT]):
+    """Attribute of the application connectors, the Connector is created on the first access.
+
+    The created Connector is saved in the application connectors object,
+    the next access returns it directly.
+    """
+
+    def __init__(self, connector: Type[ConnectorT]):
+        """Initialize LazyConnector.
+
+        :param connector: Connector class of the app/model.
+        """
+        self.connector: Type[ConnectorT] = connector
+        self.name: str = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Set the attribute name."""
+        self.name = name
+
+    @overload
+    def __get__(self, obj: None, owner: type) -> LazyConnector[ConnectorT]:
+        ...
+
+    @overload
+    def __get__(self, obj: BaseAC, owner: type) -> ConnectorT:
+        ...
+
+    def __get__(self, obj, owner):
+        """Create the Connector on the first access.
+
+        :return: Connector of the app/model.
+        """
+        if obj is None:
+            return self
+        # pylint: disable=protected-access
+        with obj._lock:
+            connector = obj.__dict__.get(self.name)
+            if connector is None:
+                connector = self.connector(**obj._kwargs)
+                obj.__dict__[self.name] = connector
+        return connector
 
 
 class BaseAC:
-    """Base for application connectors."""
+    """Base for application connectors.
+
+    The connectors of the models are created on the first access to the attribute,
+    so the unused models do not cost anything.
+    """
+
+    def __init__(self, **kwargs):
+        """Initialize BaseAC.
+
+        :param kwargs: Parameters of the connectors.
+        """
+        self._kwargs: DAny = kwargs
+        self._lock = Lock()
 
     def __repr__(self) -> str:
         """__repr__."""
         name = self.__class__.__name__
-        attrs = ami.attr_names(self)
-        attr = attrs[0]
-        host = getattr(self, attr).host
+        host = self._kwargs.get("host")
         return f"<{name}: {host}>"
+
+    def _models(self) -> LStr:
+        """Get the model names of the application, without creating connectors."""
+        return [s for s, o in vars(type(self)).items() if isinstance(o, LazyConnector)]
+
+    def _update(self, **kwargs) -> None:
+        """Update the parameters of the created and the future connectors.
+
+        :param kwargs: Parameters to update.
+
+        :return: None. Update self object.
+        """
+        with self._lock:
+            self._kwargs.update(kwargs)
+            connectors = [o for o in vars(self).values() if isinstance(o, Connector)]
+        for connector in connectors:
+            for key, value in kwargs.items():
+                setattr(connector, key, value)
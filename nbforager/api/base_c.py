@@ -7,9 +7,13 @@ import json
 import netports
 import requests
 from requests import Session, Response, HTTPError
+from requests.adapters import HTTPAdapter
 
-from nbforager import ami
-from nbforager.types import LDAny, DLStr, DStr, DAny, LStr
+from nbforager import ami, decoder
+from nbforager.types import LDAny, DLStr, DStr, DAny, LStr, DInt
+
+POOL_SIZE = 10
+"""Minimum count of the kept-alive connections to the Netbox (requests default)."""
 
 
 class BaseC:
@@ -53,14 +57,41 @@ class BaseC:
             for scheduled scripts in cron jobs, when the connection to Netbox server is
             not stable.
 
-        :param int sleep: Interval (seconds) before the next retry after
-            session timeout reached. Default is `10`.
+        :param int sleep: Base interval (seconds) before the next retry after
+            session timeout reached or Netbox is overloaded (429, 502, 503, 504).
+            The interval is doubled with each attempt and jittered,
+            the ``Retry-After`` header is honored. Default is `10`.
 
         :param bool strict: When querying objects by tag, if there are no tags present,
             the Netbox API response returns a status_code=400.
             True - HTTPError is raised when status_code=400.
             False - WARNING message is logged and an empty list is returned with status_code=200.
             Default is `False`.
+
+        :param float extended_get_ttl: Time to live (seconds) of the cached mapping
+            of ``{parameter}`` to ``{parameter}_id`` in extended filtering parameters.
+            ``0`` - caching is disabled. Default is `300`.
+
+        :param int extended_get_size: Maximum count of the cached values of
+            extended filtering parameters. Default is `100000`.
+
+        :param int max_in_flight: Maximum count of requests in flight to the Netbox,
+            shared by all connectors. ``0`` - unlimited. Default is `0`.
+
+        :param dict endpoint_limits: Maximum count of requests in flight per app/model path,
+            for example ``{"ipam/prefixes/": 2}``. Default is `None`.
+
+        :param bool adaptive: True - adapt the count of requests in flight and the request rate
+            to the Netbox feedback (latency, 429, 502, 503, 504) by AIMD. Default is `False`.
+
+        :param bool keyset: True - keyset pagination, request the next page by ``id__gt``
+            instead of ``offset``. Default is `False`.
+
+        :param int pool_size: Maximum count of the kept-alive connections to the Netbox.
+            ``0`` - the greatest of ``threads``, ``max_in_flight`` and ``10``. Default is `0`.
+
+        :param Session session: Session with the pool of kept-alive connections,
+            shared by all connectors of NbApi. Default is a new session.
         """
         self.host: str = _init_host(**kwargs)
         self.token: str = str(kwargs.get("token") or "")
@@ -80,9 +111,15 @@ class BaseC:
         # Settings
         self.extended_get: bool = bool(kwargs.get("extended_get"))
         self.loners: DLStr = dict(kwargs.get("loners") or {})
+        self.extended_get_ttl: float = _init_extended_get_ttl(**kwargs)
+        self.extended_get_size: int = int(kwargs.get("extended_get_size") or 100_000)
+        self.max_in_flight: int = max(int(kwargs.get("max_in_flight") or 0), 0)
+        self.endpoint_limits: DInt = dict(kwargs.get("endpoint_limits") or {})
+        self.adaptive: bool = bool(kwargs.get("adaptive"))
+        self.keyset: bool = bool(kwargs.get("keyset"))
+        self.pool_size: int = max(int(kwargs.get("pool_size") or 0), 0)
         # Session
-        self._results: LDAny = []  # cache for received objects from Netbox
-        self._session: Session = requests.session()
+        self._session: Session = _init_session(**kwargs)
 
     def __repr__(self) -> str:
         """__repr__."""
@@ -155,7 +192,7 @@ class BaseC:
 
         # json
         try:
-            response_d: DAny = response.json()
+            response_d: DAny = decoder.loads(response.content)
         except Exception as ex:
             raise HTTPError(f"{status_code} Response is not JSON for {url=}") from ex
 
@@ -206,6 +243,27 @@ class BaseC:
 # ============================= helpers ==============================
 
 
+def mount_adapter(session: Session, pool_size: int) -> None:
+    """Mount HTTP adapter with the pool of kept-alive connections to the session.
+
+    :param session: Session to update.
+    :param pool_size: Maximum count of the kept-alive connections to the host.
+
+    :return: None. Update session object.
+    """
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=max(pool_size, 1))
+    for prefix in ["https://", "http://"]:
+        session.mount(prefix, adapter)
+
+
+def _init_extended_get_ttl(**kwargs) -> float:
+    """Initialize time to live of extended_get cache, default 300."""
+    ttl = kwargs.get("extended_get_ttl")
+    if ttl is None:
+        return 300.0
+    return max(float(ttl), 0.0)
+
+
 def _init_host(**kwargs) -> str:
     """Initialize Netbox host name."""
     host = str(kwargs.get("host") or "")
@@ -236,6 +294,23 @@ def _init_scheme(**kwargs) -> str:
     return scheme
 
 
+def _init_pool_size(**kwargs) -> int:
+    """Initialize count of the kept-alive connections, default is enough for all threads."""
+    if pool_size := int(kwargs.get("pool_size") or 0):
+        return max(pool_size, 1)
+    max_in_flight = int(kwargs.get("max_in_flight") or 0)
+    return max(_init_threads(**kwargs), max_in_flight, POOL_SIZE)
+
+
+def _init_session(**kwargs) -> Session:
+    """Initialize session with the pool of kept-alive connections."""
+    if session := kwargs.get("session"):
+        return session
+    session = requests.session()
+    mount_adapter(session, _init_pool_size(**kwargs))
+    return session
+
+
 def _init_threads(**kwargs) -> int:
     """Initialize threads count, default 1."""
     threads = int(kwargs.get("threads") or 1)
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import logging
+import math
 import time
 import urllib
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from operator import itemgetter
-from queue import Queue
-from threading import Thread
-from typing import Callable
+from typing import Any, Callable, Deque, List, Optional, Set, Tuple, Union
 from urllib.parse import ParseResult
 
 from requests import Response
@@ -16,11 +17,13 @@ from requests.exceptions import ReadTimeout, ConnectionError as RequestsConnecti
 from vhelpers import vlist, vparam
 
 from nbforager import helpers, ami
-from nbforager.api import extended_get
+from nbforager.api import extended_get, scheduler
 from nbforager.api.base_c import BaseC
-from nbforager.api.extended_get import ParamPath, DParamPath
+from nbforager.api.extended_get import ParamPath, DParamPath, ParamCache
+from nbforager.api.scheduler import Scheduler, RETRY_STATUSES
+from nbforager.api.worker_pool import WorkerPool
 from nbforager.exceptions import NbApiError
-from nbforager.types import DAny, LDAny, LStr, DLInt, DList, LDList, DLStr
+from nbforager.types import DAny, LDAny, LStr, DLInt, DList, LDList, DLStr, LInt, GLDAny, SInt
 from nbforager.types import TLists, OUParam, LParam
 
 LONERS: DLStr = {
@@ -65,6 +68,13 @@ class BaseMC(BaseC):
         "max_retries",
         "sleep",
         "loners",
+        "extended_get_ttl",
+        "extended_get_size",
+        "max_in_flight",
+        "endpoint_limits",
+        "adaptive",
+        "keyset",
+        "pool_size",
     ]
     _extra_keys: DLStr = {
         "ipam/": [
@@ -118,9 +128,21 @@ class BaseMC(BaseC):
             ``{parameter}`` can be used instead of ``{parameter}_id``. Default is `True`.
 
         :param dict loners: Set :ref:`Filtering parameters in an OR manner`.
+
+        :param ParamCache param_cache: Cache of extended filtering parameters,
+            shared by all connectors of NbApi.
+
+        :param Scheduler scheduler: Scheduler of requests in flight,
+            shared by all connectors of NbApi.
+
+        :param WorkerPool pool: Pool of worker threads for threading mode,
+            shared by all connectors of NbApi.
         """
         super().__init__(**kwargs)
         self._loners: LStr = self._init_loners()
+        self.param_cache: ParamCache = self._init_param_cache(**kwargs)
+        self.scheduler: Scheduler = self._init_scheduler(**kwargs)
+        self.pool: WorkerPool = self._init_pool(**kwargs)
 
     # ============================= property =============================
 
@@ -153,6 +175,34 @@ class BaseMC(BaseC):
         params_d = vparam.to_dict(params)
         return self._query_loop(path, params_d)
 
+    def _query_param_path(self, param_path: ParamPath, values: list) -> LDAny:
+        """Retrieve objects from the Netbox to map {name} to {name}_id.
+
+        Request only the objects with the interested values in brief mode,
+        the values are sliced if the URL length exceeds the maximum.
+        If the key cannot be filtered on the Netbox side, request all objects of the model.
+
+        :param param_path: ParamPath object, path and key of the mapped objects.
+        :param values: Values of the key that need to be mapped.
+
+        :return: A list of the Netbox objects.
+        """
+        path = param_path.path
+        if not param_path.filtered:
+            return self._query(path)
+
+        params_ld: LDList = helpers.slice_params_ld(
+            url=f"{self.url_api}{path}",
+            max_len=self.url_length,
+            keys=[param_path.key],
+            params_ld=[{param_path.key: list(values), "brief": [1], "limit": [self.limit]}],
+        )
+        results: LDAny = []
+        for params_d in params_ld:
+            results_: LDAny = self._query_loop(path, params_d)
+            results.extend(results_)
+        return results
+
     def _query_params_ld(self, params_ld: LDList) -> LDAny:
         """Retrieve data from the Netbox.
 
@@ -160,7 +210,7 @@ class BaseMC(BaseC):
 
         :return: A list of the Netbox objects.
         """
-        self._results.clear()
+        results: LDAny = []
 
         # slice params
         params_ld = helpers.slice_params_ld(
@@ -172,30 +222,58 @@ class BaseMC(BaseC):
 
         # threads
         if self.threads > 1:
-            counts_w_params: LDAny = self._query_pages_count(params_ld)
-            params_ld_: LDAny = self._slice_params_counters(counts_w_params)
-            if not params_ld_:
-                params_ld_ = [{}]
-            self._query_threads(method=self._query_data_thread, params_ld=params_ld_)
+            for results_ in self._iter_threads(params_ld=params_ld, ordered=False):
+                results.extend(results_)
         # loop
         else:
             for params_d in params_ld:
-                results_: LDAny = self._query_loop(self.path, params_d)
-                self._results.extend(results_)
+                results.extend(self._query_loop(self.path, params_d))
 
         # save
-        results: LDAny = sorted(self._results, key=itemgetter("id"))
+        results = sorted(results, key=itemgetter("id"))
         results = vlist.no_dupl(results)
-        self._results.clear()
+        helpers.pop_excluded_keys(results, params_ld)
         return results
 
-    def _query_count(self, path: str, params_d: DAny) -> None:
-        """Retrieve counters of interested objects from the Netbox.
+    def _iter_params_ld(self, params_ld: LDList, ordered: bool = True) -> GLDAny:
+        """Retrieve data from the Netbox page by page.
+
+        Pages are yielded as soon as they are received, objects are not sorted.
+        Duplicates are removed only if the parameters are split into multiple requests.
+
+        :param params_ld: Parameters to request from the Netbox.
+        :param ordered: Threading mode only. True - yield pages in the order of offsets,
+            False - yield pages as they are completed.
+
+        :return: Generator of pages, each page is a list of Netbox objects.
+        """
+        params_ld = helpers.slice_params_ld(
+            url=self.url,
+            max_len=self.url_length,
+            keys=self._slices,
+            params_ld=params_ld,
+        )
+        if self.threads > 1:
+            pages: GLDAny = self._iter_threads(params_ld=params_ld, ordered=ordered)
+        else:
+            pages = (p for d in params_ld for p in self._iter_loop(self.path, d))
+
+        is_dupl: bool = len(params_ld) > 1
+        ids: SInt = set()
+        for results in pages:
+            if is_dupl:
+                results = [d for d in results if d["id"] not in ids]
+                ids.update(d["id"] for d in results)
+            helpers.pop_excluded_keys(results, params_ld)
+            yield results
+
+    def _get_count(self, path: str, params_d: DAny) -> int:
+        """Retrieve the count of interested objects from the Netbox.
 
         :param path: Section of the URL that points to the model.
         :param params_d: Parameters to request from the Netbox.
 
-        :return: None. Update self object.
+        :return: Count of objects.
 
         :raises HTTPError: Response status is not 2xx.
         :raises ConnectionError: Connection issue occurs or the limit of retries is reached.
@@ -211,9 +289,7 @@ class BaseMC(BaseC):
         if response.ok:
             data: DAny = helpers.decode_response_d(response)
             count = int(data["count"])
-
-        result = {"count": count, "params_d": params_d}
-        self._results.append(result)
+        return count
 
     def _query_loop(self, path: str, params_d: DList) -> LDAny:
         """Retrieve data from Netbox in loop mode.
@@ -224,20 +300,37 @@ class BaseMC(BaseC):
         :param path: Section of the URL that points to the model.
         :param params_d: Parameters to request from the Netbox.
 
-        :return: Netbox objects. Update self _results.
+        :return: Netbox objects.
 
         :raises HTTPError: Response status is not 2xx.
         :raises ConnectionError: Connection issue occurs or the limit of retries is reached.
         """
-        is_brief: bool = "brief" in params_d
+        results: LDAny = []
+        for results_ in self._iter_loop(path, params_d):
+            results.extend(results_)
+        return results
+
+    def _iter_loop(self, path: str, params_d: DList) -> GLDAny:
+        """Retrieve data from Netbox in loop mode, page by page.
+
+        :param path: Section of the URL that points to the model.
+        :param params_d: Parameters to request from the Netbox.
+
+        :return: Generator of pages, each page is a list of Netbox objects.
+
+        :raises HTTPError: Response status is not 2xx.
+        :raises ConnectionError: Connection issue occurs or the limit of retries is reached.
+        """
+        if self._is_keyset(params_d):
+            yield from self._iter_keyset(path, params_d)
+            return
+
         is_offset: bool = "offset" in params_d
 
-        if not is_brief:
-            params_d = self._add_default_limit_offset(params_d)
+        params_d = self._add_default_limit_offset(params_d)
         params_l: LParam = vparam.from_dict(params_d)
         url = f"{self.url_api}{path}?{urllib.parse.urlencode(params_l)}"
 
-        results: LDAny = []
         while True:
             response: Response = self._retry_requests(url)
 
@@ -246,8 +339,7 @@ class BaseMC(BaseC):
                 break
 
             data: DAny = helpers.decode_response_d(response)
-            results_: LDAny = list(data["results"])
-            results.extend(results_)
+            yield list(data["results"])
 
             # retrieve next offset from Response
             if is_offset:
@@ -261,93 +353,211 @@ class BaseMC(BaseC):
             if self.interval:
                 time.sleep(self.interval)
 
-        return results
+    def _iter_keyset(self, path: str, params_d: DList) -> GLDAny:
+        """Retrieve data from Netbox in loop mode using keyset pagination, page by page.
+
+        Objects are ordered by ID, the next page is requested with ``id__gt`` equal to
+        the last received ID, instead of ``offset``. So the latency of the deep pages
+        does not depend on the page number.
 
-    def _query_data_thread(self, path: str, params_d: DAny) -> None:
-        """Retrieve data from the Netbox and appends results to the internal results list.
+        :param path: Section of the URL that points to the model.
+        :param params_d: Parameters to request from the Netbox, without offset and ordering.
+
+        :return: Generator of pages, each page is a list of Netbox objects.
 
-        If the params_d does not have `offset` and the received Response contains "next" URL,
-            the method will recurse to fetch the next set of data.
+        :raises HTTPError: Response status is not 2xx.
+        :raises ConnectionError: Connection issue occurs or the limit of retries is reached.
+        """
+        params_d = params_d.copy()
+        limit: int = max(_to_ints(params_d.get("limit")) or [self.limit])
+        last_id: int = max(_to_ints(params_d.get("id__gt")) or [0])
+        params_d["limit"] = [limit]
+        params_d["ordering"] = ["id"]
+
+        while True:
+            params_d["id__gt"] = [last_id]
+            params_l: LParam = vparam.from_dict(params_d)
+            url = f"{self.url_api}{path}?{urllib.parse.urlencode(params_l)}"
+            response: Response = self._retry_requests(url)
+
+            # no data if strict is False and status 400
+            if not response.ok:
+                break
+
+            data: DAny = helpers.decode_response_d(response)
+            results: LDAny = list(data["results"])
+            if not results:
+                break
+            yield results
+            # page size can be limited by MAX_PAGE_SIZE on the Netbox side
+            if not data.get("next"):
+                break
+            last_id = int(results[-1]["id"])
+
+            # Sleep before the next iteration to reduce server load
+            if self.interval:
+                time.sleep(self.interval)
+
+    def _keyset_ranges(self, path: str, params_d: DList) -> LDList:
+        """Split the ID space of interested objects into ranges for keyset pagination.
+
+        Request the count and the minimum ID (ordering=id), the maximum ID (ordering=-id),
+        and split the IDs into ranges with ``limit`` objects on average, by ``id__gte``
+        and ``id__lte``. Each range can be requested in a separate thread.
 
         :param path: Section of the URL that points to the model.
         :param params_d: Parameters to request from the Netbox.
 
-        :return: Netbox objects. Update self _results.
+        :return: Parameters with ID ranges. The parameters without changes
+            if keyset pagination cannot be used.
+        """
+        if not self._is_keyset(params_d):
+            return [params_d]
+
+        params_d = {k: v for k, v in params_d.items() if k != "limit"}
+        count, min_id = self._get_count_id(path, {**params_d, "ordering": ["id"]})
+        if not count:
+            return []
+        _, max_id = self._get_count_id(path, {**params_d, "ordering": ["-id"]})
+        min_id = max([min_id, *[i + 1 for i in _to_ints(params_d.get("id__gt"))]])
+
+        ranges_count: int = max(math.ceil(count / self.limit), 1)
+        size: int = max(math.ceil((max_id - min_id + 1) / ranges_count), 1)
+        params_ld: LDList = []
+        for start in range(min_id, max_id + 1, size):
+            params_d_: DList = params_d.copy()
+            params_d_["id__gte"] = [start]
+            params_d_["id__lte"] = [min(start + size - 1, max_id)]
+            params_ld.append(params_d_)
+        return params_ld
+
+    def _get_count_id(self, path: str, params_d: DList) -> Tuple[int, int]:
+        """Retrieve the count of interested objects and the ID of the first object.
+
+        :param path: Section of the URL that points to the model.
+        :param params_d: Parameters to request from the Netbox, with ordering.
+
+        :return: Count of objects and ID of the first object.
 
         :raises HTTPError: Response status is not 2xx.
         :raises ConnectionError: Connection issue occurs or the limit of retries is reached.
         """
-        params_d = self._add_default_limit_offset(params_d)
-        params_l: LParam = vparam.from_dict(params_d)
+        params_d_ = {**params_d, "brief": [1], "limit": [1]}
+        params_l: LParam = vparam.from_dict(params_d_)
         url = f"{self.url_api}{path}?{urllib.parse.urlencode(params_l)}"
-
         response: Response = self._retry_requests(url)
-
-        # no data if strict is False and status 400
         if not response.ok:
-            return
-
+            return 0, 0
         data: DAny = helpers.decode_response_d(response)
-        results_: LDAny = list(data["results"])
-        self._results.extend(results_)
+        results: LDAny = list(data["results"])
+        if not results:
+            return 0, 0
+        return int(data["count"]), int(results[0]["id"])
 
-        # threading mode manage offset in top level method
-        if "offset" in params_d:
-            return
+    def _iter_threads(self, params_ld: LDList, ordered: bool = True) -> GLDAny:
+        """Retrieve data from Netbox in threaded mode, page by page.
 
-        # retrieve next offset from Response
-        if url_next := str(data.get("next") or ""):
-            url_o: ParseResult = urllib.parse.urlparse(url_next)
-            params_d_: DAny = urllib.parse.parse_qs(url_o.query)
-            results_ = self._query_loop(path=path, params_d=params_d_)
-            self._results.extend(results_)
-
-    def _query_pages_count(self, params_ld: LDList) -> LDAny:
-        """Retrieve counters of interested objects from Netbox in threaded mode.
+        Request the first page of each parameters, read the count of objects from it,
+        then request the remaining pages by offsets. No count-only requests are needed.
+        In keyset pagination mode, request the ID ranges instead of offsets.
+        Only ``threads * 2`` pages are requested in advance, so the memory usage
+        does not depend on the count of objects. The requests are executed
+        by the worker threads of the ``pool``, shared by all connectors.
 
         :param params_ld: Parameters to request from the Netbox.
+        :param ordered: True - yield pages in the order of offsets,
+            False - yield pages as they are completed.
 
-        :return: List of dict with counters and parameters of interested objects.
+        :return: Generator of pages, each page is a list of Netbox objects.
         """
-        self._results.clear()
-        self._query_threads(method=self._query_count, params_ld=params_ld)
-        results: LDAny = self._results
-        self._results.clear()
-        return results
+        # tasks are parameters of the pages or futures of the received first pages
+        tasks: List[Union[DAny, Future]] = []
+        if self.keyset:
+            method: Callable = self._query_loop
+            tasks.extend(d_ for d in params_ld for d_ in self._keyset_ranges(self.path, d))
+        else:
+            method = self._query_page
+            paths: LStr = [self.path] * len(params_ld)
+            for params_d, data in zip(
+                    params_ld, self.pool.map(self._query_page_d, paths, params_ld)
+            ):
+                first: Future = Future()
+                first.set_result(list(data.get("results") or []))
+                tasks.append(first)
+                tasks.extend(self._next_offsets(params_d, data))
+
+        futures: Set[Future] = set()
+        queue: Deque[Future] = deque()
+        try:
+            for task in tasks:
+                if isinstance(task, Future):
+                    future: Future = task
+                else:
+                    if self.interval:
+                        time.sleep(self.interval)
+                    future = self.pool.submit(method, self.path, task)
+                futures.add(future)
+                queue.append(future)
+                if len(futures) >= self.threads * 2:
+                    yield from _pop_futures(futures, queue, ordered)
+            while futures:
+                yield from _pop_futures(futures, queue, ordered)
+        finally:
+            # the generator is closed before the end, the pool is shared, cancel pending pages
+            for future in futures:
+                future.cancel()
+
+    def _query_page(self, path: str, params_d: DAny) -> LDAny:
+        """Retrieve one page of objects from the Netbox, params_d with limit and offset.
 
-    def _query_threads(self, method: Callable, params_ld: LDAny) -> None:
-        """Retrieve data from Netbox in threaded mode.
+        :param path: Section of the URL that points to the model.
+        :param params_d: Parameters to request from the Netbox.
 
-        :param method: Method that need call with parameters.
-        :param params_ld: Parameters to request from the Netbox.
+        :return: Netbox objects.
 
-        :return: None. Save results to self._results.
+        :raises HTTPError: Response status is not 2xx.
+        :raises ConnectionError: Connection issue occurs or the limit of retries is reached.
         """
-        queue: Queue = Queue()
-        for params_d in params_ld:
-            queue.put((method, params_d))
+        data: DAny = self._query_page_d(path, params_d)
+        return list(data.get("results") or [])
 
-        for idx in range(self.threads):
-            if self.interval:
-                time.sleep(self.interval)
-            thread = Thread(name=f"Thread-{idx}", target=self._run_queue, args=(queue,))
-            thread.start()
-        queue.join()
+    def _query_page_d(self, path: str, params_d: DAny) -> DAny:
+        """Retrieve one page from the Netbox, params_d with limit and offset.
+
+        :param path: Section of the URL that points to the model.
+        :param params_d: Parameters to request from the Netbox.
 
-    def _run_queue(self, queue: Queue) -> None:
-        """Process tasks from the queue.
+        :return: Page data with count and results, empty if strict is False and status 400.
 
-        This method dequeues and executes tasks until the queue is empty.
-        Each task is expected to be a callable method with its corresponding params_d parameters.
+        :raises HTTPError: Response status is not 2xx.
+        :raises ConnectionError: Connection issue occurs or the limit of retries is reached.
+        """
+        params_d = self._add_default_limit_offset(params_d)
+        params_l: LParam = vparam.from_dict(params_d)
+        url = f"{self.url_api}{path}?{urllib.parse.urlencode(params_l)}"
+        response: Response = self._retry_requests(url)
 
-        :param queue: A queue containing (method, params_d) pairs to be executed.
+        # no data if strict is False and status 400
+        if not response.ok:
+            return {}
+        return helpers.decode_response_d(response)
+
+    def _next_offsets(self, params_d: DList, data: DAny) -> LDAny:
+        """Generate parameters of the remaining pages based on the count in the first page.
 
-        :return: None. Update self _results list.
+        :param params_d: Parameters of the first page.
+        :param data: First page data with count.
+
+        :return: Parameters with offsets of the remaining pages,
+            empty if the offset is set in the parameters.
         """
-        while not queue.empty():
-            method, params_d = queue.get()
-            method(self.path, params_d)
-            queue.task_done()
+        if "offset" in params_d:
+            return []
+        count = int(data.get("count") or 0)
+        limit: int = max(_to_ints(params_d.get("limit")) or [self.limit])
+        if count <= limit:
+            return []
+        return helpers.generate_offsets(count, limit, params_d)[1:]
 
     # ============================= helpers ==============================
 
@@ -393,13 +603,19 @@ class BaseMC(BaseC):
 
         This method repeatedly attempts to fetch the given URL.
         It is designed to handle temporary network or server issues (such as
-        timeouts or Netbox overloads) by retrying the request after a `sleep` interval.
+        timeouts or Netbox overloads) by retrying the request after a jittered exponential
+        backoff based on `sleep` interval, or after the `Retry-After` header value.
+        Each attempt waits for the free slot in the ``scheduler``, so the count of
+        requests in flight is limited by ``max_in_flight`` and ``endpoint_limits``.
+        The response status and latency are reported to the ``scheduler``
+        to adapt concurrency and request rate (if ``adaptive`` is True).
 
         The method will:
           - Return the response if the status code indicates success (2xx).
           - Raise a `ConnectionError` if a connection failure occurs.
           - Return response with empty data if status code is 400 and `strict` is False.
-          - Retry the request up to `max_retries` times if a ReadTimeout occurs.
+          - Retry the request up to `max_retries` times if a ReadTimeout occurs
+            or the status code is 429, 502, 503, 504.
 
         :param url: The URL to send the GET request to.
 
@@ -410,23 +626,26 @@ class BaseMC(BaseC):
         :raises ConnectionError: Connection issue occurs or the limit of retries is reached.
         """
         max_retries = self.max_retries + 1
-        sleep = self.sleep
         counter = 0
 
         while counter < max_retries:
             counter += 1
             try:
-                response: Response = self._session.get(
-                    url=url,
-                    headers=self._headers(),
-                    verify=self.verify,
-                    timeout=float(self.timeout),
-                )
+                with self.scheduler.slot(url):
+                    start = time.monotonic()
+                    response: Response = self._session.get(
+                        url=url,
+                        headers=self._headers(),
+                        verify=self.verify,
+                        timeout=float(self.timeout),
+                    )
             except ReadTimeout:
+                self.scheduler.feedback(status_code=504, latency=float(self.timeout))
                 attempts = f"{counter} of {self.max_retries}"
                 msg = f"Session timeout={self.timeout!r}sec reached, {attempts=}."
                 logging.warning(msg)
                 if counter < max_retries:
+                    sleep = round(self.scheduler.backoff(counter, self.sleep), 3)
                     msg = f"Next attempt after {sleep=} sec."
                     logging.warning(msg)
                     time.sleep(sleep)
@@ -434,6 +653,17 @@ class BaseMC(BaseC):
             except RequestsConnectionError as ex:
                 raise ConnectionError(f"Netbox connection error: {ex}") from ex
 
+            retry_after: float = scheduler.retry_after(response)
+            latency = time.monotonic() - start
+            self.scheduler.feedback(response.status_code, latency, retry_after)
+            if response.status_code in RETRY_STATUSES and counter < max_retries:
+                sleep = round(self.scheduler.backoff(counter, self.sleep, retry_after), 3)
+                msg = f"Netbox overloaded, status_code={response.status_code}, "
+                msg += f"next attempt after {sleep=} sec."
+                logging.warning(msg)
+                time.sleep(sleep)
+                continue
+
             if not response.ok:
                 helpers.raise_for_status(response, strict=self.strict)
 
@@ -468,6 +698,7 @@ class BaseMC(BaseC):
         params_d: DList = _lists_wo_dupl(kwargs)
         params_d = self._change_params_name_to_id(params_d)
         params_d = self._change_params_exceptions(params_d)
+        params_d = helpers.change_params_projection(params_d)
         params_ld: LDList = helpers.make_combinations(self._loners, params_d)
         params_ld = helpers.change_params_or(params_ld)
         return params_ld
@@ -489,26 +720,16 @@ class BaseMC(BaseC):
                     if keys := set(extra_keys).intersection(data):
                         raise NbApiError(f"NbForager extra {keys=} detected in {self.url}.")
 
-    def _slice_params_counters(self, results: LDAny) -> LDAny:
-        """Generate sliced parameters based on counts in results.
-
-        To request data in threading mode need have all params with offsets.
-        :param results: List of dicts with params_d and related counts of objects.
-        :return: Sliced parameters.
-        """
-        params_ld: LDAny = []
-
-        for result in results:
-            count = result["count"]
-            params_d = result["params_d"]
-            if not result["count"]:
-                continue
-            params_: LDAny = helpers.generate_offsets(count, self.limit, params_d)
-            params_ld.extend(params_)
+    # =========================== helpers ===========================
 
-        return params_ld
+    def _is_keyset(self, params_d: DList) -> bool:
+        """Check if keyset pagination is enabled and can be used for the parameters.
 
-    # =========================== helpers ===========================
+        Keyset pagination cannot be used if the parameters have offset or ordering.
+        """
+        if not self.keyset:
+            return False
+        return not {"offset", "ordering"}.intersection(params_d)
 
     def _init_loners(self) -> LStr:
         """Initialize loners filtering parameters."""
@@ -519,10 +740,36 @@ class BaseMC(BaseC):
                 loners.extend(list(loners_))
         return loners
 
+    def _init_param_cache(self, **kwargs) -> ParamCache:
+        """Initialize cache of extended filtering parameters."""
+        if param_cache := kwargs.get("param_cache"):
+            return param_cache
+        return ParamCache(ttl=self.extended_get_ttl, size=self.extended_get_size)
+
+    def _init_scheduler(self, **kwargs) -> Scheduler:
+        """Initialize scheduler of requests in flight."""
+        if scheduler := kwargs.get("scheduler"):
+            return scheduler
+        return Scheduler(
+            max_in_flight=self.max_in_flight,
+            endpoint_limits=self.endpoint_limits,
+            adaptive=self.adaptive,
+            latency_limit=self.timeout / 2,
+        )
+
+    def _init_pool(self, **kwargs) -> WorkerPool:
+        """Initialize pool of worker threads."""
+        if pool := kwargs.get("pool"):
+            return pool
+        return WorkerPool(threads=self.threads)
+
     def _change_params_name_to_id(self, params_d: DList) -> DList:
         """Change parameter with name to parameter with id.
 
-        Request all related objects from the Netbox, find the name, and replace it with the ID.
+        Request related objects with the interested names from the Netbox (all objects
+        if the key cannot be filtered on the Netbox side), find the name, and replace it
+        with the ID. The mapping of names to IDs is cached in the ``param_cache``
+        during ``extended_get_ttl``.
 
         Described in: nb_api.rst Extended filtering parameters
 
@@ -541,9 +788,13 @@ class BaseMC(BaseC):
                 path = param_path.path
                 key = param_path.key
 
-                response: LDAny = self._query(path)
+                ids: Optional[LInt] = self.param_cache.get(path, key, values)
+                if ids is None:
+                    response: LDAny = self._query_param_path(param_path, values)
+                    self.param_cache.update(path, key, response, values=values)
+                    ids = [d["id"] for d in response if d.get(key) in values]
 
-                if ids := [d["id"] for d in response if d[key] in values]:
+                if ids:
                     need_delete.extend([name, f"or_{name}"])
                     name_id = f"{name}_id"
                     need_add.setdefault(name_id, []).extend(ids)
@@ -577,6 +828,38 @@ class BaseMC(BaseC):
 # ============================= helpers ==========================
 
 
+def _pop_futures(futures: Set[Future], queue: Deque[Future], ordered: bool) -> GLDAny:
+    """Wait for the completed futures and yield their results.
+
+    :param futures: Pending futures, completed futures are removed.
+    :param queue: Pending futures in the order of submission, completed futures are removed.
+    :param ordered: True - yield the first submitted future,
+        False - yield all completed futures.
+
+    :return: Generator of pages, each page is a list of Netbox objects.
+    """
+    if ordered:
+        future: Future = queue.popleft()
+        futures.discard(future)
+        yield future.result()
+        return
+
+    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+    for future in done:
+        futures.discard(future)
+        queue.remove(future)
+        yield future.result()
+
+
+def _to_ints(value: Any) -> LInt:
+    """Convert a single value or a list of values to a list of integers."""
+    if value is None:
+        return []
+    if not isinstance(value, TLists):
+        value = [value]
+    return [int(i) for i in value]
+
+
 def _lists_wo_dupl(kwargs: DAny) -> DList:
     """Convert single values to list and remove duplicate values from params.
 
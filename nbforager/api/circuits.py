@@ -1,26 +1,12 @@
 """Circuits connectors."""
 
-from nbforager.api.base_ac import BaseAC
+from nbforager.api.base_ac import BaseAC, LazyConnector
 from nbforager.api.connector import Connector
 
 
 class CircuitsAC(BaseAC):
     """Circuits connectors."""
 
-    def __init__(self, **kwargs):
-        """Initialize CircuitsAC."""
-        self.circuit_group_assignments = self.CircuitGroupAssignmentsC(**kwargs)
-        self.circuit_groups = self.CircuitGroupsC(**kwargs)
-        self.circuit_terminations = self.CircuitTerminationsC(**kwargs)
-        self.circuit_types = self.CircuitTypesC(**kwargs)
-        self.circuits = self.CircuitsC(**kwargs)
-        self.provider_accounts = self.ProviderAccountsC(**kwargs)
-        self.provider_networks = self.ProviderNetworksC(**kwargs)
-        self.providers = self.ProvidersC(**kwargs)
-        self.virtual_circuit_terminations = self.VirtualCircuitTerminationsC(**kwargs)
-        self.virtual_circuit_types = self.VirtualCircuitTypesC(**kwargs)
-        self.virtual_circuits = self.VirtualCircuitsC(**kwargs)
-
     class CircuitGroupAssignmentsC(Connector):
         """CircuitTerminationsC, v4.1."""
 
@@ -75,3 +61,16 @@ class CircuitsAC(BaseAC):
         """VirtualCircuitsC, v4.2."""
 
         path = "circuits/virtual-circuits/"
+
+    # app/model connectors, created on the first access
+    circuit_group_assignments = LazyConnector(CircuitGroupAssignmentsC)
+    circuit_groups = LazyConnector(CircuitGroupsC)
+    circuit_terminations = LazyConnector(CircuitTerminationsC)
+    circuit_types = LazyConnector(CircuitTypesC)
+    circuits = LazyConnector(CircuitsC)
+    provider_accounts = LazyConnector(ProviderAccountsC)
+    provider_networks = LazyConnector(ProviderNetworksC)
+    providers = LazyConnector(ProvidersC)
+    virtual_circuit_terminations = LazyConnector(VirtualCircuitTerminationsC)
+    virtual_circuit_types = LazyConnector(VirtualCircuitTypesC)
+    virtual_circuits = LazyConnector(VirtualCircuitsC)
@@ -9,7 +9,7 @@ from requests import Response
 
 from nbforager import helpers
 from nbforager.api.base_mc import BaseMC
-from nbforager.types import DAny, LDAny, LDList
+from nbforager.types import DAny, LDAny, LDList, GDAny, GLDAny
 
 
 class Connector(BaseMC):
@@ -32,13 +32,14 @@ class Connector(BaseMC):
             - <Response [400]> Object already exists.
         :rtype: Response
         """
-        response: Response = self._session.post(
-            url=self.url,
-            data=json.dumps(kwargs),
-            headers=self._headers(),
-            verify=self.verify,
-            timeout=self.timeout,
-        )
+        with self.scheduler.slot(self.url):
+            response: Response = self._session.post(
+                url=self.url,
+                data=json.dumps(kwargs),
+                headers=self._headers(),
+                verify=self.verify,
+                timeout=self.timeout,
+            )
         return response
 
     def create_d(self, **kwargs) -> DAny:
@@ -69,12 +70,13 @@ class Connector(BaseMC):
         """
         if not id:
             raise ValueError("id is required.")
-        response: Response = self._session.delete(
-            url=f"{self.url}{id}",
-            headers=self._headers(),
-            verify=self.verify,
-            timeout=self.timeout,
-        )
+        with self.scheduler.slot(self.url):
+            response: Response = self._session.delete(
+                url=f"{self.url}{id}",
+                headers=self._headers(),
+                verify=self.verify,
+                timeout=self.timeout,
+            )
         return response
 
     # noinspection PyIncorrectDocstring
@@ -103,6 +105,14 @@ class Connector(BaseMC):
             Netbox REST API `Schema ip_addresses`_.
         :type or_{parameter}: list
 
+        :param fields: Request only these keys of the objects (Netbox >= 4.0),
+            ``id`` and ``url`` are always requested.
+        :type fields: list
+
+        :param exclude: Remove these keys from the objects, ``config_context``
+            is excluded on the Netbox side.
+        :type exclude: list
+
         :param kwargs: Netbox REST API `Schema ip_addresses`_.
 
         :return: List of dictionaries containing Netbox objects.
@@ -121,14 +131,12 @@ class Connector(BaseMC):
         :return: Count of Netbox objects based on the provided parameters.
         :raises ValueError: If count for loners parameters is not supported.
         """
-        kwargs = {k: v for k, v in kwargs.items() if k not in ["brief", "limit", "offset"]}
+        skip = ["brief", "limit", "offset", "fields", "exclude"]
+        kwargs = {k: v for k, v in kwargs.items() if k not in skip}
         params_ld: LDList = self._validate_params(**kwargs)
         if len(params_ld) > 1:
             raise ValueError("Count for loners parameters is not supported.")
-        self._query_count(self.path, kwargs)
-        data: DAny = self._results[0]
-        self._results.clear()
-        return int(data["count"])
+        return self._get_count(self.path, kwargs)
 
     def graphql(self, fields: str, filters: str = "") -> LDAny:
         """Request data from Netbox GraphQL API.
@@ -144,6 +152,45 @@ class Connector(BaseMC):
         """
         return self._graphql(path=self.path, fields=fields, filters=filters)
 
+    # noinspection PyIncorrectDocstring
+    def iter_objects(self, ordered: bool = True, **kwargs) -> GDAny:
+        """Request data from Netbox and yield objects as each page arrives.
+
+        The filtering parameters are identical to those in ``get()``.
+        Unlike ``get()``, the objects are not collected in memory and not sorted by ID,
+        that is useful to process a large amount of data with flat memory usage.
+
+        :param ordered: Threading mode only. True - yield pages in the order of offsets,
+            False - yield pages as they are completed. Default is `True`.
+
+        :param kwargs: Netbox REST API `Schema ip_addresses`_.
+
+        :return: Generator of dictionaries containing Netbox objects.
+        :rtype: Generator[dict]
+        """
+        for items in self.iter_pages(ordered=ordered, **kwargs):
+            yield from items
+
+    # noinspection PyIncorrectDocstring
+    def iter_pages(self, ordered: bool = True, **kwargs) -> GLDAny:
+        """Request data from Netbox and yield pages as they arrive.
+
+        The filtering parameters are identical to those in ``get()``.
+        Each page contains up to ``limit`` objects.
+
+        :param ordered: Threading mode only. True - yield pages in the order of offsets,
+            False - yield pages as they are completed. Default is `True`.
+
+        :param kwargs: Netbox REST API `Schema ip_addresses`_.
+
+        :return: Generator of lists of dictionaries containing Netbox objects.
+        :rtype: Generator[List[dict]]
+        """
+        params_ld: LDList = self._validate_params(**kwargs)
+        for items in self._iter_params_ld(params_ld, ordered=ordered):
+            self._check_extra_keys(items=items)
+            yield items
+
     # noinspection PyIncorrectDocstring
     def update(self, **kwargs) -> Response:
         """Update an object in Netbox.
@@ -163,13 +210,14 @@ class Connector(BaseMC):
         if not id_:
             raise ValueError("id is required in the data.")
 
-        response: Response = self._session.patch(
-            url=f"{self.url}{id_}/",
-            data=json.dumps(kwargs),
-            headers=self._headers(),
-            verify=self.verify,
-            timeout=self.timeout,
-        )
+        with self.scheduler.slot(self.url):
+            response: Response = self._session.patch(
+                url=f"{self.url}{id_}/",
+                data=json.dumps(kwargs),
+                headers=self._headers(),
+                verify=self.verify,
+                timeout=self.timeout,
+            )
         return response
 
     # noinspection PyIncorrectDocstring
@@ -1,21 +1,12 @@
 """Core connectors."""
 
+from nbforager.api.base_ac import BaseAC, LazyConnector
 from nbforager.api.connector import Connector
 
 
-class CoreAC:
+class CoreAC(BaseAC):
     """Core connectors."""
 
-    def __init__(self, **kwargs):
-        """Initialize CoreAC."""
-        self.background_queues = self.BackgroundQueuesC(**kwargs)
-        self.background_tasks = self.BackgroundTasksC(**kwargs)
-        self.background_workers = self.BackgroundWorkersC(**kwargs)
-        self.data_files = self.DataFilesC(**kwargs)
-        self.data_sources = self.DataSourcesC(**kwargs)
-        self.jobs = self.JobsC(**kwargs)
-        self.object_changes = self.ObjectChangesC(**kwargs)
-
     class BackgroundQueuesC(Connector):
         """BackgroundQueuesC, v4.2."""
 
@@ -50,3 +41,12 @@ class CoreAC:
         """ObjectChangesC, v4.1."""
 
         path = "core/object-changes/"
+
+    # app/model connectors, created on the first access
+    background_queues = LazyConnector(BackgroundQueuesC)
+    background_tasks = LazyConnector(BackgroundTasksC)
+    background_workers = LazyConnector(BackgroundWorkersC)
+    data_files = LazyConnector(DataFilesC)
+    data_sources = LazyConnector(DataSourcesC)
+    jobs = LazyConnector(JobsC)
+    object_changes = LazyConnector(ObjectChangesC)
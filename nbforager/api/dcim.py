@@ -1,59 +1,12 @@
 """DCIM connectors."""
 
+from nbforager.api.base_ac import BaseAC, LazyConnector
 from nbforager.api.connector import Connector
 
 
-class DcimAC:
+class DcimAC(BaseAC):
     """DCIM connectors."""
 
-    def __init__(self, **kwargs):
-        """Initialize DcimAC."""
-        self.cable_terminations = self.CableTerminationsC(**kwargs)
-        self.cables = self.CablesC(**kwargs)
-        self.connected_device = self.ConnectedDeviceC(**kwargs)
-        self.console_port_templates = self.ConsolePortTemplatesC(**kwargs)
-        self.console_ports = self.ConsolePortsC(**kwargs)
-        self.console_server_port_templates = self.ConsoleServerPortTemplatesC(**kwargs)
-        self.console_server_ports = self.ConsoleServerPortsC(**kwargs)
-        self.device_bay_templates = self.DeviceBayTemplatesC(**kwargs)
-        self.device_bays = self.DeviceBaysC(**kwargs)
-        self.device_roles = self.DeviceRolesC(**kwargs)
-        self.device_types = self.DeviceTypesC(**kwargs)
-        self.devices = self.DevicesC(**kwargs)
-        self.front_port_templates = self.FrontPortTemplatesC(**kwargs)
-        self.front_ports = self.FrontPortsC(**kwargs)
-        self.interface_templates = self.InterfaceTemplatesC(**kwargs)
-        self.interfaces = self.InterfacesC(**kwargs)
-        self.inventory_item_roles = self.InventoryItemRolesC(**kwargs)
-        self.inventory_item_templates = self.InventoryItemTemplatesC(**kwargs)
-        self.inventory_items = self.InventoryItemsC(**kwargs)
-        self.locations = self.LocationsC(**kwargs)
-        self.mac_addresses = self.MacAddressesC(**kwargs)
-        self.manufacturers = self.ManufacturersC(**kwargs)
-        self.module_bay_templates = self.ModuleBayTemplatesC(**kwargs)
-        self.module_bays = self.ModuleBaysC(**kwargs)
-        self.module_type_profiles = self.ModuleTypeProfilesC(**kwargs)
-        self.module_types = self.ModuleTypesC(**kwargs)
-        self.modules = self.ModulesC(**kwargs)
-        self.platforms = self.PlatformsC(**kwargs)
-        self.power_feeds = self.PowerFeedsC(**kwargs)
-        self.power_outlet_templates = self.PowerOutletTemplatesC(**kwargs)
-        self.power_outlets = self.PowerOutletsC(**kwargs)
-        self.power_panels = self.PowerPanelsC(**kwargs)
-        self.power_port_templates = self.PowerPortTemplatesC(**kwargs)
-        self.power_ports = self.PowerPortsC(**kwargs)
-        self.rack_reservations = self.RackReservationsC(**kwargs)
-        self.rack_roles = self.RackRolesC(**kwargs)
-        self.rack_types = self.RackTypesC(**kwargs)
-        self.racks = self.RacksC(**kwargs)
-        self.rear_port_templates = self.RearPortTemplatesC(**kwargs)
-        self.rear_ports = self.RearPortsC(**kwargs)
-        self.regions = self.RegionsC(**kwargs)
-        self.site_groups = self.SiteGroupsC(**kwargs)
-        self.sites = self.SitesC(**kwargs)
-        self.virtual_chassis = self.VirtualChassisC(**kwargs)
-        self.virtual_device_contexts = self.VirtualDeviceContextsC(**kwargs)
-
     class CableTerminationsC(Connector):
         """CableTerminationsC, v3."""
 
@@ -278,3 +231,50 @@ class DcimAC:
         """VirtualDeviceContextsC, v3."""
 
         path = "dcim/virtual-device-contexts/"
+
+    # app/model connectors, created on the first access
+    cable_terminations = LazyConnector(CableTerminationsC)
+    cables = LazyConnector(CablesC)
+    connected_device = LazyConnector(ConnectedDeviceC)
+    console_port_templates = LazyConnector(ConsolePortTemplatesC)
+    console_ports = LazyConnector(ConsolePortsC)
+    console_server_port_templates = LazyConnector(ConsoleServerPortTemplatesC)
+    console_server_ports = LazyConnector(ConsoleServerPortsC)
+    device_bay_templates = LazyConnector(DeviceBayTemplatesC)
+    device_bays = LazyConnector(DeviceBaysC)
+    device_roles = LazyConnector(DeviceRolesC)
+    device_types = LazyConnector(DeviceTypesC)
+    devices = LazyConnector(DevicesC)
+    front_port_templates = LazyConnector(FrontPortTemplatesC)
+    front_ports = LazyConnector(FrontPortsC)
+    interface_templates = LazyConnector(InterfaceTemplatesC)
+    interfaces = LazyConnector(InterfacesC)
+    inventory_item_roles = LazyConnector(InventoryItemRolesC)
+    inventory_item_templates = LazyConnector(InventoryItemTemplatesC)
+    inventory_items = LazyConnector(InventoryItemsC)
+    locations = LazyConnector(LocationsC)
+    mac_addresses = LazyConnector(MacAddressesC)
+    manufacturers = LazyConnector(ManufacturersC)
+    module_bay_templates = LazyConnector(ModuleBayTemplatesC)
+    module_bays = LazyConnector(ModuleBaysC)
+    module_type_profiles = LazyConnector(ModuleTypeProfilesC)
+    module_types = LazyConnector(ModuleTypesC)
+    modules = LazyConnector(ModulesC)
+    platforms = LazyConnector(PlatformsC)
+    power_feeds = LazyConnector(PowerFeedsC)
+    power_outlet_templates = LazyConnector(PowerOutletTemplatesC)
+    power_outlets = LazyConnector(PowerOutletsC)
+    power_panels = LazyConnector(PowerPanelsC)
+    power_port_templates = LazyConnector(PowerPortTemplatesC)
+    power_ports = LazyConnector(PowerPortsC)
+    rack_reservations = LazyConnector(RackReservationsC)
+    rack_roles = LazyConnector(RackRolesC)
+    rack_types = LazyConnector(RackTypesC)
+    racks = LazyConnector(RacksC)
+    rear_port_templates = LazyConnector(RearPortTemplatesC)
+    rear_ports = LazyConnector(RearPortsC)
+    regions = LazyConnector(RegionsC)
+    site_groups = LazyConnector(SiteGroupsC)
+    sites = LazyConnector(SitesC)
+    virtual_chassis = LazyConnector(VirtualChassisC)
+    virtual_device_contexts = LazyConnector(VirtualDeviceContextsC)
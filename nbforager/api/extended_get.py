@@ -1,10 +1,16 @@
 """Map parameter {name} to {name}_id."""
 
-from typing import Dict
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
-from nbforager.types import DList
+from nbforager import ami
+from nbforager.constants import DEPENDENT_MODELS
+from nbforager.nb_tree import NbTree
+from nbforager.types import DList, LDAny, LInt, SeqT, T2Str, DiDAny
 
 
 class ParamPath(BaseModel):
@@ -13,6 +19,7 @@ class ParamPath(BaseModel):
     param: str = Field(description="Parameter name that need to map")
     path: str = Field(description="app/model path to request objects for mapping")
     key: str = Field(default="name", description="Key to request objects for mapping")
+    filtered: bool = Field(default=True, description="Key can be filtered on the Netbox side")
 
     @property
     def param_id(self) -> str:
@@ -22,6 +29,137 @@ class ParamPath(BaseModel):
 
 DParamPath = Dict[str, ParamPath]
 DDParamPath = Dict[str, DParamPath]
+LParamPath = List[ParamPath]
+DValueIds = Dict[object, LInt]
+
+
+class ParamCache:
+    """Cache of the {name} to {name}_id mapping, shared by all connectors of NbApi.
+
+    The key is a tuple of ``ParamPath.path`` and ``ParamPath.key``, the value is a dictionary
+    where the key is the value of the Netbox object (name, slug, cid, etc.) and
+    the value is a list of the IDs of Netbox objects with that value.
+    Each value expires after ``ttl`` seconds since it was last received from the Netbox.
+    """
+
+    def __init__(self, ttl: float = 300.0, size: int = 100_000):
+        """Initialize ParamCache.
+
+        :param ttl: Time to live of the cached mapping (seconds).
+            ``0`` - caching is disabled.
+        :param size: Maximum count of the cached values. If exceeded,
+            the least recently used mappings are evicted.
+        """
+        self.ttl = float(ttl)
+        self.size = int(size)
+        self._data: OrderedDict[T2Str, DValueIds] = OrderedDict()
+        self._times: Dict[T2Str, Dict[object, float]] = {}
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        """__repr__."""
+        name = self.__class__.__name__
+        return f"<{name}: {self.count()}>"
+
+    def clear(self) -> None:
+        """Delete all cached mappings."""
+        with self._lock:
+            self._data.clear()
+            self._times.clear()
+
+    def count(self) -> int:
+        """Count of the cached values."""
+        with self._lock:
+            return self._count()
+
+    def get(self, path: str, key: str, values: SeqT) -> Optional[LInt]:
+        """Get the IDs of Netbox objects by values.
+
+        :param path: app/model path, ``ParamPath.path``.
+        :param key: Key of the Netbox object, ``ParamPath.key``.
+        :param values: Values that need to be mapped to IDs.
+
+        :return: Sorted IDs if all values are cached, otherwise None.
+        """
+        if self.ttl <= 0:
+            return None
+        key_ = (path, key)
+        with self._lock:
+            if key_ in self._data:
+                self._expire(key_)
+            data: Optional[DValueIds] = self._data.get(key_)
+            if data is None:
+                return None
+            if [s for s in values if s not in data]:
+                return None
+            self._data.move_to_end(key_)
+            ids: LInt = sorted({i for s in values for i in data[s]})
+        return ids
+
+    def update(self, path: str, key: str, items: LDAny, values: Optional[SeqT] = None) -> None:
+        """Save the mapping of values to IDs.
+
+        :param path: app/model path, ``ParamPath.path``.
+        :param key: Key of the Netbox object, ``ParamPath.key``.
+        :param items: Netbox objects received from the Netbox.
+        :param values: Requested values. The values that are absent in the items
+            are cached as values without IDs (Netbox objects do not exist).
+            The received values replace the cached ones and restart their ttl.
+
+        :return: None. Update self object.
+        """
+        if self.ttl <= 0:
+            return
+        key_ = (path, key)
+        received: DValueIds = {s: [] for s in values or []}
+        for item in items:
+            if key not in item:
+                continue
+            ids: LInt = received.setdefault(item[key], [])
+            if item["id"] not in ids:
+                ids.append(item["id"])
+
+        now = time.monotonic()
+        with self._lock:
+            self._data.setdefault(key_, {}).update(received)
+            self._times.setdefault(key_, {}).update({s: now for s in received})
+            self._data.move_to_end(key_)
+            self._evict()
+
+    def load_tree(self, tree: NbTree) -> None:
+        """Pre-warm the cache by the Netbox objects in the tree.
+
+        :param tree: NbTree object, for example ``NbForager.root``.
+
+        :return: None. Update self object.
+        """
+        for param_path in param_paths():
+            app, model = ami.path_to_attrs(param_path.path)
+            objects_d: DiDAny = getattr(getattr(tree, app), model)
+            if objects_d:
+                self.update(param_path.path, param_path.key, list(objects_d.values()))
+
+    def _count(self) -> int:
+        """Count of the cached values, without locking."""
+        return sum(len(d) for d in self._data.values())
+
+    def _evict(self) -> None:
+        """Delete the least recently used mappings if the size is exceeded."""
+        while len(self._data) > 1 and self._count() > self.size:
+            key_, _ = self._data.popitem(last=False)
+            del self._times[key_]
+
+    def _expire(self, key_: T2Str) -> None:
+        """Delete the values of the mapping that are older than ttl."""
+        data: DValueIds = self._data[key_]
+        times: Dict[object, float] = self._times[key_]
+        expired = time.monotonic() - self.ttl
+        for value in [s for s, i in times.items() if i < expired]:
+            del data[value]
+            del times[value]
+        if not data:
+            del self._data[key_]
+            del self._times[key_]
 
 
 def data(path: str) -> DParamPath:
@@ -47,10 +185,10 @@ def data(path: str) -> DParamPath:
         "site_group": ParamPath(param="site_group", path="dcim/site-groups/"),
         # extras
         "content_type": ParamPath(
-            param="content_type", path="extras/content-types/", key="display"
+            param="content_type", path="extras/content-types/", key="display", filtered=False
         ),
         "for_object_type": ParamPath(
-            param="for_object_type", path="extras/content-types/", key="display"
+            param="for_object_type", path="extras/content-types/", key="display", filtered=False
         ),
         # ipam
         "export_target": ParamPath(param="export_target", path="ipam/route-targets/"),
@@ -112,6 +250,18 @@ def data(path: str) -> DParamPath:
     return result
 
 
+def param_paths() -> LParamPath:
+    """Get ParamPath objects with unique path and key for all app/model paths.
+
+    :return: ParamPath objects.
+    """
+    unique: Dict[T2Str, ParamPath] = {}
+    for path in DEPENDENT_MODELS:
+        for param_path in data(f"{path}/").values():
+            unique.setdefault((param_path.path, param_path.key), param_path)
+    return list(unique.values())
+
+
 def need_change(params_d: DList, mapping: DParamPath) -> DList:
     """Filter ``{parameter}`` that need change to ``{parameter}_id``.
 
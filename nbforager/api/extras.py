@@ -1,37 +1,12 @@
 """Extras connectors."""
 
+from nbforager.api.base_ac import BaseAC, LazyConnector
 from nbforager.api.connector import Connector
 
 
-class ExtrasAC:
+class ExtrasAC(BaseAC):
     """Extras connectors."""
 
-    def __init__(self, **kwargs):
-        """Initialize ExtrasAC."""
-        self.bookmarks = self.BookmarksC(**kwargs)
-        self.config_contexts = self.ConfigContextsC(**kwargs)
-        self.config_templates = self.ConfigTemplatesC(**kwargs)
-        self.content_types = self.ContentTypesC(**kwargs)
-        self.custom_field_choice_sets = self.CustomFieldChoiceSetsC(**kwargs)
-        self.custom_fields = self.CustomFieldsC(**kwargs)
-        self.custom_links = self.CustomLinksC(**kwargs)
-        self.event_rules = self.EventRulesC(**kwargs)
-        self.export_templates = self.ExportTemplatesC(**kwargs)
-        self.image_attachments = self.ImageAttachmentsC(**kwargs)
-        self.journal_entries = self.JournalEntriesC(**kwargs)
-        self.notification_groups = self.NotificationGroupsC(**kwargs)
-        self.notifications = self.NotificationsC(**kwargs)
-        self.object_changes = self.ObjectChangesC(**kwargs)
-        self.object_types = self.ObjectTypesC(**kwargs)
-        self.reports = self.ReportsC(**kwargs)
-        self.saved_filters = self.SavedFiltersC(**kwargs)
-        self.scripts = self.ScriptsC(**kwargs)
-        self.subscriptions = self.SubscriptionsC(**kwargs)
-        self.table_configs = self.TableConfigsC(**kwargs)
-        self.tagged_objects = self.TaggedObjectsC(**kwargs)
-        self.tags = self.TagsC(**kwargs)
-        self.webhooks = self.WebhooksC(**kwargs)
-
     class BookmarksC(Connector):
         """BookmarksC, v3.6."""
 
@@ -146,3 +121,28 @@ class ExtrasAC:
         """WebhooksC, v3."""
 
         path = "extras/webhooks/"
+
+    # app/model connectors, created on the first access
+    bookmarks = LazyConnector(BookmarksC)
+    config_contexts = LazyConnector(ConfigContextsC)
+    config_templates = LazyConnector(ConfigTemplatesC)
+    content_types = LazyConnector(ContentTypesC)
+    custom_field_choice_sets = LazyConnector(CustomFieldChoiceSetsC)
+    custom_fields = LazyConnector(CustomFieldsC)
+    custom_links = LazyConnector(CustomLinksC)
+    event_rules = LazyConnector(EventRulesC)
+    export_templates = LazyConnector(ExportTemplatesC)
+    image_attachments = LazyConnector(ImageAttachmentsC)
+    journal_entries = LazyConnector(JournalEntriesC)
+    notification_groups = LazyConnector(NotificationGroupsC)
+    notifications = LazyConnector(NotificationsC)
+    object_changes = LazyConnector(ObjectChangesC)
+    object_types = LazyConnector(ObjectTypesC)
+    reports = LazyConnector(ReportsC)
+    saved_filters = LazyConnector(SavedFiltersC)
+    scripts = LazyConnector(ScriptsC)
+    subscriptions = LazyConnector(SubscriptionsC)
+    table_configs = LazyConnector(TableConfigsC)
+    tagged_objects = LazyConnector(TaggedObjectsC)
+    tags = LazyConnector(TagsC)
+    webhooks = LazyConnector(WebhooksC)
@@ -1,35 +1,13 @@
 """IPAM connectors."""
 
+from nbforager.api.base_ac import BaseAC, LazyConnector
 from nbforager.api.connector import Connector
 from nbforager.api.ip_addresses import IpAddressesC
 
 
-class IpamAC:
+class IpamAC(BaseAC):
     """IPAM connectors."""
 
-    def __init__(self, **kwargs):
-        """Initialize IpamAC."""
-        self.aggregates = self.AggregatesC(**kwargs)
-        self.asn_ranges = self.AsnRangesC(**kwargs)
-        self.asns = self.AsnsC(**kwargs)
-        self.fhrp_group_assignments = self.FhrpGroupAssignmentsC(**kwargs)
-        self.fhrp_groups = self.FhrpGroupsC(**kwargs)
-        self.ip_addresses = IpAddressesC(**kwargs)
-        self.ip_ranges = self.IpRangesC(**kwargs)
-        self.l2vpn_terminations = self.L2vpnTerminationsC(**kwargs)
-        self.l2vpns = self.L2vpnsC(**kwargs)
-        self.prefixes = self.PrefixesC(**kwargs)
-        self.rirs = self.RirsC(**kwargs)
-        self.roles = self.RolesC(**kwargs)
-        self.route_targets = self.RouteTargetsC(**kwargs)
-        self.service_templates = self.ServiceTemplatesC(**kwargs)
-        self.services = self.ServicesC(**kwargs)
-        self.vlan_groups = self.VlanGroupsC(**kwargs)
-        self.vlan_translation_policies = self.VlanTranslationPoliciesC(**kwargs)
-        self.vlan_translation_rules = self.VlanTranslationRulesC(**kwargs)
-        self.vlans = self.VlansC(**kwargs)
-        self.vrfs = self.VrfsC(**kwargs)
-
     class AggregatesC(Connector):
         """AggregatesC, v3."""
 
@@ -124,3 +102,25 @@ class IpamAC:
         """VrfsC, v3."""
 
         path = "ipam/vrfs/"
+
+    # app/model connectors, created on the first access
+    aggregates = LazyConnector(AggregatesC)
+    asn_ranges = LazyConnector(AsnRangesC)
+    asns = LazyConnector(AsnsC)
+    fhrp_group_assignments = LazyConnector(FhrpGroupAssignmentsC)
+    fhrp_groups = LazyConnector(FhrpGroupsC)
+    ip_addresses = LazyConnector(IpAddressesC)
+    ip_ranges = LazyConnector(IpRangesC)
+    l2vpn_terminations = LazyConnector(L2vpnTerminationsC)
+    l2vpns = LazyConnector(L2vpnsC)
+    prefixes = LazyConnector(PrefixesC)
+    rirs = LazyConnector(RirsC)
+    roles = LazyConnector(RolesC)
+    route_targets = LazyConnector(RouteTargetsC)
+    service_templates = LazyConnector(ServiceTemplatesC)
+    services = LazyConnector(ServicesC)
+    vlan_groups = LazyConnector(VlanGroupsC)
+    vlan_translation_policies = LazyConnector(VlanTranslationPoliciesC)
+    vlan_translation_rules = LazyConnector(VlanTranslationRulesC)
+    vlans = LazyConnector(VlansC)
+    vrfs = LazyConnector(VrfsC)
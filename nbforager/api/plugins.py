@@ -1,16 +1,13 @@
 """Plugins connectors."""
 
+from nbforager.api.base_ac import BaseAC, LazyConnector
 from nbforager.api.connector import Connector
 from nbforager.types import LDAny
 
 
-class PluginsAC:
+class PluginsAC(BaseAC):
     """Plugins connectors."""
 
-    def __init__(self, **kwargs):
-        """Initialize PluginsAC."""
-        self.installed_plugins = self.InstalledPluginsC(**kwargs)
-
     class InstalledPluginsC(Connector):
         """InstalledPluginsC, v3."""
 
@@ -20,3 +17,6 @@ class PluginsAC:
             """Get data."""
             _ = kwargs  # noqa
             return self._get_l()
+
+    # app/model connectors, created on the first access
+    installed_plugins = LazyConnector(InstalledPluginsC)
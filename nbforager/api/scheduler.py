@@ -0,0 +1,268 @@
+"""Scheduler of requests to the Netbox, shared by all connectors of NbApi."""
+
+import math
+import random
+import time
+import urllib
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from threading import BoundedSemaphore, Condition
+from typing import Dict, Generator, Optional
+from urllib.parse import ParseResult
+
+from requests import Response
+
+from nbforager.types import DInt, ODInt
+
+RETRY_STATUSES = (429, 502, 503, 504)
+"""Response status codes of the overloaded Netbox, the request need to be retried."""
+MAX_BACKOFF = 300.0
+"""Maximum interval (seconds) between retries."""
+MAX_DELAY = 10.0
+"""Maximum interval (seconds) between the requests starts in adaptive mode."""
+RATE_STEP = 1.0
+"""Additive increase of the request rate (requests per second) in adaptive mode."""
+BETA = 0.5
+"""Multiplicative decrease of the concurrency and request rate in adaptive mode."""
+ALPHA = 0.2
+"""Smoothing factor of the latency moving average."""
+
+
+class Scheduler:
+    """Scheduler of requests to the Netbox, shared by all connectors of NbApi.
+
+    Limit the count of requests in flight: globally (all app/model endpoints)
+    and optionally per app/model endpoint. Each request waits for the free slot
+    of the endpoint and then for the free global slot.
+
+    In adaptive mode the scheduler controls the concurrency window and the request rate
+    by AIMD (additive-increase, multiplicative-decrease) based on the Netbox feedback:
+
+    - 502, 503, 504 or latency above ``latency_limit`` halve the concurrency window;
+    - 429 halves the request rate;
+    - ``Retry-After`` pauses all requests;
+    - each successful response increases the window by ``1/window`` and the rate
+      by ``RATE_STEP``, up to ``max_in_flight`` and unlimited rate.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 0,
+        endpoint_limits: ODInt = None,
+        adaptive: bool = False,
+        latency_limit: float = 30.0,
+    ):
+        """Initialize Scheduler.
+
+        :param max_in_flight: Maximum count of requests in flight to all endpoints.
+            ``0`` - unlimited.
+        :param endpoint_limits: Maximum count of requests in flight per app/model path,
+            for example ``{"ipam/prefixes/": 2}``. Paths without limit are limited
+            by ``max_in_flight`` only.
+        :param adaptive: True - adapt concurrency and request rate to the Netbox feedback.
+        :param latency_limit: Response latency (seconds) that is considered as
+            the Netbox overload in adaptive mode.
+        """
+        self.max_in_flight: int = max(int(max_in_flight or 0), 0)
+        self.endpoint_limits: DInt = _init_endpoint_limits(endpoint_limits)
+        self.adaptive: bool = bool(adaptive)
+        self.latency_limit: float = float(latency_limit)
+        # adaptive state
+        self.window: float = float(self.max_in_flight or math.inf)
+        self.delay: float = 0.0
+        self.latency: float = 0.0
+        self._decreased: float = 0.0
+        self._paused: float = 0.0
+        self._started: float = 0.0
+
+        self._semaphores: Dict[str, BoundedSemaphore] = {
+            k: BoundedSemaphore(v) for k, v in self.endpoint_limits.items()
+        }
+        self._counters: DInt = {}
+        self._condition = Condition()
+
+    def __repr__(self) -> str:
+        """__repr__."""
+        name = self.__class__.__name__
+        return f"<{name}: max_in_flight={self.max_in_flight}, in_flight={self.in_flight()}>"
+
+    def in_flight(self, path: str = "") -> int:
+        """Count of requests in flight.
+
+        :param path: app/model path. If empty, count requests to all endpoints.
+        :return: Count of requests in flight.
+        """
+        with self._condition:
+            if path:
+                return self._counters.get(_init_path(path), 0)
+            return sum(self._counters.values())
+
+    @contextmanager
+    def slot(self, url: str) -> Generator[None, None, None]:
+        """Wait for the free slot and hold it while the request is in flight.
+
+        :param url: URL or app/model path of the request.
+
+        :example:
+            with scheduler.slot("https://netbox/api/ipam/prefixes/?limit=1000"):
+                response = session.get(...)
+        """
+        path = url_to_path(url)
+        endpoint: Optional[BoundedSemaphore] = self._semaphores.get(path)
+        if endpoint is not None:
+            endpoint.acquire()
+        try:
+            with self._condition:
+                while (wait := self._wait()) > 0:
+                    self._condition.wait(timeout=None if wait == math.inf else wait)
+                self._counters[path] = self._counters.get(path, 0) + 1
+                self._started = time.monotonic()
+            try:
+                yield
+            finally:
+                with self._condition:
+                    self._counters[path] -= 1
+                    self._condition.notify_all()
+        finally:
+            if endpoint is not None:
+                endpoint.release()
+
+    def feedback(self, status_code: int, latency: float, retry_after: float = 0.0) -> None:
+        """Adapt the concurrency window and the request rate to the Netbox response.
+
+        :param status_code: Response status code, 504 if the session timeout is reached.
+        :param latency: Response latency (seconds).
+        :param retry_after: Value of the ``Retry-After`` header (seconds).
+
+        :return: None. Update self object.
+        """
+        if not self.adaptive:
+            return
+        with self._condition:
+            now = time.monotonic()
+            if self.latency:
+                latency = ALPHA * latency + (1 - ALPHA) * self.latency
+            self.latency = latency
+            if retry_after > 0:
+                self._paused = max(self._paused, now + min(retry_after, MAX_BACKOFF))
+
+            if status_code == 429:
+                self._decrease_rate(now)
+            elif status_code in RETRY_STATUSES or latency > self.latency_limit:
+                self._decrease_window(now)
+            else:
+                self._increase()
+            self._condition.notify_all()
+
+    @staticmethod
+    def backoff(attempt: int, sleep: float, retry_after: float = 0.0) -> float:
+        """Interval (seconds) before the next retry, jittered exponential backoff.
+
+        :param attempt: Number of the failed attempt, starting from 1.
+        :param sleep: Base interval (seconds).
+        :param retry_after: Value of the ``Retry-After`` header (seconds).
+            If set, it is used instead of the backoff, up to ``MAX_BACKOFF``.
+
+        :return: Interval (seconds), a random value in the range [base/2, base],
+            where base is ``sleep * 2 ** (attempt - 1)``, up to ``MAX_BACKOFF``.
+        """
+        if retry_after > 0:
+            return min(retry_after, MAX_BACKOFF)
+        base = min(float(sleep) * 2 ** max(attempt - 1, 0), MAX_BACKOFF)
+        return base / 2 + random.uniform(0, base / 2)
+
+    # ============================= helpers ==============================
+
+    def _wait(self) -> float:
+        """Time (seconds) to wait for the free slot, ``inf`` - wait for the released slot."""
+        limit = self.window if self.adaptive else float(self.max_in_flight or math.inf)
+        if limit != math.inf and sum(self._counters.values()) >= max(math.floor(limit), 1):
+            return math.inf
+        start = max(self._paused, self._started + self.delay)
+        return start - time.monotonic()
+
+    def _increase(self) -> None:
+        """Additive increase of the concurrency window and the request rate."""
+        if self.window != math.inf:
+            self.window += 1 / self.window
+            if self.max_in_flight:
+                self.window = min(self.window, float(self.max_in_flight))
+        if self.delay:
+            delay = 1 / (1 / self.delay + RATE_STEP)
+            self.delay = delay if delay > 0.001 else 0.0
+
+    def _decrease_window(self, now: float) -> None:
+        """Multiplicative decrease of the concurrency window, once per latency period."""
+        if now - self._decreased < self.latency:
+            return
+        in_flight = float(sum(self._counters.values()) or 1)
+        self.window = max(min(self.window, in_flight) * BETA, 1.0)
+        self._decreased = now
+
+    def _decrease_rate(self, now: float) -> None:
+        """Multiplicative decrease of the request rate, once per latency period."""
+        if now - self._decreased < self.latency:
+            return
+        if self.delay:
+            delay = self.delay / BETA
+        else:
+            # current rate is requests in flight per latency
+            in_flight = float(sum(self._counters.values()) or 1)
+            delay = max(self.latency, 0.001) / in_flight / BETA
+        self.delay = min(delay, MAX_DELAY)
+        self._decreased = now
+
+
+# ============================= helpers ==============================
+
+
+def retry_after(response: Response) -> float:
+    """Get the value of the ``Retry-After`` header in seconds.
+
+    :param response: Response object.
+    :return: Seconds to wait, ``0`` if the header is absent or invalid.
+    """
+    value = str(response.headers.get("Retry-After") or "").strip()
+    if not value:
+        return 0.0
+    if value.isdigit():
+        return float(value)
+    try:
+        date: datetime = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0.0
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def url_to_path(url: str) -> str:
+    """Convert URL to app/model path used as the key of endpoint limits.
+
+    :param url: URL or app/model path.
+    :return: app/model path.
+
+    :example:
+        url_to_path("https://netbox/api/ipam/prefixes/1/?limit=1") -> "ipam/prefixes/"
+    """
+    url_o: ParseResult = urllib.parse.urlparse(url)
+    path = url_o.path
+    if "/api/" in path:
+        path = path.split("/api/", 1)[1]
+    return _init_path(path)
+
+
+def _init_path(path: str) -> str:
+    """Normalize app/model path, keep only the app and model items."""
+    items = [s for s in path.split("/") if s][:2]
+    return "/".join(items) + "/"
+
+
+def _init_endpoint_limits(endpoint_limits: ODInt) -> DInt:
+    """Normalize app/model paths of endpoint limits, skip paths without limit."""
+    limits: DInt = {}
+    for path, limit in (endpoint_limits or {}).items():
+        if limit := int(limit or 0):
+            limits[_init_path(path)] = max(limit, 1)
+    return limits
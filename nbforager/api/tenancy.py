@@ -1,20 +1,12 @@
 """Tenancy connectors."""
 
+from nbforager.api.base_ac import BaseAC, LazyConnector
 from nbforager.api.connector import Connector
 
 
-class TenancyAC:
+class TenancyAC(BaseAC):
     """Tenancy connectors."""
 
-    def __init__(self, **kwargs):
-        """Initialize TenancyAC."""
-        self.contact_assignments = self.ContactAssignmentsC(**kwargs)
-        self.contact_groups = self.ContactGroupsC(**kwargs)
-        self.contact_roles = self.ContactRolesC(**kwargs)
-        self.contacts = self.ContactsC(**kwargs)
-        self.tenant_groups = self.TenantGroupsC(**kwargs)
-        self.tenants = self.TenantsC(**kwargs)
-
     class ContactAssignmentsC(Connector):
         """ContactAssignmentsC, v3."""
 
@@ -44,3 +36,11 @@ class TenancyAC:
         """TenantsC, v3."""
 
         path = "tenancy/tenants/"
+
+    # app/model connectors, created on the first access
+    contact_assignments = LazyConnector(ContactAssignmentsC)
+    contact_groups = LazyConnector(ContactGroupsC)
+    contact_roles = LazyConnector(ContactRolesC)
+    contacts = LazyConnector(ContactsC)
+    tenant_groups = LazyConnector(TenantGroupsC)
+    tenants = LazyConnector(TenantsC)
@@ -1,20 +1,13 @@
 """Users connectors."""
 
+from nbforager.api.base_ac import BaseAC, LazyConnector
 from nbforager.api.connector import Connector
 from nbforager.types import DAny
 
 
-class UsersAC:
+class UsersAC(BaseAC):
     """Users connectors."""
 
-    def __init__(self, **kwargs):
-        """Initialize UsersAC."""
-        self.config = self.ConfigC(**kwargs)
-        self.groups = self.GroupsC(**kwargs)
-        self.permissions = self.PermissionsC(**kwargs)
-        self.tokens = self.TokensC(**kwargs)
-        self.users = self.UsersC(**kwargs)
-
     class ConfigC(Connector):
         """ConfigC, v3."""
 
@@ -44,3 +37,10 @@ class UsersAC:
         """UsersC, v3."""
 
         path = "users/users/"
+
+    # app/model connectors, created on the first access
+    config = LazyConnector(ConfigC)
+    groups = LazyConnector(GroupsC)
+    permissions = LazyConnector(PermissionsC)
+    tokens = LazyConnector(TokensC)
+    users = LazyConnector(UsersC)
@@ -1,20 +1,12 @@
 """Virtualization connectors."""
 
+from nbforager.api.base_ac import BaseAC, LazyConnector
 from nbforager.api.connector import Connector
 
 
-class VirtualizationAC:
+class VirtualizationAC(BaseAC):
     """Virtualization connectors."""
 
-    def __init__(self, **kwargs):
-        """Initialize VirtualizationAC."""
-        self.cluster_groups = self.ClusterGroupsC(**kwargs)
-        self.cluster_types = self.ClusterTypesC(**kwargs)
-        self.clusters = self.ClustersC(**kwargs)
-        self.interfaces = self.InterfacesC(**kwargs)
-        self.virtual_disks = self.VirtualDisksC(**kwargs)
-        self.virtual_machines = self.VirtualMachinesC(**kwargs)
-
     class ClusterGroupsC(Connector):
         """ClusterGroupsC, v3."""
 
@@ -44,3 +36,11 @@ class VirtualizationAC:
         """VirtualMachinesC, v3."""
 
         path = "virtualization/virtual-machines/"
+
+    # app/model connectors, created on the first access
+    cluster_groups = LazyConnector(ClusterGroupsC)
+    cluster_types = LazyConnector(ClusterTypesC)
+    clusters = LazyConnector(ClustersC)
+    interfaces = LazyConnector(InterfacesC)
+    virtual_disks = LazyConnector(VirtualDisksC)
+    virtual_machines = LazyConnector(VirtualMachinesC)
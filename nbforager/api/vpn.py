@@ -1,24 +1,12 @@
 """Vpn connectors."""
 
+from nbforager.api.base_ac import BaseAC, LazyConnector
 from nbforager.api.connector import Connector
 
 
-class VpnAC:
+class VpnAC(BaseAC):
     """Vpn connectors."""
 
-    def __init__(self, **kwargs):
-        """Initialize VpnAC."""
-        self.ike_policies = self.IkePoliciesC(**kwargs)
-        self.ike_proposal = self.IkeProposalC(**kwargs)
-        self.ipsec_policies = self.IpsecPoliciesC(**kwargs)
-        self.ipsec_profiles = self.IpsecProfilesC(**kwargs)
-        self.ipsec_proposals = self.IpsecProposalsC(**kwargs)
-        self.l2vpn_terminations = self.L2vpnTerminationsC(**kwargs)
-        self.l2vpns = self.L2vpnsC(**kwargs)
-        self.tunnel_groups = self.TunnelGroupsC(**kwargs)
-        self.tunnel_terminations = self.TunnelTerminationsC(**kwargs)
-        self.tunnels = self.TunnelsC(**kwargs)
-
     class IkePoliciesC(Connector):
         """IkePoliciesC, v3.7."""
 
@@ -68,3 +56,15 @@ class VpnAC:
         """TunnelsC, v3.7."""
 
         path = "vpn/tunnels/"
+
+    # app/model connectors, created on the first access
+    ike_policies = LazyConnector(IkePoliciesC)
+    ike_proposal = LazyConnector(IkeProposalC)
+    ipsec_policies = LazyConnector(IpsecPoliciesC)
+    ipsec_profiles = LazyConnector(IpsecProfilesC)
+    ipsec_proposals = LazyConnector(IpsecProposalsC)
+    l2vpn_terminations = LazyConnector(L2vpnTerminationsC)
+    l2vpns = LazyConnector(L2vpnsC)
+    tunnel_groups = LazyConnector(TunnelGroupsC)
+    tunnel_terminations = LazyConnector(TunnelTerminationsC)
+    tunnels = LazyConnector(TunnelsC)
@@ -1,17 +1,12 @@
 """Wireless connectors."""
 
+from nbforager.api.base_ac import BaseAC, LazyConnector
 from nbforager.api.connector import Connector
 
 
-class WirelessAC:
+class WirelessAC(BaseAC):
     """Wireless connectors."""
 
-    def __init__(self, **kwargs):
-        """Initialize WirelessAC."""
-        self.wireless_lan_groups = self.WirelessLanGroupsC(**kwargs)
-        self.wireless_lans = self.WirelessLansC(**kwargs)
-        self.wireless_links = self.WirelessLinksC(**kwargs)
-
     class WirelessLanGroupsC(Connector):
         """WirelessLanGroupsC."""
 
@@ -26,3 +21,8 @@ class WirelessAC:
         """WirelessLinksC."""
 
         path = "wireless/wireless-links/"
+
+    # app/model connectors, created on the first access
+    wireless_lan_groups = LazyConnector(WirelessLanGroupsC)
+    wireless_lans = LazyConnector(WirelessLansC)
+    wireless_links = LazyConnector(WirelessLinksC)
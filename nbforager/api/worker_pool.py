@@ -0,0 +1,96 @@
+"""Pool of worker threads, shared by all connectors of NbApi."""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+
+class WorkerPool:
+    """Pool of worker threads, shared by all connectors and foragers of NbApi.
+
+    The threads are started on the first request in threading mode and reused
+    by all subsequent requests, until the pool is shut down.
+    After shutdown the pool is started again on the next request.
+    """
+
+    def __init__(self, threads: int = 1):
+        """Initialize WorkerPool.
+
+        :param threads: Maximum count of the worker threads.
+        """
+        self.threads: int = max(int(threads or 1), 1)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        """__repr__."""
+        name = self.__class__.__name__
+        return f"<{name}: threads={self.threads}, running={self.running}>"
+
+    @property
+    def running(self) -> bool:
+        """True if the worker threads are started."""
+        return self._executor is not None
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """Submit the callable to be executed by the worker thread.
+
+        :param fn: Callable to execute.
+        :param args: Positional arguments of the callable.
+        :param kwargs: Keyword arguments of the callable.
+
+        :return: Future of the result.
+        """
+        with self._lock:
+            return self._get_executor().submit(fn, *args, **kwargs)
+
+    def map(self, fn: Callable, *iterables: Iterable) -> Iterator[Any]:
+        """Execute the callable for each item of the iterables by the worker threads.
+
+        :param fn: Callable to execute.
+        :param iterables: Arguments of the callable.
+
+        :return: Iterator of the results in the order of the iterables.
+        """
+        with self._lock:
+            futures = [self._get_executor().submit(fn, *args) for args in zip(*iterables)]
+        return (future.result() for future in futures)
+
+    def resize(self, threads: int) -> None:
+        """Change the count of the worker threads.
+
+        The running threads finish the submitted tasks, the new threads are started
+        on the next request.
+
+        :param threads: Maximum count of the worker threads.
+
+        :return: None. Update self object.
+        """
+        threads = max(int(threads or 1), 1)
+        if threads == self.threads:
+            return
+        self.threads = threads
+        self.shutdown(wait=False)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads.
+
+        :param wait: True - wait until the submitted tasks are finished.
+
+        :return: None. Update self object.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    # ============================= helpers ==============================
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the running executor, start it if needed. Call under the lock."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.threads,
+                thread_name_prefix="nbforager",
+            )
+        return self._executor
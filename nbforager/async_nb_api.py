@@ -0,0 +1,188 @@
+"""AsyncNbApi, asyncio wrapper of Netbox REST API."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Dict, Optional
+
+from nbforager import ami
+from nbforager.api.async_connector import AsyncConnector, aiohttp
+from nbforager.api.connector import Connector
+from nbforager.nb_api import NbApi
+from nbforager.types import ODLStr, LStr
+
+
+class AsyncAC:
+    """Asyncio application connectors.
+
+    Model connectors are created on first access.
+    """
+
+    def __init__(self, api: AsyncNbApi, app: str):
+        """Initialize AsyncAC.
+
+        :param api: Parent AsyncNbApi object.
+        :param app: Application name.
+        """
+        self._api = api
+        self._app = app
+
+    def __repr__(self) -> str:
+        """__repr__."""
+        return f"<{self._app}: {self._api.host}>"
+
+    def __getattr__(self, model: str) -> AsyncConnector:
+        """Get AsyncConnector by model name.
+
+        :param model: Model name, for example ``ip_addresses``.
+        :return: AsyncConnector object.
+        :raises AttributeError: If model is not defined in the application.
+        """
+        if model.startswith("_"):
+            raise AttributeError(model)
+        return self._api.connector_by_path(f"{self._app}/{model}")
+
+
+class AsyncNbApi:
+    """AsyncNbApi, asyncio wrapper of Netbox REST API.
+
+    Connectors are nested by principle ``{application}.{model}.{method}`` like in NbApi,
+    where **method** is awaitable: ``create``, ``create_d``, ``delete``, ``get``,
+    ``get_count``, ``update``, ``update_d``.
+    Instead of threads, all pages are requested concurrently in one event loop,
+    the count of requests in flight is limited by one semaphore shared by all connectors.
+
+    Requires ``aiohttp`` package.
+
+    :example:
+        async with AsyncNbApi(host="demo.netbox.dev", token="***") as api:
+            addresses = await api.ipam.ip_addresses.get(vrf="VRF1")
+    """
+
+    def __init__(
+        self,
+        host: str,
+        token: str = "",
+        scheme: str = "https",
+        port: int = 0,
+        verify: bool = True,
+        limit: int = 1000,
+        url_length: int = 2047,
+        concurrency: int = 100,
+        # Errors processing
+        timeout: int = 60,
+        max_retries: int = 0,
+        sleep: int = 10,
+        strict: bool = False,
+        # Settings
+        extended_get: bool = True,
+        loners: ODLStr = None,
+        **kwargs,
+    ):
+        """Initialize AsyncNbApi.
+
+        :param str host: Netbox host name.
+
+        :param int concurrency: Maximum count of requests in flight. Default is `100`.
+
+        Other parameters are identical to :py:class:`.NbApi`, except threads and interval.
+        """
+        if aiohttp is None:
+            msg = "aiohttp is required for AsyncNbApi, run: pip install nbforager[async]"
+            raise ImportError(msg)
+        self.api = NbApi(
+            host=host,
+            token=token,
+            scheme=scheme,
+            port=port,
+            verify=verify,
+            limit=limit,
+            url_length=url_length,
+            timeout=timeout,
+            max_retries=max_retries,
+            sleep=sleep,
+            strict=strict,
+            extended_get=extended_get,
+            loners=loners,
+            **kwargs,
+        )
+        self.concurrency: int = max(int(concurrency), 1)
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._connectors: Dict[str, AsyncConnector] = {}
+        for app in self.apps():
+            setattr(self, app, AsyncAC(self, app))
+
+    def __repr__(self) -> str:
+        """__repr__."""
+        name = self.__class__.__name__
+        return f"<{name}: {self.host}>"
+
+    async def __aenter__(self) -> AsyncNbApi:
+        """Enter the async context manager."""
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        """Exit the async context manager, close the session."""
+        await self.close()
+
+    # ============================= property =============================
+
+    @property
+    def host(self) -> str:
+        """Netbox host name."""
+        return self.api.host
+
+    @property
+    def url(self) -> str:
+        """Netbox URL to API endpoints."""
+        return self.api.url
+
+    # ============================= methods ==============================
+
+    @staticmethod
+    def apps() -> LStr:
+        """Get list of application names.
+
+        :return: Applications.
+        :rtype: List[str]
+        """
+        return NbApi.apps()
+
+    async def close(self) -> None:
+        """Close the session.
+
+        :return: None. Update self object.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def connector_by_path(self, path: str) -> AsyncConnector:
+        """Get AsyncConnector instance by app/model path.
+
+        :param path: app/model path.
+
+        :return: AsyncConnector to the Netbox API endpoint.
+        """
+        app, model = ami.path_to_attrs(path)
+        connector: Connector = getattr(getattr(self.api, app), model)
+        if connector.path not in self._connectors:
+            self._connectors[connector.path] = AsyncConnector(connector=connector, api=self)
+        return self._connectors[connector.path]
+
+    def session(self) -> aiohttp.ClientSession:
+        """Get the session shared by all connectors, create it on first call.
+
+        :return: aiohttp ClientSession object.
+        """
+        if self._session is None or self._session.closed:
+            base_c = self.api._base_c  # pylint: disable=W0212
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.concurrency,
+                    ssl=bool(base_c.verify),
+                ),
+                timeout=aiohttp.ClientTimeout(total=float(base_c.timeout)),
+            )
+        return self._session
@@ -1,6 +1,6 @@
 """Constants for apps and models."""
 
-from nbforager.types import DLStr
+from nbforager.types import DLStr, LStr
 
 APPS = (
     "circuits",
@@ -17,6 +17,9 @@ APPS = (
 )
 """Application names for NetBox v3.5."""
 
+PROJECTION_KEYS: LStr = ["id", "url"]
+"""Keys that are always requested in ``fields`` and never excluded, required by this package."""
+
 DEPENDENT_MODELS: DLStr = {
     "circuits/circuit-terminations": [
         "circuits/circuits",
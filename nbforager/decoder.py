@@ -0,0 +1,73 @@
+"""JSON decoder of the Netbox API responses.
+
+The fastest installed backend is used by default: ``orjson``, ``msgspec``
+or the standard ``json``. The response body is decoded directly from bytes.
+"""
+
+import json
+from typing import Any, Callable, Dict, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+try:
+    import msgspec  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover
+    msgspec = None  # type: ignore
+
+Decoder = Callable[[bytes], Any]
+
+DECODERS: Dict[str, Decoder] = {"json": json.loads}
+"""Installed JSON decoders by the backend name, the fastest first."""
+if msgspec is not None:
+    DECODERS = {"msgspec": msgspec.json.decode, **DECODERS}
+if orjson is not None:
+    DECODERS = {"orjson": orjson.loads, **DECODERS}
+
+_decoder: Decoder = next(iter(DECODERS.values()))
+
+
+def get_decoder() -> Decoder:
+    """Get the JSON decoder used for the Netbox API responses.
+
+    :return: Decoder, the callable that decodes bytes to Python object.
+    """
+    return _decoder
+
+
+def set_decoder(decoder: Union[str, Decoder] = "") -> None:
+    """Set the JSON decoder used for the Netbox API responses.
+
+    :param decoder: Backend name: "orjson", "msgspec", "json",
+        or the callable that decodes bytes to Python object.
+        Empty - the fastest installed backend.
+
+    :return: None. Update the decoder of the module.
+
+    :raises ValueError: The backend is not installed.
+
+    :example:
+        set_decoder("json")
+    """
+    global _decoder  # pylint: disable=global-statement
+    if callable(decoder):
+        _decoder = decoder
+        return
+    name = str(decoder or next(iter(DECODERS)))
+    if name not in DECODERS:
+        raise ValueError(f"{name=} is not installed, expected={list(DECODERS)}.")
+    _decoder = DECODERS[name]
+
+
+def loads(content: Union[bytes, str]) -> Any:
+    """Decode JSON content.
+
+    :param content: JSON document, bytes are decoded without the intermediate str.
+
+    :return: Decoded Python object.
+    """
+    if isinstance(content, str):
+        content = content.encode()
+    return _decoder(content)
@@ -0,0 +1,90 @@
+"""Containment of IP networks by sorted intervals.
+
+The IP networks are nested or disjoint, so the innermost parent network of each child
+is found by a single sweep over the sorted intervals, in O(n log n).
+"""
+
+import ipaddress
+from typing import List, Tuple
+
+from nbforager.types import LInt
+
+Interval = Tuple[int, int]
+LInterval = List[Interval]
+
+
+def interval(network: str) -> Interval:
+    """Convert IP network to the interval of integers.
+
+    :param network: IP network or IP interface with mask.
+
+    :return: The first and the last addresses of the network as integers.
+
+    :example:
+        interval("10.0.0.1/31") -> (167772160, 167772161)
+    """
+    ip_, length, bits = _parse(network)
+    size = 1 << (bits - length)
+    start = ip_ - ip_ % size
+    return start, start + size - 1
+
+
+def sort_key(network: str) -> Tuple[int, int, int]:
+    """Key to sort IP networks and IP interfaces in the same order as ipaddress objects.
+
+    :param network: IP network or IP interface with mask.
+
+    :return: The first address of the network, the mask length, the address.
+
+    :example:
+        sort_key("10.0.0.1/31") -> (167772160, 31, 167772161)
+    """
+    ip_, length, bits = _parse(network)
+    size = 1 << (bits - length)
+    return ip_ - ip_ % size, length, ip_
+
+
+def find_parents(parents: LInterval, children: LInterval, strict: bool = False) -> LInt:
+    """Find the innermost parent interval that contains each child interval.
+
+    :param parents: Intervals of the parent networks.
+    :param children: Intervals of the child networks.
+    :param strict: True - the parent needs to be bigger than the child,
+        False - the equal parent contains the child.
+
+    :return: Index of the parent in the parents for each child, -1 if the parent is absent.
+
+    :example:
+        find_parents([(0, 255), (0, 127)], [(0, 1), (128, 128), (256, 256)]) -> [1, 0, -1]
+    """
+    parent_kind, child_kind = (1, 0) if strict else (0, 1)
+    events = [(s, -e, parent_kind, i) for i, (s, e) in enumerate(parents)]
+    events.extend((s, -e, child_kind, i) for i, (s, e) in enumerate(children))
+    events.sort()
+
+    indexes: LInt = [-1] * len(children)
+    stack: LInt = []  # indexes of the parents that contain the current position
+    for start, _, kind, idx in events:
+        while stack and parents[stack[-1]][1] < start:
+            stack.pop()
+        if kind == parent_kind:
+            stack.append(idx)
+        elif stack:
+            indexes[idx] = stack[-1]
+    return indexes
+
+
+# ============================= helpers ==============================
+
+
+def _parse(network: str) -> Tuple[int, int, int]:
+    """Parse IP network to the address as integer, the mask length and the address length."""
+    address, _, length = network.partition("/")
+    if ":" in address:
+        bits = 128
+        ip_ = int(ipaddress.IPv6Address(address))
+    else:
+        bits = 32
+        octets = [int(s) for s in address.split(".")]
+        ip_ = (octets[0] << 24) | (octets[1] << 16) | (octets[2] << 8) | octets[3]
+    return ip_, int(length or bits), bits
@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import time
-from queue import Queue
-from threading import Thread
+from concurrent.futures import Future
+from typing import List, Optional
 from urllib.parse import urlparse, parse_qs
 
 from vhelpers import vstr
@@ -13,8 +13,9 @@ from nbforager import ami, helpers, nb_tree
 from nbforager.api.connector import Connector
 from nbforager.nb_api import NbApi
 from nbforager.nb_tree import NbTree
-from nbforager.parser import nb_parser
+from nbforager.parser.nb_parser import NbPredicate
 from nbforager.types import LDAny, DiDAny, LStr, LT2StrDAny, DList, LDList, SInt, DAny
+from nbforager.types import LInt, OLInt
 
 
 class Forager:
@@ -31,7 +32,6 @@ class Forager:
         self.app = app
         self.model = model
         self.api: NbApi = forager_a.api
-        self.connector: Connector = getattr(getattr(self.api, app), model)
         # data
         self.root: NbTree = forager_a.root
         self.root_d: DiDAny = getattr(getattr(self.root, app), model)
@@ -46,6 +46,11 @@ class Forager:
 
     # ============================= property =============================
 
+    @property
+    def connector(self) -> Connector:
+        """Connector to the app/model, created on the first access."""
+        return getattr(getattr(self.api, self.app), self.model)
+
     @property
     def interval(self) -> float:
         """Wait this time between requests (seconds)."""
@@ -77,7 +82,9 @@ class Forager:
         :param bool nested: `True` - Request base and nested objects,
             `False` - Request only base objects. Default is `False`
 
-        :param kwargs: Filtering parameters.
+        :param kwargs: Filtering parameters. The ``fields`` and ``exclude`` parameters
+            request only part of the keys, such objects are marked as ``_partial``
+            and do not replace the complete objects in NbForager.root.
 
         :return: None. Update self root data in related app/model.
         """
@@ -95,9 +102,7 @@ class Forager:
         results: LDAny = []
         if self.threads > 1:
             path_params: LT2StrDAny = self._get_path_params(urls)
-            self._clear_results(path_params)
-            self._query_threads(path_params)
-            results_: LDAny = self._pop_connector_results(path_params)
+            results_: LDAny = self._query_threads(path_params)
             results.extend(results_)
 
         # loop
@@ -141,7 +146,7 @@ class Forager:
             id_: int = data["id"]
             data["url"] = f"{self.api.url}{path}/{id_}/"
 
-        self._save_results(items)
+        self._save_results(items, partial=True)
 
     def connector_by_path(self, path: str) -> Connector:
         """Get Connector instance by app/model path.
@@ -155,9 +160,41 @@ class Forager:
         """
         return self.api.connector_by_path(path)
 
-    def find_root(self, **kwargs) -> LDAny:
+    def complete(self, ids: OLInt = None) -> None:
+        """Replace partial objects in NbForager.root with the complete objects from Netbox.
+
+        Partial objects are requested with ``fields``, ``exclude`` or ``brief`` parameters.
+        The complete objects are requested in one ``id`` query, sliced by the URL length.
+
+        :param ids: IDs of objects that need to be completed. None - all partial objects.
+
+        :return: None. Update self root data in related app/model.
+        """
+        partial_ids: LInt = [i for i, d in self.root_d.items() if d.get("_partial")]
+        if ids is not None:
+            ids_: SInt = set(ids)
+            partial_ids = [i for i in partial_ids if i in ids_]
+        self._reload_root_data(ids=partial_ids)
+
+    def find_root(
+        self,
+        predicate: Optional[NbPredicate] = None,
+        complete: bool = False,
+        indexed: bool = False,
+        **kwargs,
+    ) -> LDAny:
         """Find Netbox objects in NbForager.root by extended finding parameters.
 
+        :param predicate: Compiled extended finding parameters, reusable in loops.
+            Joined with kwargs by ``AND`` operator.
+
+        :param complete: True - request the complete objects from Netbox instead of
+            the partial objects before finding. Default is `False`.
+
+        :param indexed: True - use the hash index of the model, for repeated finding
+            in a loop. Objects changed in place require ``NbTree.invalidate()``.
+            Default is `False`.
+
         :param kwargs: Extended filtering parameters.
             Different parameters work like an ``AND`` operator.
             Different values of the same parameter work like an ``OR`` operator.
@@ -165,7 +202,9 @@ class Forager:
 
         :return: Filtered Netbox objects.
         """
-        return nb_parser.find_objects(objects=list(self.root_d.values()), **kwargs)
+        if complete:
+            self.complete()
+        return getattr(self.root, self.app).find(self.model, predicate, indexed, **kwargs)
 
     def find_rse(self, role: str = "", site: str = "", env: str = "", **kwargs) -> LDAny:
         """Find Netbox objects in NbForager.tree by Role-Site-Env finding parameters.
@@ -186,11 +225,23 @@ class Forager:
         }
         params = {k: v for k, v in params.items() if v}
         kwargs.update(params)
-        return nb_parser.find_objects(objects=list(self.tree_d.values()), **kwargs)
-
-    def find_tree(self, **kwargs) -> LDAny:
+        return getattr(self.tree, self.app).find(self.model, **kwargs)
+
+    def find_tree(
+        self,
+        predicate: Optional[NbPredicate] = None,
+        indexed: bool = False,
+        **kwargs,
+    ) -> LDAny:
         """Find Netbox objects in NbForager.tree by extended finding parameters.
 
+        :param predicate: Compiled extended finding parameters, reusable in loops.
+            Joined with kwargs by ``AND`` operator.
+
+        :param indexed: True - use the hash index of the model, for repeated finding
+            in a loop. Objects changed in place require ``NbTree.invalidate()``.
+            Default is `False`.
+
         :param kwargs: Extended filtering parameters.
             Different parameters work like an ``AND`` operator.
             Different values of the same parameter work like an ``OR`` operator.
@@ -198,7 +249,7 @@ class Forager:
 
         :return: Filtered Netbox objects.
         """
-        return nb_parser.find_objects(objects=list(self.tree_d.values()), **kwargs)
+        return getattr(self.tree, self.app).find(self.model, predicate, indexed, **kwargs)
 
     # ============================= helpers ==============================
 
@@ -226,7 +277,8 @@ class Forager:
 
         Request data based on the kwargs filter parameters and
         save the received objects to the NbForager.root.
-        Set extra `_nested` value in Netbox object.
+        Set extra `_nested` and `_partial` values in Netbox object.
+        Partial objects (``fields`` or ``exclude`` projection) do not replace complete objects.
 
         :param bool nested: `True` - Request base and nested objects,
             `False` - Request only base objects. Default is `False`
@@ -236,12 +288,41 @@ class Forager:
         :return: List of Netbox objects. Update NbForager.root object.
         """
         nb_objects: LDAny = self.connector.get(**kwargs)
+        partial = bool(kwargs.get("fields") or kwargs.get("exclude") or kwargs.get("brief"))
         for nb_object in nb_objects:
             nb_object["_nested"] = nested
+            nb_object["_partial"] = partial
             idx = int(nb_object["id"])
+            if partial and idx in self.root_d and not self.root_d[idx].get("_partial"):
+                continue  # keep the complete object
             self.root_d[idx] = nb_object
+        getattr(self.root, self.app).invalidate(self.model)
+        getattr(self.root, self.app).mark_requested(self.model)
         return nb_objects
 
+    def _reload_root_data(self, ids: LInt) -> None:
+        """Request objects by IDs from Netbox and replace them in the NbForager.root.
+
+        Keep the `_nested` value of the replaced object, set `_partial=False`.
+        Objects that are absent in Netbox are deleted from the NbForager.root.
+
+        :param ids: IDs of objects that need to be reloaded.
+
+        :return: None. Update NbForager.root object.
+        """
+        if not ids:
+            return
+        nb_objects: LDAny = self.connector.get(id=ids)
+        for nb_object in nb_objects:
+            idx = int(nb_object["id"])
+            nb_object["_nested"] = bool(self.root_d.get(idx, {}).get("_nested"))
+            nb_object["_partial"] = False
+            self.root_d[idx] = nb_object
+
+        for idx in set(ids).difference(int(d["id"]) for d in nb_objects):
+            self.root_d.pop(idx, None)
+        getattr(self.root, self.app).invalidate(self.model)
+
     def _collect_nested_urls(self, nb_objects: LDAny) -> LStr:
         """Collect nested URLs from the given Netbox objects and filter those missing from the root.
 
@@ -289,60 +370,34 @@ class Forager:
         return path_params
 
     # noinspection PyProtectedMember
-    def _clear_results(self, path_params: LT2StrDAny) -> None:
-        """Clear Connector.results by path app/model."""
-        for path, _ in path_params:
-            connector = self.connector_by_path(path)
-            connector._results.clear()  # pylint: disable=W0212
-
-    def _query_threads(self, path_params: LT2StrDAny) -> None:
+    def _query_threads(self, path_params: LT2StrDAny) -> LDAny:
         """Retrieve data from Netbox in threaded mode.
 
+        Each request returns its own results, so connectors can be shared
+        by concurrent callers. The requests are executed by the worker threads
+        of the NbApi ``pool``, shared by all connectors and foragers.
+
         :param path_params: A list of tuples containing the path app/model and parameters.
 
-        :return: None. Save results to self._results.
+        :return: Netbox objects.
         """
-        queue: Queue = Queue()
+        results: LDAny = []
+        futures: List[Future] = []
         for path, params_d in path_params:
-            queue.put((path, params_d))
-
-        for idx in range(self.threads):
             if self.interval:
                 time.sleep(self.interval)
-            thread = Thread(name=f"Thread-{idx}", target=self._run_queue, args=(queue,))
-            thread.start()
-        queue.join()
-
-    # noinspection PyProtectedMember
-    def _run_queue(self, queue: Queue) -> None:
-        """Process tasks from the queue.
-
-        This method dequeues and executes tasks until the queue is empty.
-        Each task is expected to be a callable method with its corresponding params_d parameters.
-        :param queue: A queue containing path app/model and parameters pairs to be requested.
-
-        :return: None. Update connector._results list.
-        """
-        while not queue.empty():
-            path, params_d = queue.get()
-            connector = self.connector_by_path(path)
-            connector._query_data_thread(path=path, params_d=params_d)  # pylint: disable=W0212
-            queue.task_done()
-
-    # noinspection PyProtectedMember
-    def _pop_connector_results(self, path_params: LT2StrDAny) -> LDAny:
-        """Get results from connectors by path app/model and delete cached results."""
-        results: LDAny = []
-        for path, _ in path_params:
             connector = self.connector_by_path(path)
-            results.extend(connector._results)  # pylint: disable=W0212
-            connector._results.clear()  # pylint: disable=W0212
+            future = self.connector.pool.submit(connector._query_loop, path, params_d)
+            futures.append(future)
+        for future in futures:
+            results.extend(future.result())
         return results
 
-    def _save_results(self, results: LDAny) -> None:
+    def _save_results(self, results: LDAny, partial: bool = False) -> None:
         """Save Netbox objects to root NbTree object.
 
         :param results: Data to be saved.
+        :param partial: True - objects have only part of the keys.
         :return: None. Update root NbTree object.
         """
         for data in results:
@@ -352,6 +407,7 @@ class Forager:
             model_d: DiDAny = self._get_root_data(path)
             if idx not in model_d:
                 data["_nested"] = False
+                data["_partial"] = partial
                 model_d[idx] = data
 
     def _get_root_data(self, path: str) -> DiDAny:
@@ -1,26 +1,209 @@
 """Joiner."""
 
-from operator import itemgetter
+from bisect import bisect_left, insort
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
 
 from netports import IPv4
-from vhelpers import vlist
 
 from nbforager import ami
 from nbforager.api.base_mc import BaseMC
+from nbforager.foragers import containment
+from nbforager.foragers.containment import Interval, LInterval
+from nbforager import nb_tree
 from nbforager.nb_tree import NbTree
 from nbforager.parser import nb_parser
 from nbforager.parser.nb_value import NbValue
-from nbforager.types import LDAny, DAny, LStr, DiDAny, LInt, DiLDAny, SInt
+from nbforager.types import LDAny, DAny, LStr, DiDAny, LInt, SInt, ST3StrInt, DiLDAny, T2Int
+from nbforager.types import T3StrInt, SStr
+
+DT2IntLDAny = Dict[T2Int, LDAny]
+FAMILIES = (4, 6)
+IPAM_MODELS = ("aggregates", "prefixes", "ip_addresses")
+Network = Tuple[int, int, T3StrInt]
+
+
+class Links:
+    """Links of the keys to the values, indexed in both directions."""
+
+    def __init__(self):
+        """Initialize Links."""
+        self.values: Dict[Hashable, set] = {}  # key: linked values
+        self.keys: Dict[Hashable, set] = {}  # value: linked keys
+
+    def add(self, key: Hashable, values: Iterable) -> None:
+        """Link the key to the values."""
+        for value in values:
+            self.values.setdefault(key, set()).add(value)
+            self.keys.setdefault(value, set()).add(key)
+
+    def discard(self, key: Hashable) -> None:
+        """Delete all links of the key."""
+        for value in self.values.pop(key, set()):
+            keys: set = self.keys[value]
+            keys.discard(key)
+            if not keys:
+                del self.keys[value]
+
+    def find(self, values: Iterable) -> set:
+        """Get the keys linked to any of the values."""
+        return {k for s in values for k in self.keys.get(s, set())}
+
+
+class JoinIndex:
+    """Indexes of the links between the joined objects, to join only the changed objects.
+
+    - ports, the device ID of each port;
+    - members, the master ID of each virtual-chassis member;
+    - addresses, the assigned object of each ip-address;
+    - referrers, the URLs of the nested objects of each object;
+    - networks, ipam objects sorted by the interval of the IP network.
+
+    The indexes are built once by the whole tree. After the objects are changed,
+    ``update()`` needs to be called with the keys of the changed objects only.
+    """
+
+    def __init__(self, tree: Optional[NbTree] = None):
+        """Initialize JoinIndex.
+
+        :param tree: NbTree object with the joined data to index. None - empty indexes.
+        """
+        self.ports = Links()
+        self.members = Links()
+        self.addresses = Links()
+        self.referrers = Links()
+        self._networks: Dict[T3StrInt, Tuple[int, Network]] = {}  # key: (family, network)
+        self._sorted: Dict[int, List[Network]] = {}  # family: networks sorted by interval
+        self._containers: Dict[int, Dict[Interval, int]] = {}  # family: {interval: count}
+        if tree is not None:
+            self.update(tree=tree, keys=nb_tree.object_keys(tree))
+
+    def update(self, tree: NbTree, keys: ST3StrInt) -> None:
+        """Index the objects of the keys again, the objects absent in the tree are removed.
+
+        :param tree: NbTree object with the joined data.
+        :param keys: The app, model, id of the changed objects.
+
+        :return: None. Update self object.
+        """
+        port_models: LStr = Joiner._port_models()  # pylint: disable=W0212
+        for key in keys:
+            self._discard(key)
+            app, model, idx = key
+            data: DAny = getattr(getattr(tree, app), model).get(idx) or {}
+            if not data:
+                continue
+            self.referrers.add(key, _nested_urls(data))
+            if (app, model) == ("dcim", "devices"):
+                if master_id := _master_id(data):
+                    self.members.add(idx, [master_id])
+            elif app == "dcim" and model in port_models:
+                self.ports.add(key, [NbValue(data).device_id()])
+            elif app == "ipam" and model in IPAM_MODELS and "_aggregate" in data:
+                self._add_network(key, data)
+            if (app, model) == ("ipam", "ip_addresses") and data.get("assigned_object_id"):
+                assigned = (data["assigned_object_type"], data["assigned_object_id"])
+                self.addresses.add(idx, [assigned])
+
+    def device_ports(self, device_ids: SInt) -> ST3StrInt:
+        """Get the keys of the ports of the devices."""
+        return self.ports.find(device_ids)
+
+    def vc_members(self, master_ids: SInt) -> SInt:
+        """Get the IDs of the virtual-chassis members of the master devices."""
+        return self.members.find(master_ids)
+
+    def assigned_addresses(self, intf_ids: Iterable[int], object_type: str) -> SInt:
+        """Get the IDs of the ip-addresses assigned to the interfaces of the object type."""
+        return self.addresses.find((object_type, i) for i in intf_ids)
+
+    def nested_keys(self, urls: SStr) -> ST3StrInt:
+        """Get the keys of the objects with the nested objects of the URLs."""
+        return self.referrers.find(urls)
+
+    def scope_keys(self, keys: ST3StrInt) -> ST3StrInt:
+        """Get the keys of the ipam objects within the outermost aggregate or prefix of the keys.
+
+        The outermost container is found by the supernets of the object (one lookup
+        per mask length), the objects within it by bisection of the sorted networks.
+
+        :param keys: The app, model, id of the changed objects.
+
+        :return: The app, model, id of the aggregates, prefixes and ip-addresses.
+        """
+        affected: ST3StrInt = set()
+        for key in keys:
+            if key not in self._networks:
+                continue
+            family, (start, end, _) = self._networks[key]
+            first, last = self._outermost(family=family, interval_=(start, end))
+            networks: List[Network] = self._sorted[family]
+            idx_first = bisect_left(networks, (first,))
+            idx_last = bisect_left(networks, (last + 1,))
+            affected.update(k for _, i, k in networks[idx_first:idx_last] if i <= last)
+        return affected
+
+    def _add_network(self, key: T3StrInt, data: DAny) -> None:
+        """Index the ipam object by the interval of the IP network."""
+        family, (start, end) = _family_interval(data)
+        network: Network = (start, end, key)
+        self._networks[key] = (family, network)
+        insort(self._sorted.setdefault(family, []), network)
+        if key[1] != "ip_addresses":
+            containers: Dict[Interval, int] = self._containers.setdefault(family, {})
+            containers[(start, end)] = containers.get((start, end), 0) + 1
+
+    def _discard(self, key: T3StrInt) -> None:
+        """Delete the object from all indexes."""
+        self.referrers.discard(key)
+        self.ports.discard(key)
+        if key[:2] == ("dcim", "devices"):
+            self.members.discard(key[2])
+        if key[:2] == ("ipam", "ip_addresses"):
+            self.addresses.discard(key[2])
+        if key not in self._networks:
+            return
+        family, network = self._networks.pop(key)
+        networks: List[Network] = self._sorted[family]
+        del networks[bisect_left(networks, network)]
+        if key[1] != "ip_addresses":
+            containers: Dict[Interval, int] = self._containers[family]
+            interval_: Interval = network[:2]
+            containers[interval_] -= 1
+            if not containers[interval_]:
+                del containers[interval_]
+
+    def _outermost(self, family: int, interval_: Interval) -> Interval:
+        """Get the outermost aggregate or prefix that contains the interval, or the interval."""
+        containers: Dict[Interval, int] = self._containers.get(family) or {}
+        bits = 32 if family == 4 else 128
+        start, end = interval_
+        length = bits - (end - start + 1).bit_length() + 1
+        for length_ in range(length + 1):
+            size = 1 << (bits - length_)
+            first = start - start % size
+            if (first, first + size - 1) in containers:
+                return first, first + size - 1
+        return interval_
 
 
 class Joiner:
     """Create additional keys in Netbox objects to represent them similarly to the WEB UI."""
 
-    def __init__(self, tree: NbTree):
+    def __init__(self, tree: NbTree, index: Optional[JoinIndex] = None):
         """Initialize Joiner.
         :param NbTree tree: NbTree object containing Netbox data to be updated to match the WEB UI.
+        :param JoinIndex index: Indexes of the links between the joined objects,
+            used by affected_keys(). None - the indexes are built by the tree on the first use.
         """
         self.tree = tree
+        self._index = index
+
+    @property
+    def index(self) -> JoinIndex:
+        """Indexes of the links between the joined objects, built on the first use."""
+        if self._index is None:
+            self._index = JoinIndex(self.tree)
+        return self._index
 
     # noinspection PyProtectedMember
     def init_extra_keys(self) -> None:
@@ -50,15 +233,79 @@ class Joiner:
             for data in objects.values():
                 nbv = NbValue(data=data)
                 family: int = nbv.family_value()
-                if family != 4:
+                if family not in FAMILIES:
                     continue
-                snet = data[key]
-                data["_ipv4"] = IPv4(snet, strict=strict)
+                if family == 4:
+                    snet = data[key]
+                    data["_ipv4"] = IPv4(snet, strict=strict)
                 data["_aggregate"] = {}  # DAny
                 data["_super_prefix"] = {}  # DAny
                 data["_sub_prefixes"] = []  # LDAny
                 data["_ip_addresses"] = []  # LDAny
 
+    def affected_keys(self, keys: ST3StrInt) -> ST3StrInt:
+        """Get the keys of the objects linked by Joiner to the changed objects.
+
+        Call it before and after the changed objects are updated in the tree,
+        to collect the links of the old and the new objects. Between the calls,
+        the index needs to be updated by ``JoinIndex.update()`` with the keys.
+
+        - A device is linked to all its ports and the virtual-chassis members.
+        - An ipam object is linked to all objects within its outermost aggregate or prefix.
+
+        Only the changed and the linked objects are visited, found by the index.
+
+        :param keys: The app, model, id of the changed objects.
+
+        :return: The app, model, id of the changed and the linked objects.
+        """
+        affected: ST3StrInt = set(keys)
+        affected.update(self._affected_dcim_keys(keys))
+        affected.update(self._affected_ipam_keys(keys))
+        return affected
+
+    def join_keys(
+        self,
+        keys: ST3StrInt,
+        dcim: bool = False,
+        ipam: bool = False,
+        ipam_prefixes: bool = False,
+        ipam_all: bool = False,
+    ) -> None:
+        """Create additional keys only in the objects of the keys.
+
+        The keys need to be collected by affected_keys(), so that the linked objects are joined
+        together. The parameters are the same as in NbForager.join_tree().
+
+        :param keys: The app, model, id of the objects to join.
+        :param dcim: True - Create additional keys to represent Netbox dcim objects.
+        :param ipam: True - Create additional keys to represent Netbox ipam objects.
+        :param ipam_prefixes: True - Join only ipam/prefixes, skip ipam/ip-addresses.
+        :param ipam_all: True - Join IPv4 and IPv6 objects of all VRFs by join_ipam(),
+            False - Join IPv4 objects of the global table by join_ipam_ipv4().
+
+        :return: None. Update NbTree object.
+        """
+        tree = NbTree()
+        for app, model, idx in keys:
+            if data := getattr(getattr(self.tree, app), model).get(idx):
+                getattr(getattr(tree, app), model)[idx] = data
+
+        joiner = Joiner(tree)
+        joiner.init_extra_keys()
+        if ipam_all and (ipam or ipam_prefixes):
+            joiner.join_ipam(ipam=ipam, ipam_prefixes=ipam_prefixes)
+        elif ipam or ipam_prefixes:
+            joiner.join_ipam_ipv4(ipam=ipam, ipam_prefixes=ipam_prefixes)
+        if dcim:
+            joiner._join_virtual_chassis()
+            intf_ids: LInt = joiner._join_dcim_devices()
+            # assigned ip-addresses are not limited by the keys
+            addresses_d: DiDAny = self.tree.ipam.ip_addresses
+            address_ids: SInt = self.index.assigned_addresses(intf_ids, "dcim.interface")
+            tree.ipam.ip_addresses = {i: addresses_d[i] for i in sorted(address_ids)}
+            joiner._join_ip_addresses(intf_ids, app="dcim")
+
     def join_dcim_devices(self) -> None:
         """Create additional keys to represent dcim.devices similar to the WEB UI.
 
@@ -112,10 +359,7 @@ class Joiner:
         # models
         app = "dcim"
         model = "devices"
-        # noinspection PyProtectedMember
-        extra_keys: LStr = BaseMC._extra_keys["dcim/devices/"]  # pylint: disable=W0212
-        extra_keys = [s for s in extra_keys if s != "_vc_members"]
-        extra_models: LStr = [s.lstrip("_") for s in extra_keys]
+        extra_models: LStr = self._port_models()
         nbf_devices: DiDAny = getattr(getattr(self.tree, app), model)
 
         # joined interfaces, need find assigned ip-addresses
@@ -161,9 +405,8 @@ class Joiner:
         model = "interfaces"
         object_type = "virtualization.vminterface" if app == "virtualization" else "dcim.interface"
         intfs_d: DiDAny = getattr(getattr(self.tree, app), model)
-        params = {"id": intf_ids}
         intfs_d = {
-            d["id"]: d for d in nb_parser.find_objects(objects=list(intfs_d.values()), **params)
+            d["id"]: d for d in nb_parser.find_objects(objects=list(intfs_d.values()), id=intf_ids)
         }
 
         app = "ipam"
@@ -181,17 +424,21 @@ class Joiner:
                     if extra_key in nb_intf:
                         nb_intf[extra_key][address] = nb_addr
 
-    def join_ipam_ipv4(self, ipam: bool = False, ipam_prefixes: bool = False) -> None:
+    def join_ipam(self, ipam: bool = False, ipam_prefixes: bool = False) -> None:
         """Create additional keys to represent ipam similar to the WEB UI.
 
             Add new attributes in ipam/aggregates, ipam/prefixes, ipam/ip-addresses:
 
-            - ``_ipv4`` IPv4 object
+            - ``_ipv4`` IPv4 object, only for IPv4 family
             - ``_aggregate`` Aggregate data for ipam/prefixes and ipam/ip-addresses
             - ``_super_prefix`` Related parent prefix data for ipam/prefixes and ipam/ip-addresses
             - ``_sub_prefixes`` Related child prefixes data for ipam/prefixes and ipam/ip-addresses
             - ``_ip_addresses`` Related IP addresses data for ipam/aggregates and ipam/prefixes
 
+            IPv4 and IPv6 objects are joined, each VRF has its own hierarchy of prefixes
+            and ip-addresses. Prefixes of all VRFs are linked to the ``_aggregate``,
+            aggregates have ``_sub_prefixes`` of the global table (without VRF).
+
         :param ipam: True - Create additional keys to represent Netbox ipam objects.
             Set all `ipam_{model}` arguments to True, to join related objects.
 
@@ -207,147 +454,240 @@ class Joiner:
         if ipam or ipam_prefixes:
             self._join_update_sub_prefixes()
 
+    def join_ipam_ipv4(self, ipam: bool = False, ipam_prefixes: bool = False) -> None:
+        """Create additional keys to represent ipam similar to the WEB UI.
+
+        Same as join_ipam(), but only IPv4 objects of the global table (without VRF)
+        are joined, IPv6 and VRF objects are skipped.
+
+        :param ipam: True - Create additional keys to represent Netbox ipam objects.
+        :param ipam_prefixes: True - Join only ipam/prefixes, skip ipam/ip-addresses.
+
+        :return: None. Update NbTree object.
+        """
+        tree = NbTree()
+        for model in ["aggregates", "prefixes", "ip_addresses"]:
+            objects_d: DiDAny = getattr(self.tree.ipam, model)
+            getattr(tree.ipam, model).update(
+                {i: d for i, d in objects_d.items() if "_ipv4" in d and not d.get("vrf")}
+            )
+        Joiner(tree).join_ipam(ipam=ipam, ipam_prefixes=ipam_prefixes)
+
     def _join_ipam_aggregates(self) -> None:
         """Add prefixes to aggregates.
 
         :return: None. Update ipam/aggregates._sub_prefixes, ipam/prefixes._aggregate.
         """
-        nb_aggregates: LDAny = self._filter_aggregates_ip4()
-        depth_prefixes_dl: DiLDAny = self._group_prefixes_ip4()
-
-        for nb_aggregate in nb_aggregates:
-            for depth, nb_prefixes in depth_prefixes_dl.items():
-                for nb_prefix in nb_prefixes:
-                    aggregate: IPv4 = nb_aggregate["_ipv4"]
-                    prefix: IPv4 = nb_prefix["_ipv4"]
-                    if prefix in aggregate:
-                        nb_prefix["_aggregate"] = nb_aggregate
-                        if depth == 0:  # super-prefix
-                            nb_aggregate["_sub_prefixes"].append(nb_prefix)
+        family_aggregates: DiLDAny = self._group_aggregates()
+        for (family, vrf_id), nb_prefixes in self._group_prefixes().items():
+            nb_aggregates: LDAny = family_aggregates.get(family, [])
+            intervals: LInterval = _intervals(nb_prefixes)
+            aggregate_idxs: LInt = containment.find_parents(_intervals(nb_aggregates), intervals)
+            super_idxs: LInt = containment.find_parents(intervals, intervals, strict=True)
+
+            for nb_prefix, aggregate_idx, super_idx in zip(nb_prefixes, aggregate_idxs, super_idxs):
+                if aggregate_idx < 0:
+                    continue
+                nb_aggregate: DAny = nb_aggregates[aggregate_idx]
+                nb_prefix["_aggregate"] = nb_aggregate
+                if super_idx < 0 and not vrf_id:  # super-prefix of the global table
+                    nb_aggregate["_sub_prefixes"].append(nb_prefix)
 
     def _join_ipam_ip_addresses(self) -> None:
         """Add prefixes to ip-addresses.
 
-        :return: None. Update ipam/aggregates._sub_prefixes, ipam/prefixes._aggregate.
+        :return: None. Update ipam/ip-addresses._super_prefix, ipam/ip-addresses._aggregate,
+            ipam/prefixes._ip_addresses.
         """
-        nb_addresses: LDAny = self._filter_ip_addresses_ip4()
-        depth_prefixes_dl: DiLDAny = self._group_prefixes_ip4()
-        depths: LInt = list(depth_prefixes_dl)
-        depths.reverse()
-
-        updated: LInt = []  # IDs of updated ipam/ip-addresses, to skip
-
-        for depth in depths:
-            nb_addresses_ = nb_addresses.copy()
-            nb_prefixes: LDAny = depth_prefixes_dl.get(depth, [])
-            for nb_address in nb_addresses_:
-                address: IPv4 = nb_address["_ipv4"]
-                for nb_prefix in nb_prefixes:
-                    if nb_address["id"] in updated:
-                        continue
-                    prefix: IPv4 = nb_prefix["_ipv4"]
-                    if address in prefix:
-                        nb_address["_aggregate"] = nb_prefix["_aggregate"]
-                        nb_address["_super_prefix"] = nb_prefix
-                        nb_prefix["_ip_addresses"].append(nb_address)
-                        updated.append(nb_address["id"])
-            nb_addresses = [d for d in nb_addresses if d["id"] not in updated]
+        vrf_prefixes: DT2IntLDAny = self._group_prefixes()
+        for family_vrf, nb_addresses in self._group_ip_addresses().items():
+            nb_prefixes: LDAny = vrf_prefixes.get(family_vrf, [])
+            prefix_idxs: LInt = containment.find_parents(
+                parents=_intervals(nb_prefixes),
+                children=_intervals(nb_addresses),
+            )
+
+            for nb_address, prefix_idx in zip(nb_addresses, prefix_idxs):
+                if prefix_idx < 0:
+                    continue
+                nb_prefix: DAny = nb_prefixes[prefix_idx]
+                nb_address["_aggregate"] = nb_prefix["_aggregate"]
+                nb_address["_super_prefix"] = nb_prefix
+                nb_prefix["_ip_addresses"].append(nb_address)
 
     def _join_ipam_prefixes(self) -> None:
         """Add prefixes to prefixes.
 
         :return: None. Update ipam/prefixes._sub_prefixes, ipam/prefixes._super_prefix.
         """
-        nb_super_prefixes: LDAny = []
-        depth_prefixes_dl: DiLDAny = self._group_prefixes_ip4()
+        for nb_prefixes in self._group_prefixes().values():
+            intervals: LInterval = _intervals(nb_prefixes)
+            super_idxs: LInt = containment.find_parents(intervals, intervals, strict=True)
 
-        for depth, nb_sub_prefixes in enumerate(depth_prefixes_dl.values()):
-            if not depth:
-                nb_super_prefixes = nb_sub_prefixes
-                continue
-            for nb_super_prefix in nb_super_prefixes:
-                super_prefix: IPv4 = nb_super_prefix["_ipv4"]
-                if super_prefix == 32:
+            for nb_sub_prefix, super_idx in zip(nb_prefixes, super_idxs):
+                if super_idx < 0:
                     continue
-                for nb_sub_prefix in nb_sub_prefixes:
-                    sub_prefix: IPv4 = nb_sub_prefix["_ipv4"]
-                    if sub_prefix in super_prefix:
-                        nb_super_prefix["_sub_prefixes"].append(nb_sub_prefix)
-                        nb_sub_prefix["_super_prefix"] = nb_super_prefix
-            nb_super_prefixes = nb_sub_prefixes
+                nb_super_prefix: DAny = nb_prefixes[super_idx]
+                nb_super_prefix["_sub_prefixes"].append(nb_sub_prefix)
+                nb_sub_prefix["_super_prefix"] = nb_super_prefix
 
     def _join_update_sub_prefixes(self) -> None:
         """Update _sub_prefixes in aggregates and prefixes.
 
-        Remove duplicates, remove objects with improper depth, sort by IPv4.
+        Remove duplicates, remove objects with improper depth, sort by IP.
 
         :return: None. Update ipam/aggregates._sub_prefixes, ipam/prefixes._sub_prefixes.
         """
-        nb_aggregates: LDAny = self._filter_aggregates_ip4()
-        for nb_aggregate in nb_aggregates:
-            sub_prefixes: LDAny = vlist.no_dupl(nb_aggregate["_sub_prefixes"])
-            sub_prefixes = [d for d in sub_prefixes if not d["_super_prefix"]]
-            nb_aggregate["_sub_prefixes"] = sorted(sub_prefixes, key=itemgetter("_ipv4"))
-
-        nb_prefixes: LDAny = self._filter_prefixes_ip4()
-        for nb_prefix in nb_prefixes:
-            sub_prefixes = vlist.no_dupl(nb_prefix["_sub_prefixes"])
-            nb_prefix["_sub_prefixes"] = sorted(sub_prefixes, key=itemgetter("_ipv4"))
-            ip_addresses = vlist.no_dupl(nb_prefix["_ip_addresses"])
-            nb_prefix["_ip_addresses"] = sorted(ip_addresses, key=itemgetter("_ipv4"))
+        for nb_aggregates in self._group_aggregates().values():
+            for nb_aggregate in nb_aggregates:
+                sub_prefixes: LDAny = _no_dupl(nb_aggregate["_sub_prefixes"])
+                sub_prefixes = [d for d in sub_prefixes if not d["_super_prefix"]]
+                nb_aggregate["_sub_prefixes"] = sorted(sub_prefixes, key=_sort_key)
+
+        for nb_prefixes in self._group_prefixes().values():
+            for nb_prefix in nb_prefixes:
+                sub_prefixes = _no_dupl(nb_prefix["_sub_prefixes"])
+                nb_prefix["_sub_prefixes"] = sorted(sub_prefixes, key=_sort_key)
+                ip_addresses = _no_dupl(nb_prefix["_ip_addresses"])
+                nb_prefix["_ip_addresses"] = sorted(ip_addresses, key=_sort_key)
 
     # ============================= helpers ==============================
 
-    def _filter_aggregates_ip4(self) -> LDAny:
-        """Filter ipam/aggregates family=4, sorted by IPv4.
+    def _affected_dcim_keys(self, keys: ST3StrInt) -> ST3StrInt:
+        """Get the keys of the devices and ports linked to the changed objects.
+
+        :param keys: The app, model, id of the changed objects.
 
-        :return: ipam/aggregates objects.
+        :return: The app, model, id of the linked devices and ports.
         """
-        nb_aggregates: LDAny = []
+        devices_d: DiDAny = self.tree.dcim.devices
+        port_models: LStr = self._port_models()
+
+        device_ids: SInt = set()
+        for app, model, idx in keys:
+            data: DAny = getattr(getattr(self.tree, app), model).get(idx) or {}
+            if (app, model) == ("dcim", "devices"):
+                device_ids.add(idx)
+            elif app == "dcim" and model in port_models:
+                device_ids.add(NbValue(data).device_id())
+            elif (app, model) == ("ipam", "ip_addresses"):
+                if data.get("assigned_object_type") == "dcim.interface":
+                    intf_d: DAny = self.tree.dcim.interfaces.get(data["assigned_object_id"]) or {}
+                    device_ids.add(NbValue(intf_d).device_id())
+
+        master_ids: SInt = {_master_id(devices_d.get(i) or {}) for i in device_ids}
+        device_ids.update(master_ids)
+        device_ids.discard(0)
+        device_ids.update(self.index.vc_members(device_ids))
+
+        affected: ST3StrInt = {("dcim", "devices", i) for i in device_ids}
+        affected.update(self.index.device_ports(device_ids))
+        return affected
+
+    def _affected_ipam_keys(self, keys: ST3StrInt) -> ST3StrInt:
+        """Get the keys of the ipam objects linked to the changed objects.
+
+        The objects within the outermost aggregate or prefix (of any VRF)
+        of the changed object are linked, see ``JoinIndex.scope_keys()``.
+
+        :param keys: The app, model, id of the changed objects.
+
+        :return: The app, model, id of the linked aggregates, prefixes and ip-addresses.
+        """
+        return self.index.scope_keys(keys)
+
+    def _group_aggregates(self) -> DiLDAny:
+        """Group ipam/aggregates by family, sorted by IP.
 
+        :return: ipam/aggregates objects by family.
+        """
+        family_aggregates: DiLDAny = {}
         for nb_aggregate in self.tree.ipam.aggregates.values():
-            if nb_aggregate["family"]["value"] == 4:
-                nb_aggregates.append(nb_aggregate)
+            if "_aggregate" in nb_aggregate:
+                family: int = NbValue(nb_aggregate).family_value()
+                family_aggregates.setdefault(family, []).append(nb_aggregate)
+        return {k: sorted(v, key=_sort_key) for k, v in sorted(family_aggregates.items())}
+
+    def _group_ip_addresses(self) -> DT2IntLDAny:
+        """Group ipam/ip-addresses by family and VRF ID, sorted by IP.
 
-        return sorted(nb_aggregates, key=itemgetter("_ipv4"))
+        :return: ipam/ip-addresses objects by (family, VRF ID), VRF ID=0 for the global table.
+        """
+        return _group_by_family_vrf(self.tree.ipam.ip_addresses.values())
 
-    def _filter_ip_addresses_ip4(self) -> LDAny:
-        """Filter ipam/ip-addresses family=4 without VRF, sorted by IPv4.
+    def _group_prefixes(self) -> DT2IntLDAny:
+        """Group ipam/prefixes by family and VRF ID, sorted by IP.
 
-        :return: ipam/ip-addresses objects.
+        :return: ipam/prefixes objects by (family, VRF ID), VRF ID=0 for the global table.
         """
-        ip_addresses: LDAny = []
+        return _group_by_family_vrf(self.tree.ipam.prefixes.values())
 
-        for ip_address in self.tree.ipam.ip_addresses.values():
-            if ip_address["family"]["value"] == 4 and ip_address["vrf"] is None:
-                ip_addresses.append(ip_address)
+    @staticmethod
+    def _port_models() -> LStr:
+        """Get the models of the device ports, joined to dcim.devices: interfaces, etc."""
+        # noinspection PyProtectedMember
+        extra_keys: LStr = BaseMC._extra_keys["dcim/devices/"]  # pylint: disable=W0212
+        return [s.lstrip("_") for s in extra_keys if s != "_vc_members"]
 
-        return sorted(ip_addresses, key=itemgetter("_ipv4"))
 
-    def _filter_prefixes_ip4(self) -> LDAny:
-        """Filter ipam/prefixes family=4, sorted by IPv4.
+# ============================= helpers ==============================
 
-        :return: ipam/prefixes objects.
-        """
-        nb_prefixes: LDAny = []
 
-        for nb_prefix in self.tree.ipam.prefixes.values():
-            if nb_prefix["family"]["value"] == 4 and nb_prefix["vrf"] is None:
-                nb_prefixes.append(nb_prefix)
+def _master_id(device: DAny) -> int:
+    """Get ID of the virtual-chassis master of the device, 0 if the device is not a member."""
+    virtual_chassis: DAny = device.get("virtual_chassis") or {}
+    master: DAny = virtual_chassis.get("master") or {}
+    return int(master.get("id") or 0)
 
-        return sorted(nb_prefixes, key=itemgetter("_ipv4"))
 
-    def _group_prefixes_ip4(self) -> DiLDAny:
-        """Group ipam/prefixes by depth counter.
+def _family_interval(data: DAny) -> Tuple[int, Interval]:
+    """Get family and interval of the IP network of ipam object."""
+    return NbValue(data).family_value(), _interval(data)
 
-        :return: A dictionary of prefixes where the key represents the depth
-            and the value represents a list of ipam/prefixes at that depth.
-        """
-        nb_prefixes: LDAny = self._filter_prefixes_ip4()
-        depth_prefixes_dl: DiLDAny = {d["_depth"]: [] for d in nb_prefixes}
 
-        for nb_prefix in nb_prefixes:
-            depth: int = int(nb_prefix["_depth"])
-            depth_prefixes_dl[depth].append(nb_prefix)
+def _group_by_family_vrf(objects: Iterable[DAny]) -> DT2IntLDAny:
+    """Group ipam objects with initialized extra keys by family and VRF ID, sorted by IP."""
+    groups: DT2IntLDAny = {}
+    for data in objects:
+        if "_aggregate" in data:
+            family: int = NbValue(data).family_value()
+            vrf_id = int((data.get("vrf") or {}).get("id") or 0)
+            groups.setdefault((family, vrf_id), []).append(data)
+    return {k: sorted(v, key=_sort_key) for k, v in sorted(groups.items())}
+
+
+def _interval(data: DAny) -> Interval:
+    """Get interval of the IP network of ipam object."""
+    return containment.interval(data["prefix"] if "prefix" in data else data["address"])
+
+
+def _intervals(objects: LDAny) -> LInterval:
+    """Get intervals of the IP networks of ipam objects."""
+    return [_interval(d) for d in objects]
+
+
+def _sort_key(data: DAny) -> Tuple[int, int, int]:
+    """Key to sort ipam objects by IP network and address."""
+    return containment.sort_key(data["prefix"] if "prefix" in data else data["address"])
+
+
+def _nested_urls(data: DAny) -> SStr:
+    """Get URLs of the nested objects, except the extra keys linked by Joiner."""
+    urls: SStr = set()
+    for key, child in data.items():
+        if key.startswith("_"):
+            continue
+        for child_ in child if isinstance(child, list) else [child]:
+            if not isinstance(child_, dict):
+                continue
+            if url := child_.get("url"):
+                urls.add(str(url))
+            object_ = child_.get("object")
+            if isinstance(object_, dict) and object_.get("url"):
+                urls.add(str(object_["url"]))
+    return urls
+
 
-        return depth_prefixes_dl
+def _no_dupl(objects: LDAny) -> LDAny:
+    """Remove duplicate objects (the same dictionary), keep the order."""
+    return list({id(d): d for d in objects}.values())
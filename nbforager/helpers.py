@@ -1,7 +1,6 @@
 """Helper functions."""
 
 import itertools
-import json
 import logging
 import re
 from copy import deepcopy
@@ -11,7 +10,8 @@ from urllib.parse import ParseResult, urlencode, urlparse, parse_qs
 from requests import Response, HTTPError
 from vhelpers import vlist, vparam
 
-from nbforager.constants import DEPENDENT_MODELS
+from nbforager import decoder
+from nbforager.constants import DEPENDENT_MODELS, PROJECTION_KEYS
 from nbforager.types import DAny, LDAny, LStr, SStr, LDList, DList, DLStr, ODLStr
 from nbforager.types import LTInt2, SeqStr, DDDLInt, LValue, TValues, TLists, LParam
 
@@ -24,8 +24,7 @@ def decode_response_d(response: Response) -> DAny:
     :param response: Response object received from the Netbox API.
     :return: Decoded object as a dictionary.
     """
-    html: str = response.content.decode("utf-8")
-    data: DAny = dict(json.loads(html))
+    data: DAny = dict(decoder.loads(response.content))
     return data
 
 
@@ -35,8 +34,7 @@ def decode_response_l(response: Response) -> LDAny:
     :param response: Response object received from the Netbox API.
     :return: Decoded objects as a list.
     """
-    html: str = response.content.decode("utf-8")
-    items: LDAny = list(json.loads(html))
+    items: LDAny = list(decoder.loads(response.content))
     return items
 
 
@@ -398,6 +396,51 @@ def _validate_value(value: Any) -> LValue:
     return values
 
 
+def change_params_projection(params_d: DList) -> DList:
+    """Join the values of the ``fields`` and ``exclude`` projection parameters.
+
+    Netbox expects comma-separated values, for example ``fields=id,url,name``.
+    The keys ``PROJECTION_KEYS`` are always requested and never excluded.
+
+    :param params_d: Parameters that need to update.
+    :return: Updated parameters.
+    """
+    params_d = params_d.copy()
+    if "fields" in params_d:
+        fields: LStr = _split_values(params_d["fields"])
+        params_d["fields"] = [",".join(vlist.no_dupl([*PROJECTION_KEYS, *fields]))]
+    if "exclude" in params_d:
+        excluded: LStr = [s for s in _split_values(params_d["exclude"]) if s not in PROJECTION_KEYS]
+        params_d["exclude"] = [",".join(excluded)]
+        if not excluded:
+            del params_d["exclude"]
+    return params_d
+
+
+def pop_excluded_keys(items: LDAny, params_ld: LDList) -> None:
+    """Remove the keys of the ``exclude`` parameter from the Netbox objects.
+
+    Netbox excludes only ``config_context``, other keys are removed on the client side,
+    so the projected objects have the same keys in all Netbox versions.
+
+    :param items: Netbox objects that need to update.
+    :param params_ld: Parameters of the request.
+    :return: None. Update Netbox objects.
+    """
+    excluded: SStr = {s for d in params_ld for s in _split_values(d.get("exclude") or [])}
+    if not excluded:
+        return
+    for data in items:
+        for key in excluded.intersection(data):
+            del data[key]
+
+
+def _split_values(values: list) -> LStr:
+    """Split comma-separated values, remove empty values and duplicates."""
+    items: LStr = [s.strip() for v in values for s in str(v).split(",")]
+    return vlist.no_dupl([s for s in items if s])
+
+
 def get_key_of_longest_value(params_d: DList) -> str:
     """Get the key of the parameter with the longest joined value.
 
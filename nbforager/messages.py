@@ -3,14 +3,24 @@
 from __future__ import annotations
 
 import logging
-from typing import List, Union
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, List, Union
 
 from vhelpers import vstr
 
+CAPACITY = 10000
+"""Default capacity of NbForager.msgs, the oldest messages are dropped."""
+
+LEVELS = ["example", "info", "warning", "error"]
+"""Message levels."""
+
 
 class Msg:
     """Message."""
 
+    __slots__ = ("level", "name", "text")
+
     def __init__(self, level: str, name: str, text: str):
         """Initialize Message.
 
@@ -36,86 +46,102 @@ class Msg:
 
 
 class Messages:
-    """Messages. Processing info/warning/error messages."""
+    """Messages. Processing info/warning/error messages.
 
-    def __init__(self, name: str = ""):
+    The number of messages of each level is counted on adding.
+    If capacity is set, the oldest messages are dropped, the dropped messages are counted,
+    the messages that are not logged yet are logged before they are dropped.
+    If batch is set, the added messages are logged by batches.
+    """
+
+    def __init__(self, name: str = "", capacity: int = 0, batch: int = 0):
         """Initialize Messages.
 
         :param name: Default header for all messages.
+        :param capacity: Maximum number of stored messages, 0 - unlimited.
+        :param batch: Number of added messages to log together, 0 - do not log on adding.
         """
         self.name = str(name)
-        self.items: List[Msg] = []
+        self.capacity = int(capacity)
+        self.batch = int(batch)
+        self.items: Deque[Msg] = deque(maxlen=self.capacity or None)
+        self.counts: Dict[str, int] = {s: 0 for s in LEVELS}  # stored messages
+        self.dropped: Dict[str, int] = {s: 0 for s in LEVELS}  # dropped messages
+        self._unlogged = 0  # number of the last messages added after the last logging
 
     def __repr__(self) -> str:
         """__repr__."""
         name = self.__class__.__name__
         params = vstr.repr_params(
             msgs=len(self.items),
-            info=len([o for o in self.items if o.level == "info"]),
-            warning=len([o for o in self.items if o.level == "warning"]),
-            error=len([o for o in self.items if o.level == "error"]),
+            info=self.counts.get("info", 0),
+            warning=self.counts.get("warning", 0),
+            error=self.counts.get("error", 0),
+            dropped=sum(self.dropped.values()),
         )
         return f"<{name}: {params}>"
 
     def clear(self) -> None:
         """Delete all messages."""
         self.items.clear()
+        self.counts = {s: 0 for s in LEVELS}
+        self.dropped = {s: 0 for s in LEVELS}
+        self._unlogged = 0
 
     def add(self, level: str, name: str, text: str) -> None:
         """Add message to messages."""
         message = Msg(level=level, name=name, text=text)
-        self.items.append(message)
+        self._append(message)
 
     def info(self, text: str) -> None:
         """Add INFO to messages."""
         message = Msg(level="info", name=self.name, text=text)
-        self.items.append(message)
+        self._append(message)
 
     def warning(self, text: str) -> None:
         """Add WARNING to messages."""
         message = Msg(level="warning", name=self.name, text=text)
-        self.items.append(message)
+        self._append(message)
 
     def error(self, text: str) -> None:
         """Add ERROR to messages."""
         message = Msg(level="error", name=self.name, text=text)
-        self.items.append(message)
+        self._append(message)
 
     def update(self, msgs: Union[Messages, List[Messages]]) -> None:
         """Extend self with data from other Messages objects."""
         msgs = msgs if isinstance(msgs, list) else [msgs]
+        ids = {id(o) for o in self.items}
         for msg in msgs:
-            for msg_ in msg.items:
-                if msg_ not in self.items:
-                    self.items.append(msg_)
+            for msg_ in list(msg.items):
+                if id(msg_) not in ids:
+                    ids.add(id(msg_))
+                    self._append(msg_)
 
     def is_warnings(self) -> bool:
-        """Return True if messages contain an error or warning."""
-        if [o for o in self.items if o.level in ["error", "warning"]]:
-            return True
-        return False
+        """Return True if messages contain an error or warning, including dropped messages."""
+        return bool(self._count("error") or self._count("warning"))
 
     def is_error(self) -> bool:
-        """Return True if messages contain an error."""
-        if [o for o in self.items if o.level in ["error"]]:
-            return True
-        return False
+        """Return True if messages contain an error, including dropped messages."""
+        return bool(self._count("error"))
 
     def count(self) -> int:
         """Return count of messages."""
         return len(self.items)
 
+    def flush(self) -> None:
+        """Log the messages added after the last logging."""
+        unlogged = list(islice(reversed(self.items), self._unlogged))
+        for msg in reversed(unlogged):
+            _log(msg)
+        self._unlogged = 0
+
     def logging(self) -> None:
         """Log all messages."""
         for msg in self.items:
-            line = f"{msg.name}: " if msg.name else ""
-            line += f"{msg.text}"
-            try:
-                logger_o = getattr(logging, msg.level)
-            except AttributeError:
-                logger_o = getattr(logging, "warning")
-                line = f"{msg.level.upper()}: {line}"
-            logger_o(line)
+            _log(msg)
+        self._unlogged = 0
 
     def line(self) -> str:
         """Return all messages as string."""
@@ -125,3 +151,39 @@ class Messages:
         """Print all messages."""
         for msg in self.items:
             print(msg.line())
+
+    # ============================= helpers ==============================
+
+    def _append(self, msg: Msg) -> None:
+        """Add message, update counters, drop the oldest message and log the batch if needed."""
+        if self.capacity and len(self.items) >= self.capacity:
+            if self._unlogged >= len(self.items):  # the oldest message is not logged yet
+                self.flush()
+            dropped: Msg = self.items[0]  # deque drops it on append
+            self.counts[dropped.level] -= 1
+            self.dropped[dropped.level] = self.dropped.get(dropped.level, 0) + 1
+        self.items.append(msg)
+        self.counts[msg.level] = self.counts.get(msg.level, 0) + 1
+
+        self._unlogged += 1
+        if self.batch and self._unlogged >= self.batch:
+            self.flush()
+
+    def _count(self, level: str) -> int:
+        """Return count of stored and dropped messages of the level."""
+        return self.counts.get(level, 0) + self.dropped.get(level, 0)
+
+
+# ============================= helpers ==============================
+
+
+def _log(msg: Msg) -> None:
+    """Log message by the logger of its level, unknown level as warning."""
+    line = f"{msg.name}: " if msg.name else ""
+    line += f"{msg.text}"
+    try:
+        logger_o = getattr(logging, msg.level)
+    except AttributeError:
+        logger_o = getattr(logging, "warning")
+        line = f"{msg.level.upper()}: {line}"
+    logger_o(line)
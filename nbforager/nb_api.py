@@ -5,26 +5,30 @@ from __future__ import annotations
 from copy import deepcopy
 from typing import Callable
 
-from requests import Response
+from requests import Response, Session
 
 from nbforager import ami, helpers
-from nbforager.api.base_c import BaseC
+from nbforager.api.base_ac import BaseAC
+from nbforager.api.base_c import BaseC, POOL_SIZE, mount_adapter
 from nbforager.api.circuits import CircuitsAC
 from nbforager.api.connector import Connector, GConnector
 from nbforager.api.core import CoreAC
 from nbforager.api.dcim import DcimAC
+from nbforager.api.extended_get import ParamCache
 from nbforager.api.extras import ExtrasAC
 from nbforager.api.ipam import IpamAC
 from nbforager.api.plugins import PluginsAC
+from nbforager.api.scheduler import Scheduler
 from nbforager.api.status import StatusC
 from nbforager.api.tenancy import TenancyAC
 from nbforager.api.users import UsersAC
 from nbforager.api.virtualization import VirtualizationAC
 from nbforager.api.vpn import VpnAC
 from nbforager.api.wireless import WirelessAC
+from nbforager.api.worker_pool import WorkerPool
 from nbforager.constants import APPS
 from nbforager.parser.nb_parser import NbParser
-from nbforager.types import ODLStr, DAny, LDAny, LStr, LT2Str
+from nbforager.types import ODLStr, DAny, LDAny, LStr, LT2Str, ODInt
 
 
 class NbApi:
@@ -49,7 +53,7 @@ class NbApi:
     Exact parameters can be found in `Schema`_.
     """
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-locals
         self,
         host: str,
         token: str = "",
@@ -69,6 +73,13 @@ class NbApi:
         # Settings
         extended_get: bool = True,
         loners: ODLStr = None,
+        extended_get_ttl: float = 300.0,
+        extended_get_size: int = 100_000,
+        max_in_flight: int = 0,
+        endpoint_limits: ODInt = None,
+        adaptive: bool = False,
+        keyset: bool = False,
+        pool_size: int = 0,
         **kwargs,
     ):
         """Initialize NbApi.
@@ -95,7 +106,8 @@ class NbApi:
             GET parameters. Default is `2047`.
 
         :param int threads: Threads count. <=1 is loop mode, >=2 is threading mode.
-            Default is `1`.
+            The worker threads are started once and shared by all connectors,
+            use ``close()`` or the context manager to stop them. Default is `1`.
 
         :param float interval: Wait this time between the threading requests (seconds).
             Default is `0`. Useful to optimize session spikes and achieve
@@ -108,8 +120,10 @@ class NbApi:
             for scheduled scripts in cron jobs, when the connection to Netbox server is
             not stable.
 
-        :param int sleep: Interval (seconds) before the next retry after
-            session timeout reached. Default is `10`.
+        :param int sleep: Base interval (seconds) before the next retry after
+            session timeout reached or Netbox is overloaded (429, 502, 503, 504).
+            The interval is doubled with each attempt and jittered,
+            the ``Retry-After`` header is honored. Default is `10`.
 
         :param bool strict: When querying objects by tag, if there are no tags present,
             the Netbox API response returns a status_code=400.
@@ -122,6 +136,37 @@ class NbApi:
 
         :param dict loners: Set :ref:`Filtering parameters in an OR manner`.
 
+        :param float extended_get_ttl: Time to live (seconds) of the cached mapping
+            of ``{parameter}`` to ``{parameter}_id`` in extended filtering parameters.
+            The cache is shared by all connectors. ``0`` - caching is disabled.
+            Default is `300`.
+
+        :param int extended_get_size: Maximum count of the cached values of
+            extended filtering parameters. Default is `100000`.
+
+        :param int max_in_flight: Maximum count of requests in flight to the Netbox,
+            shared by all connectors (all threads of all models). ``0`` - unlimited.
+            Default is `0`.
+
+        :param dict endpoint_limits: Maximum count of requests in flight per app/model path,
+            for example ``{"ipam/prefixes/": 2}``. Default is `None`.
+
+        :param bool adaptive: True - adapt the count of requests in flight and the request rate
+            to the Netbox feedback by AIMD (additive-increase, multiplicative-decrease):
+            latency above ``timeout/2``, 502, 503, 504 halve the count of requests in flight,
+            429 halves the request rate, ``Retry-After`` pauses all requests,
+            successful responses increase them up to ``max_in_flight``. Default is `False`.
+
+        :param bool keyset: True - keyset pagination: objects are ordered by ID and the next page
+            is requested by ``id__gt`` of the last received object instead of ``offset``,
+            so the latency of deep pages does not grow on large models. In threading mode
+            the IDs are split into ranges by the minimum and maximum ID. Ignored if
+            ``offset`` or ``ordering`` is in the filtering parameters. Default is `False`.
+
+        :param int pool_size: Maximum count of the kept-alive connections to the Netbox,
+            shared by all connectors (one TLS handshake per connection, not per model).
+            ``0`` - the greatest of ``threads``, ``max_in_flight`` and ``10``. Default is `0`.
+
         Application/model connectors:
 
         :ivar obj circuits: :py:class:`.CircuitsAC` :doc:`CircuitsAC`.
@@ -134,7 +179,12 @@ class NbApi:
         :ivar obj users: :py:class:`.UsersAC` :doc:`UsersAC`.
         :ivar obj virtualization: :py:class:`.VirtualizationAC` :doc:`VirtualizationAC`.
         :ivar obj wireless: :py:class:`.WirelessAC` :doc:`WirelessAC`.
+
+        :raise TypeError: If an unknown keyword argument is passed.
         """
+        # session is shared by NbApi.copy(), cache belongs to NbForager
+        if unknown := sorted(set(kwargs).difference(["cache", "session"])):
+            raise TypeError(f"{unknown=} unexpected keyword arguments.")
         params: DAny = {
             "host": host,
             "token": token,
@@ -151,9 +201,32 @@ class NbApi:
             "strict": strict,
             "extended_get": extended_get,
             "loners": loners,
+            "extended_get_ttl": extended_get_ttl,
+            "extended_get_size": extended_get_size,
+            "max_in_flight": max_in_flight,
+            "endpoint_limits": endpoint_limits,
+            "adaptive": adaptive,
+            "keyset": keyset,
+            "pool_size": pool_size,
             **kwargs,
         }
         self._base_c = BaseC(**params)
+        self.session: Session = self._base_c._session
+        params["session"] = self.session
+        self.param_cache = ParamCache(
+            ttl=self._base_c.extended_get_ttl,
+            size=self._base_c.extended_get_size,
+        )
+        params["param_cache"] = self.param_cache
+        self.scheduler = Scheduler(
+            max_in_flight=self._base_c.max_in_flight,
+            endpoint_limits=self._base_c.endpoint_limits,
+            adaptive=self._base_c.adaptive,
+            latency_limit=self._base_c.timeout / 2,
+        )
+        params["scheduler"] = self.scheduler
+        self.pool = WorkerPool(threads=self._base_c.threads)
+        params["pool"] = self.pool
         # app/model
         self.circuits = CircuitsAC(**params)
         self.core = CoreAC(**params)
@@ -172,6 +245,17 @@ class NbApi:
         """__repr__."""
         return repr(self._base_c)
 
+    def __enter__(self) -> NbApi:
+        """Enter the runtime context.
+
+        :return: NbApi object.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Exit the runtime context, stop the worker threads, close the connections."""
+        self.close()
+
     def __copy__(self) -> NbApi:
         """Create a duplicate of the object.
 
@@ -194,6 +278,14 @@ class NbApi:
             strict=base_c.strict,
             extended_get=base_c.extended_get,
             loners=base_c.loners,
+            extended_get_ttl=base_c.extended_get_ttl,
+            extended_get_size=base_c.extended_get_size,
+            max_in_flight=base_c.max_in_flight,
+            endpoint_limits=base_c.endpoint_limits,
+            adaptive=base_c.adaptive,
+            keyset=base_c.keyset,
+            pool_size=base_c.pool_size,
+            session=self.session,
         )
 
     # ============================= property =============================
@@ -227,11 +319,13 @@ class NbApi:
         :return: None. Updates threads in all connectors.
         """
         self._base_c.threads = threads
+        self.pool.resize(self._base_c.threads)
+        if not self._base_c.pool_size:
+            pool_size = max(self._base_c.threads, self._base_c.max_in_flight, POOL_SIZE)
+            mount_adapter(self.session, pool_size)
         for app in self.apps():
-            models: LStr = [s for s in dir(getattr(self, app)) if s[0].islower()]
-            for model in models:
-                connector = self.connector_by_path(f"{app}/{model}")
-                setattr(connector, "threads", threads)
+            connectors: BaseAC = getattr(self, app)
+            connectors._update(threads=self._base_c.threads)  # pylint: disable=W0212
 
     # ============================= methods ==============================
 
@@ -273,6 +367,16 @@ class NbApi:
                 app_paths.append(path)
         return app_paths
 
+    def close(self) -> None:
+        """Stop the worker threads and close the connections shared by all connectors.
+
+        The worker threads and connections are started again on the next request.
+
+        :return: None. Update self object.
+        """
+        self.pool.shutdown()
+        self.session.close()
+
     def connector_by_path(self, path: str) -> Connector:
         """Get Connector instance by app/model path.
 
@@ -320,6 +424,14 @@ class NbApi:
             "strict": base_c.strict,
             "extended_get": base_c.extended_get,
             "loners": deepcopy(base_c.loners),
+            "extended_get_ttl": base_c.extended_get_ttl,
+            "extended_get_size": base_c.extended_get_size,
+            "max_in_flight": base_c.max_in_flight,
+            "endpoint_limits": dict(base_c.endpoint_limits),
+            "adaptive": base_c.adaptive,
+            "keyset": base_c.keyset,
+            "pool_size": base_c.pool_size,
+            "session": self.session,
         }
         params.update(kwargs)
         return type(self)(**params)
@@ -7,16 +7,19 @@ import logging
 from copy import deepcopy
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 
+from netports import SwVersion
 from vhelpers import vstr
 
-from nbforager import nb_tree
+from nbforager import messages, nb_tree
 from nbforager.foragers.circuits import CircuitsAF
 from nbforager.foragers.core import CoreAF
 from nbforager.foragers.dcim import DcimAF
 from nbforager.foragers.extras import ExtrasAF
+from nbforager.foragers.forager import Forager
 from nbforager.foragers.ipam import IpamAF
-from nbforager.foragers.joiner import Joiner
+from nbforager.foragers.joiner import Joiner, JoinIndex
 from nbforager.foragers.tenancy import TenancyAF
 from nbforager.foragers.users import UsersAF
 from nbforager.foragers.virtualization import VirtualizationAF
@@ -27,7 +30,9 @@ from nbforager.nb_api import NbApi
 from nbforager.nb_cache import NbCache
 from nbforager.nb_tree import NbTree
 from nbforager.parser.nb_value import NbValue
-from nbforager.types import LStr, DAny, DiDAny, ODLStr
+from nbforager.api.connector import Connector
+from nbforager.types import LStr, DAny, DiDAny, ODLStr, ODInt, LDAny, DLInt, DStr, SStr
+from nbforager.types import ST3StrInt, OST3StrInt
 
 
 class NbForager:
@@ -38,7 +43,7 @@ class NbForager:
     - Read/write objects from/to the cache pickle file,
     """
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-locals
         self,
         host: str,
         token: str = "",
@@ -57,6 +62,13 @@ class NbForager:
         # Settings
         extended_get: bool = True,
         loners: ODLStr = None,
+        extended_get_ttl: float = 300.0,
+        extended_get_size: int = 100_000,
+        max_in_flight: int = 0,
+        endpoint_limits: ODInt = None,
+        adaptive: bool = False,
+        keyset: bool = False,
+        pool_size: int = 0,
         cache: str = "",
         **kwargs,
     ):
@@ -90,7 +102,8 @@ class NbForager:
             GET parameters. Default is `2047`.
 
         :param int threads: Threads count. <=1 is loop mode, >=2 is threading mode.
-            Default is `1`.
+            The worker threads are started once and shared by all connectors,
+            use ``close()`` or the context manager to stop them. Default is `1`.
 
         :param float interval: Wait this time between the threading requests (seconds).
             Default is `0`. Useful to optimize session spikes and achieve
@@ -103,8 +116,10 @@ class NbForager:
             for scheduled scripts in cron jobs, when the connection to Netbox server is
             not stable.
 
-        :param int sleep: Interval (seconds) before the next retry after
-            session timeout reached. Default is `10`.
+        :param int sleep: Base interval (seconds) before the next retry after
+            session timeout reached or Netbox is overloaded (429, 502, 503, 504).
+            The interval is doubled with each attempt and jittered,
+            the ``Retry-After`` header is honored. Default is `10`.
 
         :param bool strict: When querying objects by tag, if there are no tags present,
             the Netbox API response returns a status_code=400.
@@ -117,6 +132,36 @@ class NbForager:
 
         :param dict loners: Set :ref:`Filtering parameters in an OR manner`.
 
+        :param float extended_get_ttl: Time to live (seconds) of the cached mapping
+            of ``{parameter}`` to ``{parameter}_id`` in extended filtering parameters.
+            ``0`` - caching is disabled. Default is `300`.
+
+        :param int extended_get_size: Maximum count of the cached values of
+            extended filtering parameters. Default is `100000`.
+
+        :param int max_in_flight: Maximum count of requests in flight to the Netbox,
+            shared by all connectors (all threads of all models). ``0`` - unlimited.
+            Default is `0`.
+
+        :param dict endpoint_limits: Maximum count of requests in flight per app/model path,
+            for example ``{"ipam/prefixes/": 2}``. Default is `None`.
+
+        :param bool adaptive: True - adapt the count of requests in flight and the request rate
+            to the Netbox feedback by AIMD (additive-increase, multiplicative-decrease):
+            latency above ``timeout/2``, 502, 503, 504 halve the count of requests in flight,
+            429 halves the request rate, ``Retry-After`` pauses all requests,
+            successful responses increase them up to ``max_in_flight``. Default is `False`.
+
+        :param bool keyset: True - keyset pagination: objects are ordered by ID and the next page
+            is requested by ``id__gt`` of the last received object instead of ``offset``,
+            so the latency of deep pages does not grow on large models. In threading mode
+            the IDs are split into ranges by the minimum and maximum ID. Ignored if
+            ``offset`` or ``ordering`` is in the filtering parameters. Default is `False`.
+
+        :param int pool_size: Maximum count of the kept-alive connections to the Netbox,
+            shared by all connectors (one TLS handshake per connection, not per model).
+            ``0`` - the greatest of ``threads``, ``max_in_flight`` and ``10``. Default is `0`.
+
         Data attributes:
 
         :ivar obj root: :py:class:`NbTree` object that holds raw Netbox objects.
@@ -135,6 +180,8 @@ class NbForager:
         :ivar obj users: :py:class:`.UsersAF` :doc:`UsersAF`.
         :ivar obj virtualization: :py:class:`.VirtualizationAF` :doc:`VirtualizationAF`.
         :ivar obj wireless: :py:class:`.WirelessAF` :doc:`WirelessAF`.
+
+        :raise TypeError: If an unknown keyword argument is passed.
         """
         kwargs = {
             "host": host,
@@ -152,16 +199,24 @@ class NbForager:
             "strict": strict,
             "extended_get": extended_get,
             "loners": loners,
+            "extended_get_ttl": extended_get_ttl,
+            "extended_get_size": extended_get_size,
+            "max_in_flight": max_in_flight,
+            "endpoint_limits": endpoint_limits,
+            "adaptive": adaptive,
+            "keyset": keyset,
+            "pool_size": pool_size,
             **kwargs,
         }
         # data
         self.root: NbTree = NbTree()  # original data
         self.tree: NbTree = NbTree()  # data with joined objects within itself
+        self._join_index: Optional[JoinIndex] = None  # links in the tree, for join_tree(keys)
         self.status: DAny = {}  # updated Netbox status data
 
         self.api = NbApi(**kwargs)
         self.cache: str = make_cache_path(cache, **kwargs)
-        self.msgs = Messages(name=self.api.host)
+        self.msgs = Messages(name=self.api.host, capacity=messages.CAPACITY)
 
         # application foragers
         self.circuits = CircuitsAF(self.api, self.root, self.tree)
@@ -183,6 +238,17 @@ class NbForager:
         name = self.__class__.__name__
         return f"<{name}: {params}>"
 
+    def __enter__(self) -> NbForager:
+        """Enter the runtime context.
+
+        :return: NbForager object.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Exit the runtime context, stop the worker threads, close the connections."""
+        self.close()
+
     def __copy__(self) -> NbForager:
         """Copy NbForager.root and tree objects.
 
@@ -236,6 +302,27 @@ class NbForager:
         if tree:
             self.tree.clear()
 
+    def close(self) -> None:
+        """Stop the worker threads and close the connections shared by all connectors.
+
+        :return: None. Update self object.
+        """
+        self.api.close()
+
+    def complete(self) -> None:
+        """Replace partial objects in NbForager.root with the complete objects from Netbox.
+
+        Partial objects are requested with ``fields``, ``exclude`` or ``brief`` parameters.
+        The complete objects of each model are requested in one ``id`` query,
+        sliced by the URL length.
+
+        :return: None. Update NbForager.root.
+        """
+        for path in nb_tree.partial_ids(self.root):
+            app, model = path.split("/")
+            forager: Forager = getattr(getattr(self, app), model)
+            forager.complete()
+
     def copy(self) -> NbForager:
         """Copy data in the NbForager.root and NbForager.tree.
 
@@ -273,6 +360,10 @@ class NbForager:
         dcim: bool = False,
         ipam: bool = False,
         ipam_prefixes: bool = False,
+        ipam_all: bool = False,
+        complete: bool = False,
+        keys: OST3StrInt = None,
+        inplace: bool = False,
     ) -> None:
         """Assemble Netbox objects in NbForager.tree within itself.
 
@@ -301,7 +392,7 @@ class NbForager:
 
         :param ipam: True - Create additional keys to represent Netbox ipam objects.
 
-            In ipam.aggregate, ipam.prefixes, ipam.ip_addresses:
+            In ipam.aggregate, ipam.prefixes, ipam.ip_addresses of IPv4 global table:
 
             - ``_ipv4`` IPv4 object
             - ``_aggregate`` Aggregate data for ipam.prefixes and ipam.ip_addresses
@@ -311,18 +402,59 @@ class NbForager:
 
         :param ipam_prefixes: True - Join only ipam/prefixes, skip ipam/ip-addresses.
 
+        :param ipam_all: True - Join ipam objects of IPv4 and IPv6, each VRF has its own
+            hierarchy of prefixes and ip-addresses (``_ipv4`` only for IPv4 family),
+            see ``Joiner.join_ipam()``. False - Join only IPv4 objects of the global table
+            (without VRF), see ``Joiner.join_ipam_ipv4()``. Default is `False`.
+
+        :param complete: True - Request the complete objects from Netbox instead of
+            the partial objects before joining, see ``complete()``.
+
+        :param keys: The app, model, id of the objects changed in NbForager.root since the last
+            join, returned by ``sync()``. Only these objects and the objects linked to them are
+            copied and joined again in NbForager.tree, without copying the whole root.
+            The linked objects and the nested copies are found by the indexes of NbForager.tree,
+            built on the first join with keys and updated on each next one.
+            Use the same dcim, ipam, ipam_prefixes, ipam_all values as in the last join.
+            None - join all objects.
+
+        :param inplace: True - Join the objects of NbForager.root without copying,
+            NbForager.root and NbForager.tree share the same joined objects.
+            Peak memory is about 1x of the data size, but NbForager.root is changed.
+            False - Join a copy of NbForager.root, NbForager.root is not changed.
+            Default is `False`.
+
         :return: None. Update NbForager.tree with the joined Netbox objects.
         """
-        tree: NbTree = deepcopy(self.root)
+        if complete:
+            self.complete()
+        if keys is not None and self.tree.count():
+            self._join_tree_keys(
+                keys=keys, dcim=dcim, ipam=ipam, ipam_prefixes=ipam_prefixes, ipam_all=ipam_all
+            )
+            return
+
+        # release the previously joined objects replaced by root before copying,
+        # keep the other objects in the tree
+        for app in self.root.apps():
+            for model in getattr(self.root, app).models():
+                tree_d: DiDAny = getattr(getattr(self.tree, app), model)
+                for idx in getattr(getattr(self.root, app), model):
+                    tree_d.pop(idx, None)
+        self._join_index = None
+        tree: NbTree = self.root if inplace else deepcopy(self.root)
         Joiner(tree).init_extra_keys()
-        tree = nb_tree.join_tree(tree)
+        tree = nb_tree.join_tree(tree, copy=False)
         nb_tree.insert_tree(src=tree, dst=self.tree)
 
         joiner = Joiner(self.tree)
         if dcim:
             joiner.join_dcim_devices()
-        if ipam or ipam_prefixes:
+        if ipam_all and (ipam or ipam_prefixes):
+            joiner.join_ipam(ipam=ipam, ipam_prefixes=ipam_prefixes)
+        elif ipam or ipam_prefixes:
             joiner.join_ipam_ipv4(ipam=ipam, ipam_prefixes=ipam_prefixes)
+        self.tree.invalidate()  # extra keys
 
     def read_cache(self) -> None:
         """Read cached data from a pickle file.
@@ -335,6 +467,68 @@ class NbForager:
         tree, status = cache.read_cache()
         nb_tree.insert_tree(src=tree, dst=self.root)
         self.status = status
+        for path in dict(status.get("meta") or {}).get("models") or []:
+            app, model = path.split("/")
+            getattr(self.root, app).mark_requested(model)
+
+    def sync(self, since: str = "") -> ST3StrInt:
+        """Apply the changes made in Netbox since the last data retrieval to NbForager.root.
+
+        Read the changelog ``core/object-changes`` (``extras/object-changes`` in Netbox < v4.1)
+        since the ``write_time`` saved by ``write_cache()`` in ``status["meta"]``.
+        Only the models requested by ``get()`` or present in the NbForager.root are synchronized.
+        Deleted objects are removed, created and updated objects are requested by ``id``,
+        one query per model, sliced by the URL length.
+        Use ``join_tree(keys=...)`` after ``sync()`` to update NbForager.tree.
+
+        :param since: UTC time in format "YYYY-MM-DD hh:mm:ss" to read the changelog from.
+            Default is ``status["meta"]["write_time"]``.
+
+        :return: The app, model, id of the changed objects.
+            Update NbForager.root and ``status["meta"]["write_time"]``.
+
+        :raises ValueError: If the time to read the changelog from is not defined.
+
+        :example:
+            nbf = NbForager(host="netbox", token="***")
+            nbf.read_cache()
+            keys = nbf.sync()
+            nbf.write_cache()
+            nbf.join_tree(keys=keys)
+        """
+        meta: DAny = dict(self.status.get("meta") or {})
+        since = since or str(meta.get("write_time") or "")
+        if not since:
+            raise ValueError("Time of the last data retrieval is not defined, use read_cache().")
+        sync_time = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+
+        if not self.status.get("netbox-version"):
+            self.get_status()
+        connector: Connector = self.api.core.object_changes
+        if SwVersion(self.version()) < SwVersion("4.1"):
+            connector = self.api.extras.object_changes
+        changes: LDAny = connector.get(time_after=since)
+
+        updated_ids, deleted_ids = self._changed_ids(changes)
+        for path, ids in deleted_ids.items():
+            app, model = path.split("/")
+            data: DiDAny = getattr(getattr(self.root, app), model)
+            for idx in ids:
+                data.pop(idx, None)
+            getattr(self.root, app).invalidate(model)
+        for path, ids in updated_ids.items():
+            app, model = path.split("/")
+            forager: Forager = getattr(getattr(self, app), model)
+            # noinspection PyProtectedMember
+            forager._reload_root_data(ids=ids)  # pylint: disable=protected-access
+
+        self.status["meta"] = {**meta, "write_time": sync_time}
+        keys: ST3StrInt = set()
+        for ids_d in [updated_ids, deleted_ids]:
+            for path, ids in ids_d.items():
+                app, model = path.split("/")
+                keys.update((app, model, i) for i in ids)
+        return keys
 
     def write_cache(self) -> None:
         """Write NbForager.root and NbForager.status to a pickle file.
@@ -346,6 +540,7 @@ class NbForager:
             "host": self.api.host,
             "url": self.api.url,
             "write_time": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S"),
+            "models": self._requested_paths(),
         }
 
         cache = NbCache(tree=self.root, status=status, cache=self.cache)
@@ -363,6 +558,78 @@ class NbForager:
 
     # =========================== data methods ===========================
 
+    def _join_tree_keys(self, keys: ST3StrInt, **kwargs) -> None:
+        """Join only the changed objects and the objects linked to them in NbForager.tree.
+
+        :param keys: The app, model, id of the changed objects.
+        :param kwargs: dcim, ipam, ipam_prefixes, ipam_all parameters of join_tree().
+
+        :return: None. Update NbForager.tree.
+        """
+        joiner = Joiner(self.tree, index=self._join_index)
+        affected: ST3StrInt = joiner.affected_keys(keys)  # links of the old objects
+        urls: SStr = {str(d["url"]) for d in self._tree_objects(keys)}
+
+        copied: NbTree = nb_tree.copy_objects(src=self.root, dst=self.tree, keys=keys)
+        Joiner(copied).init_extra_keys()
+        joiner.index.update(tree=self.tree, keys=keys)
+        affected.update(joiner.affected_keys(keys))  # links of the new objects
+        joiner.join_keys(keys=affected, **kwargs)
+
+        urls.update(str(d["url"]) for d in self._tree_objects(affected))
+        referrers: ST3StrInt = joiner.index.nested_keys(urls)
+        nb_tree.rejoin_urls(tree=self.tree, root=self.root, urls=urls, keys=referrers)
+        self._join_index = joiner.index
+
+    def _tree_objects(self, keys: ST3StrInt) -> LDAny:
+        """Get the objects of the keys present in NbForager.tree."""
+        objects: LDAny = []
+        for app, model, idx in keys:
+            if data := getattr(getattr(self.tree, app), model).get(idx):
+                objects.append(data)
+        return objects
+
+    def _changed_ids(self, changes: LDAny) -> Tuple[DLInt, DLInt]:
+        """Group IDs of the changed objects by app/model and the last action.
+
+        Changes of models that have not been requested are skipped.
+
+        :param changes: Netbox object-changes.
+
+        :return: IDs of created/updated objects and IDs of deleted objects by app/model path.
+        """
+        actions: Dict[Tuple[str, int], str] = {}
+        requested: SStr = set(self._requested_paths())
+        paths: DStr = {}
+        for change in sorted(changes, key=lambda d: (str(d.get("time")), int(d["id"]))):
+            object_type = str(change.get("changed_object_type") or "")
+            if object_type not in paths:
+                try:
+                    app, model = nb_tree.object_type_to_am(object_type)
+                except (AttributeError, ValueError):
+                    app, model = "", ""
+                path = f"{app}/{model}"
+                paths[object_type] = path if path in requested else ""
+            if path := paths[object_type]:
+                action = change.get("action") or {}
+                if isinstance(action, dict):
+                    action = action.get("value")
+                actions[(path, int(change["changed_object_id"]))] = str(action)
+
+        updated_ids: DLInt = {}
+        deleted_ids: DLInt = {}
+        for (path, idx), action in actions.items():
+            ids_d = deleted_ids if action == "delete" else updated_ids
+            ids_d.setdefault(path, []).append(idx)
+        return updated_ids, deleted_ids
+
+    def _requested_paths(self) -> LStr:
+        """Get app/model paths of the models requested from the Netbox or having objects."""
+        paths: LStr = []
+        for app in self.root.apps():
+            paths.extend(f"{app}/{s}" for s in getattr(self.root, app).requested())
+        return paths
+
     def _devices_primary_ip4(self) -> LStr:
         """Return the primary IPv4 addresses of Netbox devices with these settings.
 
@@ -2,18 +2,34 @@
 
 import logging
 from copy import deepcopy
-from typing import Optional
+from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from vhelpers import vstr
 
 from nbforager import ami
-from nbforager.types import DiDAny, LStr, DAny, T2Str
+from nbforager.parser import nb_parser
+from nbforager.parser.nb_parser import NbPredicate
+from nbforager.types import DiDAny, LStr, DAny, T2Str, DLInt, LDAny, SStr, ST3StrInt, LInt
+
+
+class Indexes(dict):
+    """Hash indexes of the model objects, built on demand, not copied with the tree.
+
+    Model: Indexes[model] = (model dictionary, number of objects, objects, {key: index}).
+    """
+
+    def __deepcopy__(self, memo) -> "Indexes":
+        """Skip indexes in the copy of the tree, the copy builds its own."""
+        return Indexes()
 
 
 class BaseTree(BaseModel):
     """Base for NbTree models."""
 
+    _indexes = PrivateAttr(default_factory=Indexes)
+    _requested: SStr = PrivateAttr(default_factory=set)
+
     def __repr__(self):
         """__repr__."""
         class_ = self.__class__.__name__
@@ -24,11 +40,100 @@ class BaseTree(BaseModel):
         """Clear all data in all models."""
         for model in self.models():
             getattr(self, model).clear()
+        self.invalidate()
+        self._requested.clear()
 
     def count(self) -> int:
         """Count the number of Netbox objects for all models."""
         return sum(len(getattr(self, s)) for s in self.models())
 
+    def find(
+        self,
+        model: str,
+        predicate: Optional[NbPredicate] = None,
+        indexed: bool = False,
+        **kwargs,
+    ) -> LDAny:
+        """Find Netbox objects in the model by extended finding parameters.
+
+        :param model: Model name.
+        :param predicate: Compiled extended finding parameters, joined with kwargs by ``AND``.
+        :param indexed: True - the first parameter with hashable values is looked up
+            in the hash index of the model, the index is built on the first request
+            of the parameter. The other parameters filter the found objects.
+            The index is rebuilt if the model dictionary is replaced or the number
+            of objects is changed. If a value of the object is changed in place,
+            call ``invalidate()``, otherwise the object can be missed.
+            False - check all objects of the model. Default is `False`.
+        :param kwargs: Extended filtering parameters, see ``nb_parser.find_objects()``.
+
+        :return: Filtered Netbox objects.
+
+        :example:
+            NbTree().dcim.find("devices", site__slug="SITE1") -> [{"id": 1, ...}]
+        """
+        model_d: DiDAny = getattr(self, model)
+        if kwargs:
+            predicate_ = NbPredicate(**kwargs)
+            predicate = predicate_ if predicate is None else predicate & predicate_
+        if predicate is None:
+            return list(model_d.values())
+        if not indexed:
+            return predicate.filter(model_d.values())
+
+        model_d_, count, objects, indexes = self._indexes.get(model, (None, 0, [], {}))
+        if model_d_ is not model_d or count != len(model_d):
+            objects, indexes = list(model_d.values()), {}
+            self._indexes[model] = (model_d, len(model_d), objects, indexes)
+
+        for key, values in predicate.terms:
+            if not isinstance(values, frozenset):
+                continue
+            if key not in indexes:
+                indexes[key] = nb_parser.index_objects(objects=objects, key=key)
+            if (index := indexes[key]) is None:
+                continue
+
+            positions: LInt = [i for s in values for i in index.get(s, [])]
+            if len(values) > 1:
+                positions = sorted(set(positions))
+            # objects replaced in the model after the index is built
+            candidates = (model_d.get(objects[i].get("id")) for i in positions)
+            return predicate.filter(d for d in candidates if d is not None)
+
+        return predicate.filter(model_d.values())
+
+    def invalidate(self, model: str = "") -> None:
+        """Drop the hash indexes after the objects have been changed.
+
+        :param model: Model name, drop the indexes of all models by default.
+
+        :return: None. Update self object.
+        """
+        if model:
+            self._indexes.pop(model, None)
+        else:
+            self._indexes.clear()
+
+    def mark_requested(self, model: str) -> None:
+        """Mark the model as requested from the Netbox, even if no objects are received.
+
+        :param model: Model name.
+
+        :return: None. Update self object.
+        """
+        self._requested.add(model)
+
+    def requested(self) -> LStr:
+        """Get the names of the models requested from the Netbox or having objects.
+
+        :return: Model names.
+
+        :example:
+            NbTree().ipam.requested() -> ["prefixes", "vrfs"]
+        """
+        return [s for s in self.models() if s in self._requested or getattr(self, s)]
+
     def models(self) -> LStr:
         """Get all application model names.
 
@@ -276,6 +381,11 @@ class NbTree(BaseModel):
         """Count the number of Netbox objects for all models."""
         return sum(getattr(self, s).count() for s in self.apps())
 
+    def invalidate(self) -> None:
+        """Drop the hash indexes of all models after the objects have been changed."""
+        for app in self.apps():
+            getattr(self, app).invalidate()
+
 
 ONbTree = Optional[NbTree]
 
@@ -293,36 +403,128 @@ def insert_tree(src: NbTree, dst: NbTree) -> None:
             src_d: dict = getattr(getattr(src, app), model)
             dst_d: dict = getattr(getattr(dst, app), model)
             dst_d.update(src_d)
+    dst.invalidate()
 
 
-def join_tree(tree: NbTree) -> NbTree:
+def join_tree(tree: NbTree, copy: bool = True) -> NbTree:
     """Assemble Netbox objects in the tree within itself.
 
     The Netbox objects are represented as a multidimensional dictionary.
     :param tree: NbTree object to join the data in.
+    :param copy: True - join the data in a copy of the tree, the source tree is not changed.
+        False - join the data in the source tree, without the memory for the copy.
 
     :return: NbTree object with the joined data.
     """
-    tree = deepcopy(tree)
-    for app in tree.apps():  # pylint: disable=R1702
+    if copy:
+        tree = deepcopy(tree)
+    for app in tree.apps():
         for model in getattr(tree, app).models():
             objects_d = getattr(getattr(tree, app), model)
             for _, parent in objects_d.items():
-                for key, child in parent.items():
-                    if isinstance(child, dict):
-                        if child_full := _get_child(child=child, tree=tree):
-                            parent[key].clear()
-                            parent[key].update(child_full)
-                    elif isinstance(child, list):
-                        for child_ in child:
-                            if not isinstance(child_, dict):
-                                continue
-                            if child_full := _get_child(child=child_, tree=tree):
-                                child_.clear()
-                                child_.update(child_full)
+                _join_object(parent=parent, tree=tree)
+    tree.invalidate()
     return tree
 
 
+def copy_objects(src: NbTree, dst: NbTree, keys: ST3StrInt) -> NbTree:
+    """Copy the changed objects from the source tree to the joined destination tree.
+
+    The updated objects are replaced in place, to keep the links to them in the other objects.
+    The objects absent in the source tree are deleted from the destination tree.
+    The nested objects of the copied objects are joined with the destination tree.
+
+    :param src: The source tree (NbForager.root) with the changed objects.
+    :param dst: The destination tree (NbForager.tree) with the joined objects.
+    :param keys: The app, model, id of the changed objects.
+
+    :return: NbTree with the copied objects, the same dictionaries as in the destination tree.
+    """
+    copied = NbTree()
+    for app, model, idx in sorted(keys):
+        src_d: DiDAny = getattr(getattr(src, app), model)
+        dst_d: DiDAny = getattr(getattr(dst, app), model)
+        if idx not in src_d:
+            dst_d.pop(idx, None)
+            continue
+        data: DAny = deepcopy(src_d[idx])
+        if idx in dst_d:
+            dst_d[idx].clear()
+            dst_d[idx].update(data)
+        else:
+            dst_d[idx] = data
+        getattr(getattr(copied, app), model)[idx] = dst_d[idx]
+
+    for app in copied.apps():
+        for model in getattr(copied, app).models():
+            for parent in getattr(getattr(copied, app), model).values():
+                _join_object(parent=parent, tree=dst)
+    dst.invalidate()
+    return copied
+
+
+def rejoin_urls(tree: NbTree, root: NbTree, urls: SStr, keys: Optional[ST3StrInt] = None) -> None:
+    """Update the nested objects with the URLs in the joined tree, after these objects are changed.
+
+    The nested objects of the deleted objects are restored from the source tree.
+
+    :param tree: NbTree object with the joined data (NbForager.tree).
+    :param root: NbTree object with the source data (NbForager.root).
+    :param urls: URLs of the changed objects.
+    :param keys: The app, model, id of the objects with the nested objects of the URLs,
+        see ``JoinIndex.referrers()``. None - check all objects of the tree.
+
+    :return: None. Update the nested objects in the tree.
+    """
+    if not urls:
+        return
+    for app, model, idx in object_keys(tree) if keys is None else keys:
+        parent: DAny = getattr(getattr(tree, app), model).get(idx) or {}
+        root_d: DiDAny = getattr(getattr(root, app), model)
+        for key, child in parent.items():
+            if key.startswith("_"):
+                continue  # extra keys are linked by Joiner
+            children: LDAny = child if isinstance(child, list) else [child]
+            for position, child_ in enumerate(children):
+                if isinstance(child_, dict):
+                    _rejoin_child(
+                        child=child_,
+                        tree=tree,
+                        urls=urls,
+                        root_child=root_d.get(idx, {}).get(key),
+                        position=position,
+                    )
+    tree.invalidate()
+
+
+def _rejoin_child(child: DAny, tree: NbTree, urls: SStr, root_child: Any, position: int) -> None:
+    """Update the nested object if its URL is changed, restore the deleted one from the root.
+
+    :param child: Nested object in the joined tree.
+    :param tree: NbTree object with the joined data.
+    :param urls: URLs of the changed objects.
+    :param root_child: Nested object (or list of objects) in the source tree.
+    :param position: Position of the nested object in the list.
+
+    :return: None. Update the nested object.
+    """
+    object_ = child.get("object")
+    if isinstance(object_, dict) and object_.get("url") in urls:
+        _get_child(child=child, tree=tree)  # update generic object
+        return
+    if child.get("url") not in urls:
+        return
+    child_full = _get_child(child=child, tree=tree)
+    if child_full is child:
+        return
+    if not child_full:
+        if isinstance(root_child, list):
+            root_child = (root_child[position:] or [{}])[0]
+        child_full = deepcopy(root_child or {})
+    child.clear()
+    child.update(child_full)
+
+
 def missed_urls(urls: LStr, tree: NbTree) -> LStr:
     """Return URLs of objects that are missing from the tree.
 
@@ -349,6 +551,42 @@ def missed_urls(urls: LStr, tree: NbTree) -> LStr:
     return urls_
 
 
+def object_keys(tree: NbTree) -> ST3StrInt:
+    """Get the keys of all objects in the tree.
+
+    :param tree: NbTree object.
+
+    :return: The app, model, id of the objects.
+
+    :example:
+        object_keys(tree) -> {("ipam", "vrfs", 1), ("dcim", "devices", 1)}
+    """
+    keys: ST3StrInt = set()
+    for app in tree.apps():
+        for model in getattr(tree, app).models():
+            keys.update((app, model, i) for i in getattr(getattr(tree, app), model))
+    return keys
+
+
+def partial_ids(tree: NbTree) -> DLInt:
+    """Return IDs of partial objects in the tree (requested with projection or brief).
+
+    :param tree: NbTree object to check objects inside.
+
+    :return: IDs of partial objects by app/model path.
+
+    :example:
+        partial_ids(tree) -> {"dcim/devices": [1, 2]}
+    """
+    ids_d: DLInt = {}
+    for app in tree.apps():
+        for model in getattr(tree, app).models():
+            data: DiDAny = getattr(getattr(tree, app), model)
+            if ids := [i for i, d in data.items() if d.get("_partial")]:
+                ids_d[f"{app}/{model}"] = ids
+    return ids_d
+
+
 def object_type_to_am(object_type: str, path: bool = False) -> T2Str:
     """Convert object_type value (used in extras/changelog) to app/model values.
 
@@ -386,6 +624,28 @@ def object_type_to_am(object_type: str, path: bool = False) -> T2Str:
 # ============================= helpers ==============================
 
 
+def _join_object(parent: DAny, tree: NbTree) -> None:
+    """Replace the nested objects in the parent with the full objects from the tree.
+
+    :param parent: Netbox object that requires a dependency update.
+    :param tree: NbTree object, contains model data (Netbox objects).
+
+    :return: None. Update the parent object.
+    """
+    for key, child in parent.items():
+        if isinstance(child, dict):
+            if child_full := _get_child(child=child, tree=tree):
+                parent[key].clear()
+                parent[key].update(child_full)
+        elif isinstance(child, list):
+            for child_ in child:
+                if not isinstance(child_, dict):
+                    continue
+                if child_full := _get_child(child=child_, tree=tree):
+                    child_.clear()
+                    child_.update(child_full)
+
+
 def _get_child(child: DAny, tree: NbTree) -> DAny:
     """Search for a child Netbox object in the model data to insert or replace it in the parent.
 
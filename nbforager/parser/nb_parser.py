@@ -2,10 +2,10 @@
 
 import logging
 from functools import wraps
-from typing import Any, Type, Dict, List, Tuple
+from typing import Any, Callable, Type, Dict, Iterable, List, Optional, Tuple
 
 from netports import SwVersion
-from vhelpers import vstr, vlist
+from vhelpers import vstr
 
 from nbforager.exceptions import NbParserError, NbVersionError
 from nbforager.types import DAny, Int, Str, LDAny, TLists, SeqUIntStr, ODAny, LT3Str, LStr
@@ -52,6 +52,9 @@ DEPRECATED_TYPES: List[Tuple[str, LStr, Type]] = [
 ]
 """Types deprecated in Netbox v4.2."""
 
+_DEPRECATED_BY_PATH: Dict[str, Tuple[LT3Str, List[Tuple[str, LStr, Type]]]] = {}
+_OLD_VERSIONS: Dict[str, bool] = {}
+
 
 def check_strict(method):
     """Wrap method to check value.
@@ -123,9 +126,12 @@ class NbParser:
             Designed for compatibility with different versions.
         :type version: str
         """
-        self.data = _init_data(data)
         self.strict = strict
         self.version = str(kwargs.get("version") or "")
+        self.data: DAny = {}
+        self._deprecated_models: LT3Str = []
+        self._deprecated_types: List[Tuple[str, LStr, Type]] = []
+        self._set_data(data)
 
     def __repr__(self):
         """__repr__."""
@@ -162,9 +168,9 @@ class NbParser:
         :return: Boolean value or False if the value is absent.
         :rtype: bool
         """
-        first_key = keys[0]
-        self._raise_deprecated_key(first_key)
-        self._raise_deprecated_type(keys=list(keys), type_req=bool)
+        if self._deprecated_models or self._deprecated_types:
+            self._raise_deprecated_key(keys[0])
+            self._raise_deprecated_type(keys=list(keys), type_req=bool)
         return self._get_keys(type_=bool, keys=keys)
 
     def dict(self, *keys) -> Dict:
@@ -177,9 +183,9 @@ class NbParser:
 
         :raise NbParserError: If strict=True and the value is not a dictionary or key is absent.
         """
-        first_key = keys[0]
-        self._raise_deprecated_key(first_key)
-        self._raise_deprecated_type(keys=list(keys), type_req=dict)
+        if self._deprecated_models or self._deprecated_types:
+            self._raise_deprecated_key(keys[0])
+            self._raise_deprecated_type(keys=list(keys), type_req=dict)
         return self._get_keys(type_=dict, keys=keys)
 
     def float(self, *keys) -> float:
@@ -192,9 +198,9 @@ class NbParser:
 
         :raise NbParserError: If strict=True and the value is not a digit or key is absent.
         """
-        first_key = keys[0]
-        self._raise_deprecated_key(first_key)
-        self._raise_deprecated_type(keys=list(keys), type_req=float)
+        if self._deprecated_models or self._deprecated_types:
+            self._raise_deprecated_key(keys[0])
+            self._raise_deprecated_type(keys=list(keys), type_req=float)
 
         data = self.data
         try:
@@ -229,9 +235,9 @@ class NbParser:
 
         :raise NbParserError: If strict=True and the value is not a digit or key is absent.
         """
-        first_key = keys[0]
-        self._raise_deprecated_key(first_key)
-        self._raise_deprecated_type(keys=list(keys), type_req=int)
+        if self._deprecated_models or self._deprecated_types:
+            self._raise_deprecated_key(keys[0])
+            self._raise_deprecated_type(keys=list(keys), type_req=int)
 
         data = self.data
         try:
@@ -263,9 +269,9 @@ class NbParser:
 
         :raise NbParserError: If strict=True and the value is not a list or key is absent.
         """
-        first_key = keys[0]
-        self._raise_deprecated_key(first_key)
-        self._raise_deprecated_type(keys=list(keys), type_req=list)
+        if self._deprecated_models or self._deprecated_types:
+            self._raise_deprecated_key(keys[0])
+            self._raise_deprecated_type(keys=list(keys), type_req=list)
         return self._get_keys(type_=list, keys=keys)
 
     def str(self, *keys) -> str:
@@ -278,30 +284,23 @@ class NbParser:
 
         :raise NbParserError: If strict=True and the value is not a string or key is absent.
         """
-        first_key = keys[0]
-        self._raise_deprecated_key(first_key)
-        self._raise_deprecated_type(keys=list(keys), type_req=str)
+        if self._deprecated_models or self._deprecated_types:
+            self._raise_deprecated_key(keys[0])
+            self._raise_deprecated_type(keys=list(keys), type_req=str)
         return self._get_keys(type_=str, keys=keys)
 
     def _raise_deprecated_key(self, key: Str) -> None:
         """Log and raise error if the key is deprecated for specific app/model.
 
+        Only the models deprecated for the URL of the object are checked,
+        see ``_deprecated()``. Versions lower than VERSION_NB are skipped.
+
         :param key: First key in the chain of keys.
         :return: None. Log error and raise NbVersionError.
         :raise NbVersionError: If the key is deprecated for specific app/model.
         """
-        # skip old version
-        sw_version_act = SwVersion(self.version)
-        sw_version_req = SwVersion(VERSION_NB)
-        if self.version and sw_version_act < sw_version_req:
-            return None
-
-        # log deprecated key if version
         url = self.data.get("url", "")
-        for model, key_old, key_new in DEPRECATED_MODELS:
-            if f"/api/{model}/" not in url:
-                continue
-
+        for model, key_old, key_new in self._deprecated_models:
             # model moved
             if not key_old:
                 msg = f"Deprecated model {model!r} in {url}, expected {key_new!r}."
@@ -343,32 +342,22 @@ class NbParser:
                 logging.error(msg)
                 raise NbVersionError(msg)
 
-        return None
-
     def _raise_deprecated_type(self, keys: LStr, type_req: Type) -> None:
         """Log and raise error if the type is deprecated for specific app/model.
 
+        Only the types deprecated for the URL of the object are checked,
+        see ``_deprecated()``. Versions lower than VERSION_NB are skipped.
+
         :param keys: Chain of keys to retrieve the desired value.
         :return: None. Log error and raise NbVersionError.
         :raise NbVersionError: If the type is deprecated for specific app/model.
         """
-        # skip old version
-        sw_version_act = SwVersion(self.version)
-        sw_version_req = SwVersion(VERSION_NB)
-        if self.version and sw_version_act < sw_version_req:
-            return
-
-        # log deprecated key if version
         url = self.data.get("url", "")
-        for model, keys_old, type_new in DEPRECATED_TYPES:
+        for model, keys_old, type_new in self._deprecated_types:
             keys_new = keys[: len(keys_old)]
             value = self.any(*keys_new)
             type_old = type(value)
 
-            # skip if the model not been changed
-            if f"/api/{model}/" not in url:
-                continue
-
             # skip if keys not match
             if keys_new != keys_old:
                 continue
@@ -482,14 +471,60 @@ class NbParser:
 
         return data
 
+    def _set_data(self, data: DAny) -> None:
+        """Set Netbox object, resolve the deprecated models and types of its app/model once.
+
+        :param data: Netbox object.
+        :return: None. Update self object.
+        """
+        self.data = _init_data(data)
+        self._deprecated_models, self._deprecated_types = [], []
+        if not _is_old_version(self.version):
+            path: str = _url_path(str(self.data.get("url") or ""))
+            self._deprecated_models, self._deprecated_types = _deprecated(path)
+
     def _source(self) -> Str:
-        """Return URL or dictionary of source object."""
+        """Return URL or dictionary of source object, mark partial object."""
         if isinstance(self.data, dict):
             if url := self.data.get("url"):
+                if self.data.get("_partial"):
+                    return f"{url} (partial object, use complete() to request all keys)"
                 return str(url)
         return str(self.data)
 
 
+def _deprecated(path: str) -> Tuple[LT3Str, List[Tuple[str, LStr, Type]]]:
+    """Get the deprecated models and types matching the URL path, cached by the path.
+
+    :param path: URL without the object ID.
+    :return: Items of DEPRECATED_MODELS and DEPRECATED_TYPES for this app/model.
+    """
+    if path not in _DEPRECATED_BY_PATH:
+        models = [t for t in DEPRECATED_MODELS if f"/api/{t[0]}/" in path]
+        types = [t for t in DEPRECATED_TYPES if f"/api/{t[0]}/" in path]
+        _DEPRECATED_BY_PATH[path] = (models, types)
+    return _DEPRECATED_BY_PATH[path]
+
+
+def _is_old_version(version: str) -> bool:
+    """Check if the Netbox version is lower than VERSION_NB, cached by the version."""
+    if version not in _OLD_VERSIONS:
+        _OLD_VERSIONS[version] = bool(version) and SwVersion(version) < SwVersion(VERSION_NB)
+    return _OLD_VERSIONS[version]
+
+
+def _url_path(url: str) -> str:
+    """Remove the object ID from the URL to share the cache by app/model.
+
+    :example:
+        _url_path("https://netbox/api/dcim/devices/1/") -> "https://netbox/api/dcim/devices/"
+    """
+    head, _, tail = url.rstrip("/").rpartition("/")
+    if head and tail.isdigit():
+        return f"{head}/"
+    return url
+
+
 def _init_data(data: DAny) -> DAny:
     """Initialize data."""
     if data is None:
@@ -499,40 +534,228 @@ def _init_data(data: DAny) -> DAny:
     raise TypeError(f"{data=} {dict} expected.")
 
 
+class NbPredicate:
+    """Compiled extended finding parameters, reusable to find Netbox objects in a loop.
+
+    Keys are split and values are wrapped to the sets once, on initialization.
+    All parameters are checked in a single pass through the Netbox object.
+    Different parameters work like an ``AND`` operator.
+    Different values of the same parameter work like an ``OR`` operator.
+    Parameters with double underscores ``__`` will be split into a list of keys.
+    """
+
+    def __init__(self, **kwargs):
+        """Initialize NbPredicate.
+
+        :param kwargs: Extended filtering parameters.
+
+        :raise TypeError: If the key is not a string.
+        :raise ValueError: If the ``tags`` key is not followed by a single key.
+
+        :example:
+            predicate = NbPredicate(site__slug="SITE1", tags__slug=["TAG1", "TAG2"])
+            predicate({"site": {"slug": "SITE1"}, "tags": [{"slug": "TAG1"}]}) -> True
+        """
+        self.terms: List[Tuple[str, Any]] = [
+            (key, _init_value_set(values)) for key, values in kwargs.items()
+        ]
+        self.checks: List[Callable[[DAny], bool]] = [
+            _compile_check(keys=split_key(key), values=values) for key, values in self.terms
+        ]
+
+    def __repr__(self):
+        """__repr__."""
+        name = self.__class__.__name__
+        params = ", ".join(f"{k}={sorted(v, key=str)}" for k, v in self.terms)
+        return f"<{name}: {params}>"
+
+    def __and__(self, other: "NbPredicate") -> "NbPredicate":
+        """Join the parameters of two predicates by the ``AND`` operator."""
+        predicate = NbPredicate()
+        predicate.terms = [*self.terms, *other.terms]
+        predicate.checks = [*self.checks, *other.checks]
+        return predicate
+
+    def __eq__(self, other) -> bool:
+        """== Equality."""
+        return isinstance(other, NbPredicate) and self.terms == other.terms
+
+    def __hash__(self) -> int:
+        """Hash of the parameters, to cache the found objects by the predicate.
+
+        Unhashable values (tuple of dictionaries) are hashed by the number of values.
+        """
+        return hash(tuple((k, v if isinstance(v, frozenset) else len(v)) for k, v in self.terms))
+
+    def __call__(self, data: DAny) -> bool:
+        """Check if Netbox object matches all parameters in a single pass.
+
+        :param data: Netbox object.
+        :return: True if the object matches, False otherwise.
+        """
+        for check in self.checks:
+            if not check(data):
+                return False
+        return True
+
+    def filter(self, objects: Iterable[DAny]) -> LDAny:
+        """Filter Netbox objects that match all parameters.
+
+        Each parameter filters the objects that matched the previous parameters,
+        so the selective first parameter makes the other checks cheap.
+
+        :param objects: Netbox objects.
+        :return: Filtered Netbox objects.
+        """
+        objects_: LDAny = list(objects)
+        for check in self.checks:
+            objects_ = [d for d in objects_ if check(d)]
+        return objects_
+
+
 # ============================ functions =============================
 
 
-def find_objects(objects: LDAny, **kwargs) -> LDAny:
+def find_objects(objects: LDAny, predicate: Optional[NbPredicate] = None, **kwargs) -> LDAny:
     """Find Netbox objects in tree by extended finding parameters.
 
     :param objects: Netbox objects where searching is required using kwargs.
+    :param predicate: Compiled extended finding parameters, joined with kwargs by ``AND``.
     :param kwargs: Extended filtering parameters.
     :return: Filtered Netbox objects.
     """
-    if not kwargs:
-        return objects
-    (key, values), *key_values = list(kwargs.items())
-    if not isinstance(values, TLists):
-        values = [values]
-
-    objects_: LDAny = []
-    for data in objects:
-        if not isinstance(key, str):
-            raise TypeError(f"Key {str} expected.")
-        keys = key.split("__")
-        if len(keys) <= 1:
-            keys = [key]
-        if keys[0] == "tags":
-            if len(keys) != 2:
-                raise ValueError(f"{keys=} {len(keys)=} expected 2.")
-            values_ = [d[keys[1]] for d in data["tags"]]
-            if vlist.is_in(values_, values):
-                objects_.append(data)
-        else:
-            value_ = NbParser(data).any(*keys)
-            if value_ in values:
-                objects_.append(data)
-
-    if key_values:
-        objects_ = find_objects(objects=objects_, **dict(key_values))
-    return objects_
+    if predicate is None:
+        if not kwargs:
+            return objects
+        predicate = NbPredicate(**kwargs)
+    elif kwargs:
+        predicate = predicate & NbPredicate(**kwargs)
+    return predicate.filter(objects)
+
+
+def find_values(data: DAny, keys: LStr) -> List:
+    """Get the values of Netbox object compared with the extended finding parameter.
+
+    :param data: Netbox object.
+    :param keys: Chaining dictionary keys, split by split_key().
+    :return: Values of all tags for the ``tags`` key, otherwise the single value or None.
+    """
+    if keys[0] == "tags":
+        return [d[keys[1]] for d in data["tags"]]
+    try:
+        for key in keys:
+            data = data[key]  # type: ignore
+    except (KeyError, IndexError, TypeError):
+        return [None]
+    return [data]
+
+
+def index_objects(objects: LDAny, key: str) -> ODAny:
+    """Build hash index of Netbox objects by the extended finding parameter.
+
+    :param objects: Netbox objects.
+    :param key: Extended finding parameter, double underscores ``__`` split the keys.
+    :return: Positions of the objects by the value, None if some value is not hashable.
+
+    :example:
+        index_objects([{"name": "A"}, {"name": "B"}, {"name": "A"}], "name")
+        -> {"A": [0, 2], "B": [1]}
+    """
+    keys: LStr = split_key(key)
+    index: Dict[Any, List[int]] = {}
+    try:
+        for position, data in enumerate(objects):
+            for value in dict.fromkeys(find_values(data, keys)):  # unique tags
+                index.setdefault(value, []).append(position)
+    except TypeError:  # unhashable value
+        return None
+    return index
+
+
+def init_values(values: Any) -> List:
+    """Init values of the extended finding parameter as a list."""
+    if isinstance(values, TLists):
+        return list(values)
+    return [values]
+
+
+def split_key(key: str) -> LStr:
+    """Split the extended finding parameter to the chaining dictionary keys.
+
+    :param key: Extended finding parameter, double underscores ``__`` split the keys.
+    :return: Chaining dictionary keys.
+
+    :raise TypeError: If the key is not a string.
+    :raise ValueError: If the ``tags`` key is not followed by a single key.
+
+    :example:
+        split_key("site__slug") -> ["site", "slug"]
+    """
+    if not isinstance(key, str):
+        raise TypeError(f"Key {str} expected.")
+    keys = key.split("__")
+    if keys[0] == "tags" and len(keys) != 2:
+        raise ValueError(f"{keys=} {len(keys)=} expected 2.")
+    return keys
+
+
+# ============================= helpers ==============================
+
+
+def _init_value_set(values: Any) -> Any:
+    """Init values of the extended finding parameter as a frozenset, or a tuple if unhashable."""
+    values_: List = init_values(values)
+    try:
+        return frozenset(values_)
+    except TypeError:
+        return tuple(values_)
+
+
+def _compile_check(keys: LStr, values: Any) -> Callable[[DAny], bool]:
+    """Compile the check of Netbox object by the extended finding parameter.
+
+    :param keys: Chaining dictionary keys, split by split_key().
+    :param values: Values of the parameter, frozenset or tuple if unhashable.
+    :return: Function that returns True if the object matches the parameter.
+    """
+    if keys[0] == "tags":
+        tag_key = keys[1]
+
+        def check_tags(data: DAny) -> bool:
+            """Check if any tag matches."""
+            return any(_is_in(d[tag_key], values) for d in data["tags"])
+
+        return check_tags
+
+    if len(keys) == 1:
+        key = keys[0]
+
+        def check_key(data: DAny) -> bool:
+            """Check the value of the key."""
+            try:
+                value = data[key]
+            except (KeyError, IndexError, TypeError):
+                value = None
+            return _is_in(value, values)
+
+        return check_key
+
+    def check_keys(data: DAny) -> bool:
+        """Check the value of the chain of keys."""
+        value: Any = data
+        try:
+            for key_ in keys:
+                value = value[key_]
+        except (KeyError, IndexError, TypeError):
+            value = None
+        return _is_in(value, values)
+
+    return check_keys
+
+
+def _is_in(value: Any, values: Any) -> bool:
+    """Check if the value of Netbox object is in the values of the finding parameter."""
+    try:
+        return value in values
+    except TypeError:  # unhashable value in frozenset
+        return any(value == s for s in values)
@@ -1,13 +1,20 @@
 """NbValue."""
 
+import inspect
 import re
+from typing import Any, Callable, List
 
 from netports.ipv4 import RE_PREFIX, RE_IP
 
 from nbforager import ami
 from nbforager.exceptions import NbParserError
 from nbforager.parser.nb_parser import NbParser, check_strict
-from nbforager.types import LStr, LInt, LDAny
+from nbforager.types import LStr, LInt, LDAny, DList
+
+try:
+    import pandas
+except ImportError:  # pragma: no cover
+    pandas = None  # type: ignore
 
 
 class NbValue(NbParser):
@@ -961,6 +968,70 @@ class NbValue(NbParser):
         url = self.str("url")
         return ami.url_to_ui(url)
 
+    # ============================== batch ===============================
+
+    @classmethod
+    def extract_many(
+        cls,
+        objects: LDAny,
+        fields: LStr,
+        strict: bool = False,
+        frame: bool = False,
+        **kwargs,
+    ) -> Any:
+        """Extract the values of the fields from many Netbox objects, in columns.
+
+        The field methods are resolved once, one parser is reused for all objects.
+
+        :param objects: Netbox objects.
+        :param fields: Names of NbValue methods without arguments, e.g. ["name", "site_slug"].
+        :param strict: True - if data is invalid raise NbParserError,
+            False - if data is invalid return empty data with proper type.
+        :param frame: True - return pandas.DataFrame (requires ``pandas``),
+            False - return dictionary of lists.
+        :param kwargs: NbValue parameters, e.g. version="4.2".
+
+        :return: Values of the objects by field names, or pandas.DataFrame if frame=True.
+
+        :raise ValueError: If the field is not a NbValue method without arguments.
+        :raise ImportError: If frame=True and pandas is not installed.
+
+        :example:
+            NbValue.extract_many([{"name": "A"}, {"name": "B"}], ["name"]) -> {"name": ["A", "B"]}
+        """
+        if frame and pandas is None:
+            msg = "pandas is required for frame=True, run: pip install nbforager[pandas]"
+            raise ImportError(msg)
+        fields = list(dict.fromkeys(fields))
+        methods: List[Callable] = [cls._field_method(s) for s in fields]
+        columns: DList = {s: [] for s in fields}
+        appends: List[Callable] = [columns[s].append for s in fields]
+
+        nbv = cls(data={}, strict=strict, **kwargs)
+        for data in objects:
+            nbv._set_data(data)
+            for method, append in zip(methods, appends):
+                append(method(nbv))
+
+        if frame:
+            return pandas.DataFrame(columns, columns=fields)
+        return columns
+
+    @classmethod
+    def _field_method(cls, field: str) -> Callable:
+        """Get NbValue method without arguments by the field name.
+
+        :param field: Method name.
+        :return: Unbound method.
+        :raise ValueError: If the field is not a NbValue method without arguments.
+        """
+        method = getattr(cls, field, None)
+        if field.startswith("_") or not inspect.isfunction(method):
+            raise ValueError(f"{field=} expected {cls.__name__} method.")
+        if len(inspect.signature(method).parameters) != 1:
+            raise ValueError(f"{field=} expected {cls.__name__} method without arguments.")
+        return method
+
     # ================================ is ================================
 
     def is_dcim(self, key: str) -> bool:
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Set, TypeVar, Tuple, Union
+from typing import Any, Dict, Generator, List, Optional, Sequence, Set, TypeVar, Tuple, Union
 
 from requests import Response
 
@@ -27,6 +27,7 @@ SStr = Set[str]
 SeqStr = Sequence[str]
 Str = str
 T = TypeVar("T")
+T2Int = Tuple[int, int]
 T2Str = Tuple[str, str]
 T3Str = Tuple[str, str, str]
 T3StrInt = Tuple[str, str, int]
@@ -45,6 +46,7 @@ DSStr = Dict[str, SStr]
 DiAny = Dict[int, Any]
 DiDAny = Dict[int, DAny]
 DiStr = Dict[int, str]
+GDAny = Generator[DAny, None, None]
 LDAny = List[DAny]
 LDStr = List[DStr]
 LParam = List[Param]
@@ -54,8 +56,11 @@ LT2StrDAny = List[Tuple[str, DAny]]
 LT3Str = List[T3Str]
 LValue = List[Value]
 ODAny = Optional[DAny]
+ODInt = Optional[DInt]
+OLInt = Optional[LInt]
 OSeqStr = Optional[SeqStr]
 SParam = Set[Param]
+ST3StrInt = Set[T3StrInt]
 SeqDAny = Sequence[DAny]
 SeqT = Sequence[T]
 SeqUIntStr = Sequence[IntStr]
@@ -67,11 +72,13 @@ UStr = Union[str, SeqStr]
 DDDLStr = Dict[str, Dict[str, DLStr]]
 DDLInt = Dict[str, DLInt]
 DiLDAny = Dict[int, LDAny]
+GLDAny = Generator[LDAny, None, None]
 LDList = List[DList]
 LLDAny = List[LDAny]
 LLParam = List[LParam]
 ODDAny = Optional[DDAny]
 ODLStr = Optional[DLStr]
+OST3StrInt = Optional[ST3StrInt]
 OUStr = Optional[UStr]
 ULDAny = Union[LDAny, DAny]
 
@@ -3,12 +3,14 @@
 import pytest
 import requests_mock
 
+from nbforager.types import DAny
+
 
 @pytest.fixture
 def mock_requests_vrf():
     """Mock Session."""
     with requests_mock.Mocker() as mock:
-        url = "https://nb/api/ipam/vrfs/?limit=1000&offset=0"
+        url = "https://nb/api/ipam/vrfs/"
         json = {
             "results": [
                 {"id": 1, "name": "VRF 1"},
@@ -17,3 +19,33 @@ def mock_requests_vrf():
         }
         mock.get(url=url, json=json)
         yield mock
+
+
+def mock_pages(request, context, max_page_size: int = 1000) -> DAny:
+    """Mock Netbox pages of 7 ip-addresses.
+
+    Support limit, offset, next URL and keyset parameters: ordering, id__gt, id__gte, id__lte.
+    The limit is capped by max_page_size, as Netbox MAX_PAGE_SIZE.
+    """
+    _ = context  # noqa
+    items = [{"id": i, "url": f"https://nb/api/ipam/ip-addresses/{i}/"} for i in range(1, 8)]
+    for key, compare in [
+        ("id__gt", lambda i, j: i > j),
+        ("id__gte", lambda i, j: i >= j),
+        ("id__lte", lambda i, j: i <= j),
+    ]:
+        if key in request.qs:
+            value = int(request.qs[key][0])
+            items = [d for d in items if compare(d["id"], value)]
+    if request.qs.get("ordering") == ["-id"]:
+        items = list(reversed(items))
+
+    limit = min(int(request.qs.get("limit", [50])[0]), max_page_size)
+    offset = int(request.qs.get("offset", [0])[0])
+    next_ = ""
+    if offset + limit < len(items):
+        filters = "".join(f"&{k}={request.qs[k][0]}"
+                          for k in ["ordering", "id__gt", "id__gte", "id__lte"]
+                          if k in request.qs)
+        next_ = f"https://nb/api/ipam/ip-addresses/?limit={limit}&offset={offset + limit}{filters}"
+    return {"count": len(items), "next": next_, "results": items[offset:offset + limit]}
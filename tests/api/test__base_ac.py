@@ -0,0 +1,66 @@
+"""Tests nbforager/api/base_ac.py."""
+from threading import Thread
+
+from nbforager.api.base_ac import LazyConnector
+from nbforager.api.ipam import IpamAC
+
+
+def test__lazy_connector():
+    """LazyConnector.__get__()."""
+    obj = IpamAC(host="nb", scheme="https")
+    assert "vrfs" not in vars(obj)
+    assert isinstance(IpamAC.vrfs, LazyConnector)
+
+    connector = obj.vrfs
+
+    assert isinstance(connector, IpamAC.VrfsC)
+    assert connector.host == "nb"
+    assert vars(obj)["vrfs"] is connector
+    assert obj.vrfs is connector
+    assert "prefixes" not in vars(obj)
+
+
+def test__lazy_connector__threads():
+    """LazyConnector.__get__() concurrent first access."""
+    obj = IpamAC(host="nb", scheme="https")
+    connectors = []
+
+    threads = [Thread(target=lambda: connectors.append(obj.prefixes)) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(o) for o in connectors}) == 1
+
+
+def test__repr__():
+    """BaseAC.__repr__()."""
+    obj = IpamAC(host="nb", scheme="https")
+
+    actual = repr(obj)
+
+    assert actual == "<IpamAC: nb>"
+    assert not [s for s in vars(obj) if s[0].islower()]
+
+
+def test__models():
+    """BaseAC._models()."""
+    obj = IpamAC(host="nb", scheme="https")
+
+    actual = obj._models()
+
+    assert actual[:3] == ["aggregates", "asn_ranges", "asns"]
+    assert actual == [s for s in dir(obj) if s[0].islower()]
+    assert not [s for s in vars(obj) if s[0].islower()]
+
+
+def test__update():
+    """BaseAC._update()."""
+    obj = IpamAC(host="nb", scheme="https", threads=1)
+    created = obj.vrfs
+
+    obj._update(threads=3)
+
+    assert created.threads == 3
+    assert obj.prefixes.threads == 3
@@ -156,6 +156,34 @@ def test__init_scheme(params, expected: Any):
         with pytest.raises(expected):
             base_c._init_scheme(**params)
 
+@pytest.mark.parametrize("params, expected", [
+    ({}, 10),
+    ({"threads": 20}, 20),
+    ({"threads": 2, "max_in_flight": 30}, 30),
+    ({"threads": 20, "pool_size": 4}, 4),
+    ({"pool_size": -1}, 1),
+])
+def test__init_pool_size(params, expected: Any):
+    """base_c._init_pool_size()"""
+    actual = base_c._init_pool_size(**params)
+    assert actual == expected
+
+
+@pytest.mark.parametrize("params, expected", [
+    ({}, 10),
+    ({"threads": 20}, 20),
+])
+def test__init_session(params, expected: Any):
+    """base_c._init_session() mount_adapter()"""
+    session: Session = base_c._init_session(**params)
+    for prefix in ["https://", "http://"]:
+        actual = session.get_adapter(prefix)._pool_maxsize
+        assert actual == expected
+
+    actual = base_c._init_session(session=session, threads=100)
+    assert actual is session
+
+
 @pytest.mark.parametrize("params, expected", [
     ({}, 1),
     ({"threads": -1}, 1),
@@ -1,18 +1,23 @@
 """Tests nbforager/api/base_mc.py."""
+import time
+from functools import partial
+from threading import Thread
 from typing import Any
 
 import pytest
+import requests_mock
 from _pytest.monkeypatch import MonkeyPatch
 from requests import Session, HTTPError
 from requests_mock import Mocker
 
 from nbforager.api import base_mc
+from nbforager.api.extended_get import ParamPath
 from nbforager.exceptions import NbApiError
 from nbforager.nb_api import NbApi
 from nbforager.nb_forager import NbForager
 from nbforager.types import DAny, LDAny
 from tests.fixtures import api, nbf, mock_session
-from tests.api.fixtures__base_mc import mock_requests_vrf
+from tests.api.fixtures__base_mc import mock_requests_vrf, mock_pages
 
 
 @pytest.mark.parametrize("params, expected", [
@@ -172,6 +177,53 @@ def test__change_params_name_to_id(
     assert actual == expected
 
 
+@pytest.mark.parametrize("param_path, values, expected", [
+    (ParamPath(param="vrf", path="ipam/vrfs/"), ["VRF 1"],
+     ["https://nb/api/ipam/vrfs/?brief=1&limit=1000&name=VRF+1&offset=0"]),
+    (ParamPath(param="vrf", path="ipam/vrfs/"), ["VRF 1", "VRF 2"],
+     ["https://nb/api/ipam/vrfs/?brief=1&limit=1000&name=VRF+1&name=VRF+2&offset=0"]),
+    (ParamPath(param="vrf", path="ipam/vrfs/"), [f"VRF {i}" for i in range(300)],
+     ["https://nb/api/ipam/vrfs/?brief=1&limit=1000&name=VRF+0&", "&name=VRF+299&offset=0"]),
+    (ParamPath(param="vrf", path="ipam/vrfs/", filtered=False), ["VRF 1"],
+     ["https://nb/api/ipam/vrfs/?limit=1000&offset=0"]),
+])
+def test__query_param_path(mock_requests_vrf: Mocker, param_path, values, expected):
+    """BaseMC._query_param_path()."""
+    api_ = NbApi(host="nb")
+
+    items = api_.ipam.ip_addresses._query_param_path(param_path=param_path, values=values)
+
+    assert [d["id"] for d in items] == [1, 2] * mock_requests_vrf.call_count
+    urls = [o.url for o in mock_requests_vrf.request_history]
+    if len(expected) == 1:
+        assert urls == expected
+    else:
+        assert len(urls) > 1
+        assert urls[0].startswith(expected[0])
+        assert urls[-1].endswith(expected[1])
+        assert max(len(s) for s in urls) <= api_.ipam.ip_addresses.url_length
+
+
+@pytest.mark.parametrize("extended_get_ttl, params_d, expected, call_count", [
+    (300, {"vrf": ["VRF 1"]}, {"vrf_id": [1]}, 1),
+    (300, {"vrf": ["VRF 1", "VRF 2"]}, {"vrf_id": [1, 2]}, 1),
+    (300, {"vrf": ["typo"]}, {"vrf": ["typo"]}, 1),
+    (0, {"vrf": ["VRF 1"]}, {"vrf_id": [1]}, 2),
+])
+def test__change_params_name_to_id__param_cache(
+        mock_requests_vrf: Mocker, extended_get_ttl, params_d: DAny, expected: DAny, call_count,
+):
+    """BaseMC._change_params_name_to_id() with ParamCache, shared by connectors."""
+    api_ = NbApi(host="nb", extended_get_ttl=extended_get_ttl)
+
+    actual = api_.ipam.ip_addresses._change_params_name_to_id(params_d=params_d)
+    assert actual == expected
+    actual = api_.ipam.prefixes._change_params_name_to_id(params_d=params_d)
+    assert actual == expected
+
+    assert mock_requests_vrf.call_count == call_count
+
+
 @pytest.mark.parametrize("extended_get, params_d, expected", [
     (True, {"site_id": [1], "region_id": [2]}, {"site": [1], "region_id": [2]}),
     (False, {"site_id": [1], "region_id": [2]}, {"site_id": [1], "region_id": [2]}),
@@ -219,6 +271,153 @@ def test__retry_requests(
         assert actual == resp_status_code
 
 
+@pytest.mark.parametrize("max_retries, status_codes, headers, expected, sleeps", [
+    (0, [503, 200], {}, 503, 0),
+    (1, [503, 200], {}, 200, 1),
+    (2, [429, 502, 200], {}, 200, 2),
+    (1, [429, 200], {"Retry-After": "3"}, 200, 1),
+    (1, [504, 504], {}, 504, 1),
+])
+def test__retry_requests__statuses(
+    monkeypatch: MonkeyPatch, max_retries, status_codes, headers, expected, sleeps,
+):
+    """BaseMC._retry_requests() retry 429, 502, 503, 504 with backoff."""
+    api_ = NbApi(host="nb", max_retries=max_retries, sleep=1, adaptive=True)
+    responses = iter(status_codes)
+    slept = []
+
+    def get(*args, **kwargs):
+        _ = args, kwargs
+        response = mock_session(next(responses), "{}")()
+        response.headers.update(headers)
+        return response
+
+    monkeypatch.setattr(Session, "get", get)
+    monkeypatch.setattr(base_mc.time, "sleep", slept.append)
+    try:
+        response = api_.ipam.ip_addresses._retry_requests(url="https://nb/api/ipam/ip-addresses/")
+        actual = response.status_code
+    except HTTPError as ex:
+        actual = ex.response.status_code
+
+    assert actual == expected
+    assert len(slept) == sleeps
+    if headers:
+        assert slept == [3]
+
+
+def test__retry_requests__scheduler(monkeypatch: MonkeyPatch):
+    """BaseMC._retry_requests() max_in_flight shared by all connectors."""
+    api_ = NbApi(host="nb", max_in_flight=2)
+    connectors = [api_.ipam.ip_addresses, api_.ipam.prefixes, api_.dcim.devices] * 2
+    peaks = []
+
+    def get(*args, **kwargs):
+        _ = args, kwargs
+        peaks.append(api_.scheduler.in_flight())
+        time.sleep(0.05)
+        return mock_session(200, "any")()
+
+    monkeypatch.setattr(Session, "get", get)
+    threads = [Thread(target=o._retry_requests, args=(o.url,)) for o in connectors]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert api_.ipam.prefixes.scheduler is api_.scheduler
+    assert max(peaks) == 2
+    assert api_.scheduler.in_flight() == 0
+
+
+def test__retry_requests__latency(monkeypatch: MonkeyPatch):
+    """BaseMC._retry_requests() latency does not include waiting for the slot."""
+    api_ = NbApi(host="nb", adaptive=True)
+    api_.scheduler.feedback(status_code=429, latency=0.0, retry_after=0.2)
+    latencies = []
+    monkeypatch.setattr(Session, "get", mock_session(200, "any"))
+    monkeypatch.setattr(api_.scheduler, "feedback", lambda *args: latencies.append(args[1]))
+
+    api_.ipam.prefixes._retry_requests(url=api_.ipam.prefixes.url)
+
+    assert latencies[0] < 0.1
+
+
+@pytest.mark.parametrize("params, params_d, max_page_size, expected, urls", [
+    ({"limit": 3}, {}, 1000, [[1, 2, 3], [4, 5, 6], [7]], [
+        "?limit=3&ordering=id&id__gt=0",
+        "?limit=3&ordering=id&id__gt=3",
+        "?limit=3&ordering=id&id__gt=6",
+    ]),
+    ({"limit": 3}, {"id__gt": [4]}, 1000, [[5, 6, 7]], [
+        "?id__gt=4&limit=3&ordering=id",
+    ]),
+    ({"limit": 7}, {}, 1000, [[1, 2, 3, 4, 5, 6, 7]], [
+        "?limit=7&ordering=id&id__gt=0",
+    ]),
+    ({"limit": 7}, {}, 3, [[1, 2, 3], [4, 5, 6], [7]], [
+        "?limit=7&ordering=id&id__gt=0",
+        "?limit=7&ordering=id&id__gt=3",
+        "?limit=7&ordering=id&id__gt=6",
+    ]),
+])
+def test__iter_keyset(params, params_d, max_page_size, expected, urls):
+    """BaseMC._iter_keyset()."""
+    api_ = NbApi(host="nb", **params)
+    with requests_mock.Mocker() as mock:
+        json = partial(mock_pages, max_page_size=max_page_size)
+        mock.get("https://nb/api/ipam/ip-addresses/", json=json)
+
+        pages = api_.ipam.ip_addresses._iter_keyset("ipam/ip-addresses/", params_d)
+        actual = [[d["id"] for d in items] for items in pages]
+        history = [o.url.split("/ip-addresses/")[1] for o in mock.request_history]
+
+    assert actual == expected
+    assert history == urls
+
+
+@pytest.mark.parametrize("params, params_d, expected", [
+    ({"limit": 3}, {}, [{"id__gte": [1], "id__lte": [3]},
+                        {"id__gte": [4], "id__lte": [6]},
+                        {"id__gte": [7], "id__lte": [7]}]),
+    ({"limit": 1000}, {"limit": [3]}, [{"id__gte": [1], "id__lte": [7]}]),
+    ({"limit": 3}, {"id__gte": [6]}, [{"id__gte": [6], "id__lte": [7]}]),
+    ({"limit": 3}, {"id__gte": [8]}, []),
+    ({"limit": 3}, {"id__gt": [5]}, [{"id__gt": [5], "id__gte": [6], "id__lte": [7]}]),
+    ({"limit": 3}, {"offset": [3]}, [{"offset": [3]}]),
+    ({"limit": 3, "keyset": False}, {}, [{}]),
+])
+def test__keyset_ranges(params, params_d, expected):
+    """BaseMC._keyset_ranges()."""
+    api_ = NbApi(host="nb", **{"keyset": True, **params})
+    with requests_mock.Mocker() as mock:
+        mock.get("https://nb/api/ipam/ip-addresses/", json=mock_pages)
+
+        actual = api_.ipam.ip_addresses._keyset_ranges("ipam/ip-addresses/", params_d)
+
+    assert actual == expected
+
+
+@pytest.mark.parametrize("params, params_d, expected", [
+    ({"limit": 3, "keyset": True}, {}, [1, 2, 3, 4, 5, 6, 7]),
+    ({"limit": 3, "keyset": True, "threads": 2}, {}, [1, 2, 3, 4, 5, 6, 7]),
+    ({"limit": 3, "keyset": True}, {"id__gt": [4]}, [5, 6, 7]),
+    ({"limit": 3, "keyset": True, "threads": 2}, {"id__gt": [4]}, [5, 6, 7]),
+])
+def test__query_params_ld__keyset(params, params_d, expected):
+    """BaseMC._query_params_ld() keyset pagination."""
+    api_ = NbApi(host="nb", **params)
+    with requests_mock.Mocker() as mock:
+        mock.get("https://nb/api/ipam/ip-addresses/", json=mock_pages)
+
+        items = api_.ipam.ip_addresses._query_params_ld([params_d])
+        history = [o.qs for o in mock.request_history]
+
+    actual = [d["id"] for d in items]
+    assert actual == expected
+    assert all("offset" not in d for d in history)
+
+
 def test__response_gateway_timeout():
     """BaseMC._response_gateway_timeout()."""
     api_ = NbApi(host="nb")
@@ -248,16 +447,42 @@ def test__add_default_limit_offset(params_d, expected):
     assert actual == expected
 
 
-@pytest.mark.parametrize("params, results, expected", [
-    ({}, [], []),
-    ({}, [{"count": 1, "params_d": {}}], [{"limit": 1000, "offset": 0}]),
-    ({}, [{"count": 1001, "params_d": {}}],
-     [{"limit": 1000, "offset": 0}, {"limit": 1000, "offset": 1000}]),
+@pytest.mark.parametrize("params, params_d, data, expected", [
+    ({}, {}, {}, []),
+    ({}, {}, {"count": 1000}, []),
+    ({}, {}, {"count": 2001}, [{"limit": 1000, "offset": 1000}, {"limit": 1000, "offset": 2000}]),
+    ({}, {"limit": [2]}, {"count": 3}, [{"limit": 2, "offset": 2}]),
+    ({}, {"offset": [0]}, {"count": 3001}, []),
+    ({"limit": 2}, {"q": ["a"]}, {"count": 3}, [{"q": ["a"], "limit": 2, "offset": 2}]),
+])
+def test__next_offsets(api, params, params_d, data, expected):
+    """BaseMC._next_offsets()."""
+    actual = api.ipam.ip_addresses._next_offsets(params_d=params_d, data=data)
+    assert actual == expected
+
+
+@pytest.mark.parametrize("params, expected, urls", [
+    ({"limit": 3, "threads": 2}, [1, 2, 3, 4, 5, 6, 7], [
+        "?limit=3&offset=0",
+        "?limit=3&offset=3",
+        "?limit=3&offset=6",
+    ]),
+    ({"limit": 10, "threads": 2}, [1, 2, 3, 4, 5, 6, 7], [
+        "?limit=10&offset=0",
+    ]),
 ])
-def test__slice_params_counters(api, params, results, expected):
-    """BaseMC._slice_params_counters()."""
-    actual = api.ipam.ip_addresses._slice_params_counters(results=results)
+def test__query_params_ld__threads(params, expected, urls):
+    """BaseMC._query_params_ld() threading mode without count requests."""
+    api_ = NbApi(host="nb", **params)
+    with requests_mock.Mocker() as mock:
+        mock.get("https://nb/api/ipam/ip-addresses/", json=mock_pages)
+
+        items = api_.ipam.ip_addresses._query_params_ld([{}])
+        history = sorted(o.url.split("/ip-addresses/")[1] for o in mock.request_history)
+
+    actual = [d["id"] for d in items]
     assert actual == expected
+    assert history == urls
 
 
 @pytest.mark.parametrize("params, expected", [
@@ -1,12 +1,16 @@
 """Tests nbforager/api/connector.py."""
 import json
-from typing import Any
+from threading import Thread
+from typing import Any, Generator
 
 import pytest
+import requests_mock
 from _pytest.monkeypatch import MonkeyPatch
 from requests import Response, Session, HTTPError
 
-from nbforager.types import DAny, LDAny
+from nbforager.nb_api import NbApi
+from nbforager.types import DAny, LDAny, GLDAny
+from tests.api.fixtures__base_mc import mock_pages
 from tests.fixtures import api_, mock_session
 
 
@@ -54,6 +58,56 @@ def test__get(api_, monkeypatch: MonkeyPatch, content, expected):
     assert actual == expected
 
 
+KEYS = ["comments", "id", "url"]
+
+
+@pytest.mark.parametrize("params, kwargs, expected", [
+    ({}, {"fields": ["name"]}, ("?fields=id%2Curl%2Cname&limit=1000&offset=0", KEYS)),
+    ({"threads": 2}, {"fields": "name"}, ("?fields=id%2Curl%2Cname&limit=1000&offset=0", KEYS)),
+    ({}, {"exclude": ["config_context", "url"]},
+     ("?exclude=config_context&limit=1000&offset=0", KEYS)),
+    ({}, {"exclude": "url,comments"}, ("?exclude=comments&limit=1000&offset=0", ["id", "url"])),
+])
+def test__get__projection(params, kwargs, expected):
+    """Connector.get() fields, exclude, mocked Netbox ignores the projection."""
+    api = NbApi(host="nb", **params)
+    with requests_mock.Mocker() as mock:
+        mock.get("https://nb/api/dcim/devices/", json={"results": [
+            {"id": 1, "url": "https://nb/api/dcim/devices/1/", "comments": ""},
+        ]})
+
+        items = api.dcim.devices.get(**kwargs)
+
+        query = mock.request_history[0].url.split("devices/", 1)[1]
+    actual = (query, sorted(items[0]))
+    assert actual == expected
+
+
+@pytest.mark.parametrize("params", [
+    {"limit": 2},
+    {"limit": 2, "threads": 3},
+])
+def test__get__concurrent(params):
+    """Connector.get() concurrent callers of the same connector."""
+    api = NbApi(host="nb", **params)
+    filters = {"id__gt": 2, "id__lte": 5}
+    actual: DAny = {}
+    with requests_mock.Mocker() as mock:
+        mock.get("https://nb/api/ipam/ip-addresses/", json=mock_pages)
+
+        def get(key: str) -> None:
+            items = api.ipam.ip_addresses.get(**{key: filters[key]})
+            actual[key] = sorted(d["id"] for d in items)
+
+        threads = [Thread(target=get, args=(s,)) for s in filters]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert actual == {"id__gt": [3, 4, 5, 6, 7], "id__lte": [1, 2, 3, 4, 5]}
+
+
 @pytest.mark.parametrize("params, expected", [
     ({"address": "10.0.0.1/24"}, 1),
 ])
@@ -67,6 +121,49 @@ def test__get_count(api_, monkeypatch: MonkeyPatch, params, expected):
     assert actual == expected
 
 
+@pytest.mark.parametrize("params, kwargs, expected", [
+    ({"limit": 3}, {}, [[1, 2, 3], [4, 5, 6], [7]]),
+    ({"limit": 3, "threads": 2}, {}, [[1, 2, 3], [4, 5, 6], [7]]),
+    ({"limit": 3, "threads": 2}, {"ordered": False}, [[1, 2, 3], [4, 5, 6], [7]]),
+    ({"limit": 10}, {}, [[1, 2, 3, 4, 5, 6, 7]]),
+    ({"limit": 3}, {"offset": 3}, [[4, 5, 6]]),
+    ({"limit": 3, "keyset": True}, {}, [[1, 2, 3], [4, 5, 6], [7]]),
+    ({"limit": 3, "keyset": True, "threads": 2}, {}, [[1, 2, 3], [4, 5, 6], [7]]),
+])
+def test__iter_pages(params, kwargs, expected):
+    """Connector.iter_pages()."""
+    api = NbApi(host="nb", **params)
+    with requests_mock.Mocker() as mock:
+        mock.get("https://nb/api/ipam/ip-addresses/", json=mock_pages)
+
+        pages: GLDAny = api.ipam.ip_addresses.iter_pages(**kwargs)
+        assert isinstance(pages, Generator)
+        actual = [[d["id"] for d in items] for items in pages]
+
+    if kwargs.get("ordered") is False:
+        actual = sorted(actual)
+    assert actual == expected
+
+
+@pytest.mark.parametrize("params", [
+    {"limit": 3},
+    {"limit": 3, "threads": 3},
+    {"limit": 3, "keyset": True},
+])
+def test__iter_objects(params):
+    """Connector.iter_objects()."""
+    api = NbApi(host="nb", **params)
+    with requests_mock.Mocker() as mock:
+        mock.get("https://nb/api/ipam/ip-addresses/", json=mock_pages)
+
+        objects = api.ipam.ip_addresses.iter_objects()
+        first = next(objects)
+        assert first["id"] == 1
+        actual = [first["id"]] + [d["id"] for d in objects]
+
+    assert actual == [1, 2, 3, 4, 5, 6, 7]
+
+
 @pytest.mark.parametrize("params, content, expected", [
     ({"fields": "id"}, '{"data": {"site_list": [{"id": 1}]}}', [1]),  # ok
     ({"fields": "id"}, '{"data": null}', HTTPError),  # no data
@@ -1,8 +1,11 @@
 """Tests nbforager/api/extended_get.py."""
+import time
+
 import pytest
 
 from nbforager.api import extended_get
-from nbforager.api.extended_get import ParamPath
+from nbforager.api.extended_get import ParamPath, ParamCache
+from nbforager.nb_tree import NbTree
 
 
 def test__param_path():
@@ -51,3 +54,100 @@ def test__need_change(params_d, expected):
     mapping = extended_get.data(path="ipam/vrfs/")
     actual = extended_get.need_change(params_d=params_d, mapping=mapping)
     assert actual == expected
+
+
+def test__param_paths():
+    """param_map.param_paths()."""
+    param_paths = extended_get.param_paths()
+
+    actual = [(o.path, o.key) for o in param_paths]
+    assert len(actual) == len(set(actual))
+    assert ("circuits/circuits/", "cid") in actual
+    assert ("dcim/sites/", "name") in actual
+    assert ("ipam/vlan-groups/", "name") in actual
+
+
+@pytest.mark.parametrize("values, expected", [
+    (["VRF 1"], [1]),
+    (["VRF 1", "VRF 2"], [1, 2]),
+    (["VRF 2", "VRF 2"], [2]),
+    (["VRF 3"], []),
+    (["VRF 1", "typo"], None),
+])
+def test__param_cache__get(values, expected):
+    """ParamCache.get()."""
+    cache = ParamCache()
+    items = [{"id": 1, "name": "VRF 1"}, {"id": 2, "name": "VRF 2"}]
+    cache.update("ipam/vrfs/", "name", items, values=["VRF 3"])
+
+    actual = cache.get("ipam/vrfs/", "name", values)
+
+    assert actual == expected
+
+
+def test__param_cache__ttl(monkeypatch):
+    """ParamCache.get() ttl."""
+    items = [{"id": 1, "name": "VRF 1"}]
+    cache = ParamCache(ttl=0)
+    cache.update("ipam/vrfs/", "name", items)
+    assert cache.get("ipam/vrfs/", "name", ["VRF 1"]) is None
+    assert cache.count() == 0
+
+    cache = ParamCache(ttl=10)
+    cache.update("ipam/vrfs/", "name", items)
+    assert cache.get("ipam/vrfs/", "name", ["VRF 1"]) == [1]
+
+    monotonic = time.monotonic() + 11
+    monkeypatch.setattr(extended_get.time, "monotonic", lambda: monotonic)
+    assert cache.get("ipam/vrfs/", "name", ["VRF 1"]) is None
+    assert cache.count() == 0
+
+
+def test__param_cache__ttl_refresh(monkeypatch):
+    """ParamCache.update() restarts ttl of the received values."""
+    now = [100.0]
+    monkeypatch.setattr(extended_get.time, "monotonic", lambda: now[0])
+    cache = ParamCache(ttl=10)
+    cache.update("ipam/vrfs/", "name", [{"id": 1, "name": "VRF 1"}])
+    now[0] = 108.0
+    cache.update("ipam/vrfs/", "name", [{"id": 3, "name": "VRF 2"}], values=["VRF 3"])
+    cache.update("ipam/vrfs/", "name", [{"id": 2, "name": "VRF 2"}])
+    assert cache.get("ipam/vrfs/", "name", ["VRF 2"]) == [2]
+
+    now[0] = 115.0
+    assert cache.get("ipam/vrfs/", "name", ["VRF 1"]) is None
+    assert cache.get("ipam/vrfs/", "name", ["VRF 2", "VRF 3"]) == [2]
+    assert cache.count() == 2
+
+    now[0] = 119.0
+    assert cache.get("ipam/vrfs/", "name", ["VRF 2"]) is None
+    assert cache.count() == 0
+
+
+def test__param_cache__update():
+    """ParamCache.update() size eviction."""
+    cache = ParamCache(size=2)
+    cache.update("ipam/vrfs/", "name", [{"id": 1, "name": "VRF 1"}])
+    cache.update("dcim/sites/", "name", [{"id": 1, "name": "SITE1"}])
+    assert cache.count() == 2
+
+    cache.update("tenancy/tenants/", "name", [{"id": 1, "name": "TENANT1"}])
+
+    assert cache.count() == 2
+    assert cache.get("ipam/vrfs/", "name", ["VRF 1"]) is None
+    assert cache.get("dcim/sites/", "name", ["SITE1"]) == [1]
+    assert cache.get("tenancy/tenants/", "name", ["TENANT1"]) == [1]
+
+
+def test__param_cache__load_tree():
+    """ParamCache.load_tree()."""
+    tree = NbTree()
+    tree.ipam.vrfs[1] = {"id": 1, "name": "VRF 1"}
+    tree.circuits.circuits[2] = {"id": 2, "cid": "CID1"}
+    cache = ParamCache()
+
+    cache.load_tree(tree)
+
+    assert cache.count() == 2
+    assert cache.get("ipam/vrfs/", "name", ["VRF 1"]) == [1]
+    assert cache.get("circuits/circuits/", "cid", ["CID1"]) == [2]
@@ -0,0 +1,138 @@
+"""Tests nbforager/api/scheduler.py."""
+import time
+from contextlib import ExitStack
+from threading import Thread, Lock
+
+import pytest
+from requests import Response
+
+from nbforager.api import scheduler
+from nbforager.api.scheduler import Scheduler
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("", "/"),
+    ("ipam/prefixes", "ipam/prefixes/"),
+    ("/ipam/prefixes/", "ipam/prefixes/"),
+    ("https://nb/api/ipam/prefixes/", "ipam/prefixes/"),
+    ("https://nb/api/ipam/prefixes/1/", "ipam/prefixes/"),
+    ("https://nb/api/ipam/prefixes/?limit=1&offset=2", "ipam/prefixes/"),
+    ("https://nb:8080/api/status/", "status/"),
+])
+def test__url_to_path(url, expected):
+    """scheduler.url_to_path()."""
+    actual = scheduler.url_to_path(url)
+    assert actual == expected
+
+
+@pytest.mark.parametrize("kwargs, expected", [
+    ({}, (0, {})),
+    ({"max_in_flight": -1}, (0, {})),
+    ({"max_in_flight": 2}, (2, {})),
+    ({"endpoint_limits": {"ipam/prefixes": 1, "/dcim/devices/": 0}}, (0, {"ipam/prefixes/": 1})),
+])
+def test__init(kwargs, expected):
+    """Scheduler.__init__()."""
+    obj = Scheduler(**kwargs)
+
+    actual = (obj.max_in_flight, obj.endpoint_limits)
+    assert actual == expected
+
+
+@pytest.mark.parametrize("kwargs, urls, expected", [
+    ({}, ["ipam/prefixes/"] * 6, 6),
+    ({"max_in_flight": 2}, ["ipam/prefixes/"] * 6, 2),
+    ({"endpoint_limits": {"ipam/prefixes/": 1}}, ["ipam/prefixes/"] * 6, 1),
+    ({"endpoint_limits": {"ipam/prefixes/": 1}}, ["ipam/prefixes/", "ipam/vrfs/"] * 3, 4),
+    ({"max_in_flight": 3, "endpoint_limits": {"ipam/prefixes/": 1}},
+     ["ipam/prefixes/", "ipam/vrfs/"] * 3, 3),
+])
+def test__slot(kwargs, urls, expected):
+    """Scheduler.slot() in_flight()."""
+    obj = Scheduler(**kwargs)
+    peaks = []
+    lock = Lock()
+
+    def request(url):
+        with obj.slot(url):
+            with lock:
+                peaks.append(obj.in_flight())
+            time.sleep(0.05)
+
+    threads = [Thread(target=request, args=(s,)) for s in urls]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(peaks) == expected
+    assert obj.in_flight() == 0
+    assert obj.in_flight("ipam/prefixes") == 0
+
+
+@pytest.mark.parametrize("kwargs, feedbacks, expected", [
+    ({"max_in_flight": 8}, [(503, 0.1)], (8, 0.0)),
+    ({"max_in_flight": 8, "adaptive": True}, [(200, 0.1)], (8, 0.0)),
+    ({"max_in_flight": 8, "adaptive": True}, [(503, 0.1)], (4, 0.0)),
+    ({"max_in_flight": 8, "adaptive": True}, [(502, 0.1), (200, 0.1)], (4.25, 0.0)),
+    ({"max_in_flight": 8, "adaptive": True, "latency_limit": 1}, [(200, 2)], (4, 0.0)),
+    ({"max_in_flight": 8, "adaptive": True}, [(429, 0.1)], (8, 0.025)),
+    ({"max_in_flight": 8, "adaptive": True}, [(429, 0.1), (200, 0.1)], (8, 0.0244)),
+    ({"adaptive": True}, [(504, 0.1)], (4, 0.0)),
+    ({"adaptive": True}, [(504, 0.1), (504, 0.1)], (4, 0.0)),
+])
+def test__feedback(kwargs, feedbacks, expected):
+    """Scheduler.feedback() AIMD, 8 requests in flight."""
+    obj = Scheduler(**kwargs)
+    with ExitStack() as stack:
+        for _ in range(8):
+            stack.enter_context(obj.slot("ipam/prefixes/"))
+        for status_code, latency in feedbacks:
+            obj.feedback(status_code=status_code, latency=latency)
+
+    actual = (obj.window, round(obj.delay, 4))
+    assert actual == expected
+
+
+def test__feedback__retry_after():
+    """Scheduler.feedback() Retry-After pauses all requests."""
+    obj = Scheduler(adaptive=True)
+    obj.feedback(status_code=429, latency=0.0, retry_after=0.2)
+
+    start = time.monotonic()
+    with obj.slot("ipam/prefixes/"):
+        actual = time.monotonic() - start
+
+    assert actual >= 0.15
+
+
+@pytest.mark.parametrize("attempt, sleep, retry_after, expected", [
+    (1, 10, 0, (5, 10)),
+    (2, 10, 0, (10, 20)),
+    (3, 1, 0, (2, 4)),
+    (20, 10, 0, (150, 300)),
+    (1, 10, 3, (3, 3)),
+    (1, 10, 86400, (300, 300)),
+])
+def test__backoff(attempt, sleep, retry_after, expected):
+    """Scheduler.backoff()."""
+    actual = Scheduler.backoff(attempt=attempt, sleep=sleep, retry_after=retry_after)
+
+    min_, max_ = expected
+    assert min_ <= actual <= max_
+
+
+@pytest.mark.parametrize("headers, expected", [
+    ({}, 0),
+    ({"Retry-After": "7"}, 7),
+    ({"Retry-After": "typo"}, 0),
+    ({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 0),
+])
+def test__retry_after(headers, expected):
+    """scheduler.retry_after()."""
+    response = Response()
+    response.headers.update(headers)
+
+    actual = scheduler.retry_after(response)
+
+    assert actual == expected
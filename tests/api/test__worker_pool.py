@@ -0,0 +1,72 @@
+"""Tests nbforager/api/worker_pool.py."""
+import threading
+
+import pytest
+
+from nbforager.api.worker_pool import WorkerPool
+
+
+@pytest.mark.parametrize("threads, expected", [
+    (0, 1),
+    (1, 1),
+    (3, 3),
+])
+def test__init(threads, expected):
+    """WorkerPool.__init__()."""
+    obj = WorkerPool(threads=threads)
+
+    assert obj.threads == expected
+    assert obj.running is False
+
+
+def test__submit():
+    """WorkerPool.submit() reuse the worker threads."""
+    obj = WorkerPool(threads=2)
+
+    names = {obj.submit(lambda: threading.current_thread().name).result() for _ in range(10)}
+    actual = obj.submit(pow, 2, exp=3).result()
+
+    assert actual == 8
+    assert 1 <= len(names) <= 2
+    assert obj.running is True
+    obj.shutdown()
+
+
+def test__map():
+    """WorkerPool.map()."""
+    obj = WorkerPool(threads=2)
+
+    actual = list(obj.map(pow, [2, 3, 4], [2, 2, 2]))
+
+    assert actual == [4, 9, 16]
+    obj.shutdown()
+
+
+@pytest.mark.parametrize("threads, expected", [
+    (2, True),
+    (3, False),
+])
+def test__resize(threads, expected):
+    """WorkerPool.resize()."""
+    obj = WorkerPool(threads=2)
+    obj.submit(int).result()
+
+    obj.resize(threads)
+
+    assert obj.threads == threads
+    assert obj.running is expected
+    obj.shutdown()
+
+
+def test__shutdown():
+    """WorkerPool.shutdown() start again on the next request."""
+    obj = WorkerPool(threads=2)
+    obj.submit(int).result()
+
+    obj.shutdown()
+    assert obj.running is False
+
+    actual = obj.submit(int, "1").result()
+    assert actual == 1
+    assert obj.running is True
+    obj.shutdown()
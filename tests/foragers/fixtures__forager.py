@@ -2,20 +2,24 @@
 from typing import Tuple
 
 import pytest
+import requests_mock
 
 from nbforager.nb_forager import NbForager
-from nbforager.types import LT2StrDAny, DAny
+from nbforager.types import LT2StrDAny
 
 
 @pytest.fixture
-def connector_results(nbf_: NbForager) -> Tuple[NbForager, LT2StrDAny]:
-    """Fixture with common connector_results test data."""
-    nb_termination: DAny = {"url": "circuit/circuit-terminations/1"}
-    nbf_.api.circuits.circuit_terminations._results = [nb_termination]
-
-    nb_vrf: DAny = {"url": "ipam/vrfs/1"}
-    nbf_.api.ipam.vrfs._results = [nb_vrf]
-
-    params_termination = ("circuits/circuit-terminations", {"id": [1, 2]})
-    params_vrf = ("ipam/vrfs", {"id": [1, 2]})
-    return nbf_, [params_termination, params_vrf]
+def path_params(nbf_: NbForager) -> Tuple[NbForager, LT2StrDAny]:
+    """Fixture with common path_params test data, mocked Netbox."""
+    with requests_mock.Mocker() as mock:
+        mock.get(
+            url="https://nb/api/circuits/circuit-terminations/?id=1&id=2",
+            json={"results": [{"url": "circuits/circuit-terminations/1"}]},
+        )
+        mock.get(
+            url="https://nb/api/ipam/vrfs/?id=1&id=2",
+            json={"results": [{"url": "ipam/vrfs/1"}]},
+        )
+        params_termination = ("circuits/circuit-terminations/", {"id": [1, 2]})
+        params_vrf = ("ipam/vrfs/", {"id": [1, 2]})
+        yield nbf_, [params_termination, params_vrf]
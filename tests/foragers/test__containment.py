@@ -0,0 +1,60 @@
+"""Tests nbforager/foragers/containment.py."""
+import pytest
+
+from nbforager.foragers import containment
+
+
+@pytest.mark.parametrize("network, expected", [
+    ("10.0.0.0/24", (167772160, 167772415)),
+    ("10.0.0.1/31", (167772160, 167772161)),
+    ("10.0.0.1/32", (167772161, 167772161)),
+    ("10.0.0.1", (167772161, 167772161)),
+    ("0.0.0.0/0", (0, 2 ** 32 - 1)),
+    ("2001:db8::1/127", (0x20010db8 << 96, (0x20010db8 << 96) + 1)),
+    ("::/0", (0, 2 ** 128 - 1)),
+])
+def test__interval(network, expected):
+    """containment.interval()."""
+    actual = containment.interval(network)
+    assert actual == expected
+
+
+@pytest.mark.parametrize("networks, expected", [
+    (["10.0.0.1/32", "10.0.0.0/24", "10.0.0.1/24", "1.0.0.0/8"],
+     ["1.0.0.0/8", "10.0.0.0/24", "10.0.0.1/24", "10.0.0.1/32"]),
+    (["2001:db8::1/64", "2001:db8::/48", "2001:db8::/64"],
+     ["2001:db8::/48", "2001:db8::/64", "2001:db8::1/64"]),
+])
+def test__sort_key(networks, expected):
+    """containment.sort_key()."""
+    actual = sorted(networks, key=containment.sort_key)
+    assert actual == expected
+
+
+@pytest.mark.parametrize("parents, children, strict, expected", [
+    ([], [], False, []),
+    ([], ["10.0.0.0/24"], False, [-1]),
+    (["10.0.0.0/24"], [], False, []),
+    # innermost parent
+    (["10.0.0.0/8", "10.0.0.0/16", "10.0.0.0/24"], ["10.0.0.1/32"], False, [2]),
+    (["10.0.0.0/24", "10.0.0.0/16", "10.0.0.0/8"], ["10.0.0.1/32"], False, [0]),
+    (["10.0.0.0/8", "10.0.0.0/16"], ["10.0.1.0/24", "10.1.0.0/24", "11.0.0.0/24"], False,
+     [1, 0, -1]),
+    # equal networks
+    (["10.0.0.0/24"], ["10.0.0.0/24"], False, [0]),
+    (["10.0.0.0/24"], ["10.0.0.0/24"], True, [-1]),
+    (["10.0.0.0/16", "10.0.0.0/24"], ["10.0.0.0/24"], True, [0]),
+    # address with mask
+    (["10.0.0.0/24", "10.0.0.0/31"], ["10.0.0.1/24"], False, [0]),
+    (["10.0.0.0/24", "10.0.0.0/31"], ["10.0.0.1/32"], False, [1]),
+    # disjoint parents
+    (["10.0.0.0/31", "10.0.0.4/31"], ["10.0.0.1", "10.0.0.2", "10.0.0.5"], False, [0, -1, 1]),
+])
+def test__find_parents(parents, children, strict, expected):
+    """containment.find_parents()."""
+    parents_ = [containment.interval(s) for s in parents]
+    children_ = [containment.interval(s) for s in children]
+
+    actual = containment.find_parents(parents=parents_, children=children_, strict=strict)
+
+    assert actual == expected
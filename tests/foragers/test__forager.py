@@ -7,10 +7,12 @@ import requests_mock
 from requests_mock import Mocker
 
 from nbforager.nb_forager import NbForager
+from nbforager.parser.nb_parser import NbPredicate
+from nbforager.types import DAny
 from tests import params as p
 from tests.foragers import params__forager as pf
 from tests.fixtures import nbf_, nbf_r, nbf_t
-from tests.foragers.fixtures__forager import connector_results
+from tests.foragers.fixtures__forager import path_params
 
 
 def test__interval():
@@ -100,23 +102,14 @@ def test__collect_nested_urls(nbf_, nb_objects, nbf_data, expected):
     assert actual == expected
 
 
-def test__clear_results(connector_results):
-    """Forager._clear_results()."""
-    nbf, path_params = connector_results
+def test__query_threads(path_params):
+    """Forager._query_threads()."""
+    nbf, path_params_ = path_params
+    nbf.threads = 2
 
-    nbf.ipam.vrfs._clear_results(path_params=path_params)
+    actual = nbf.ipam.vrfs._query_threads(path_params=path_params_)
 
-    assert nbf.api.circuits.circuit_terminations._results == []
-    assert nbf.api.ipam.vrfs._results == []
-
-
-def test__pop_connector_results(connector_results):
-    """Forager._pop_connector_results()."""
-    nbf, path_params = connector_results
-    actual = nbf.ipam.vrfs._pop_connector_results(path_params=path_params)
-    assert actual == [{"url": "circuit/circuit-terminations/1"}, {"url": "ipam/vrfs/1"}]
-    assert nbf.api.circuits.circuit_terminations._results == []
-    assert nbf.api.ipam.vrfs._results == []
+    assert actual == [{"url": "circuits/circuit-terminations/1"}, {"url": "ipam/vrfs/1"}]
 
 
 @pytest.mark.parametrize("path, expected", [
@@ -162,6 +155,89 @@ def mock_requests_vrfs():
         yield mock
 
 
+@pytest.mark.parametrize("kwargs, expected", [
+    ({}, (["comments", "id", "name", "url"], False)),
+    ({"fields": ["name"]}, (["id", "name", "url"], True)),
+    ({"exclude": ["comments"]}, (["id", "name", "url"], True)),
+])
+def test__get_root_data_from_netbox(kwargs, expected):
+    """Forager._get_root_data_from_netbox() projection."""
+    nbf = NbForager(host="netbox")
+    vrf1 = {"id": 1, "url": "https://netbox/api/ipam/vrfs/1/", "name": "A", "comments": ""}
+
+    def mock_fields(request, context) -> DAny:
+        """Mock Netbox fields parameter."""
+        _ = context  # noqa
+        fields = request.qs.get("fields", [",".join(vrf1)])[0].split(",")
+        return {"results": [{k: v for k, v in vrf1.items() if k in fields}]}
+
+    with requests_mock.Mocker() as mock:
+        mock.get("https://netbox/api/ipam/vrfs/", json=mock_fields)
+        nbf.ipam.vrfs._get_root_data_from_netbox(**kwargs)
+
+    data = nbf.root.ipam.vrfs[1]
+    actual = (sorted(s for s in data if s[0] != "_"), data["_partial"])
+    assert actual == expected
+
+
+def test__get_root_data_from_netbox__complete():
+    """Forager._get_root_data_from_netbox() partial objects do not replace complete."""
+    nbf = NbForager(host="netbox")
+    vrf1 = {"id": 1, "url": "https://netbox/api/ipam/vrfs/1/", "name": "A", "comments": ""}
+    with requests_mock.Mocker() as mock:
+        mock.get("https://netbox/api/ipam/vrfs/", json={"results": [vrf1]})
+        nbf.ipam.vrfs._get_root_data_from_netbox()
+        nbf.ipam.vrfs._get_root_data_from_netbox(exclude="comments")
+
+    actual = nbf.root.ipam.vrfs[1]
+    assert actual["comments"] == ""
+    assert actual["_partial"] is False
+
+
+@pytest.mark.parametrize("ids, expected", [
+    (None, [False, False, False]),
+    ([1], [False, True, False]),
+    ([3], [True, True, False]),
+])
+def test__complete(ids, expected):
+    """Forager.complete()."""
+    nbf = NbForager(host="netbox")
+    vrfs = [{"id": i, "url": f"https://netbox/api/ipam/vrfs/{i}/", "name": "A", "comments": ""}
+            for i in [1, 2, 3]]
+    nbf.root.ipam.vrfs.update({d["id"]: {"id": d["id"], "url": d["url"], "_partial": True}
+                               for d in vrfs[:2]})
+    nbf.root.ipam.vrfs[3] = {**vrfs[2], "_partial": False}
+
+    def mock_ids(request, context) -> DAny:
+        """Mock Netbox id parameter."""
+        _ = context  # noqa
+        ids_ = [int(s) for s in request.qs.get("id", [])]
+        return {"results": [d for d in vrfs if d["id"] in ids_]}
+
+    with requests_mock.Mocker() as mock:
+        mock.get("https://netbox/api/ipam/vrfs/", json=mock_ids)
+        nbf.ipam.vrfs.complete(ids=ids)
+
+    actual = [d["_partial"] for d in nbf.root.ipam.vrfs.values()]
+    assert actual == expected
+    for data in nbf.root.ipam.vrfs.values():
+        assert ("comments" in data) is not data["_partial"]
+
+
+def test__find_root__complete():
+    """Forager.find_root(complete=True)."""
+    nbf = NbForager(host="netbox")
+    vrf1 = {"id": 1, "url": "https://netbox/api/ipam/vrfs/1/", "name": "A", "comments": "B"}
+    nbf.root.ipam.vrfs[1] = {"id": 1, "url": vrf1["url"], "_partial": True}
+
+    assert nbf.ipam.vrfs.find_root(comments="B") == []
+    with requests_mock.Mocker() as mock:
+        mock.get("https://netbox/api/ipam/vrfs/", json={"results": [vrf1]})
+        actual = nbf.ipam.vrfs.find_root(complete=True, comments="B")
+
+    assert [d["id"] for d in actual] == [1]
+
+
 @pytest.mark.skip(reason="Has blocking effect")
 def test__get(mock_requests_vrfs: Mocker):  # pylint: disable=unused-argument
     """Forager.get().
@@ -191,6 +267,19 @@ def test__find_root(nbf_r: NbForager, params, expected: Any):
             nbf_r.dcim.devices.find_root(**params)
 
 
+@pytest.mark.parametrize("params, expected", pf.FIND)
+def test__find_root__predicate(nbf_r: NbForager, params, expected: Any):
+    """Forager.find_root(predicate)."""
+    if isinstance(expected, list):
+        predicate = NbPredicate(**params)
+        results = nbf_r.dcim.devices.find_root(predicate)
+        actual = [d["id"] for d in results]
+        assert actual == expected
+    else:
+        with pytest.raises(expected):
+            nbf_r.dcim.devices.find_root(NbPredicate(**params))
+
+
 @pytest.mark.parametrize("params, expected", pf.FIND)
 def test__find_tree(nbf_t: NbForager, params, expected):
     """Forager.find_tree()."""
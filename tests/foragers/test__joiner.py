@@ -3,7 +3,8 @@ import pytest
 from netports import IPv4
 
 from nbforager.api.base_mc import BaseMC
-from nbforager.foragers.joiner import Joiner
+from nbforager.foragers.joiner import Joiner, JoinIndex
+from nbforager.nb_tree import NbTree
 from nbforager.types import LStr, DAny
 from tests import params as p
 from tests.foragers.fixtures__joiner import joiner
@@ -61,9 +62,75 @@ def test__join_virtual_chassis(joiner: Joiner):
     assert actual == expected
 
 
-def test__join_ipam_ipv4(joiner: Joiner):
-    """Joiner.join_ipam_ipv4()."""
-    joiner.join_ipam_ipv4(ipam=True)
+@pytest.mark.parametrize("keys, expected", [
+    (set(), set()),
+    ({("dcim", "interfaces", 11)}, {
+        ("dcim", "console_ports", 17),
+        ("dcim", "devices", 1),
+        ("dcim", "interfaces", 11),
+        ("dcim", "interfaces", 12),
+    }),
+    ({("dcim", "devices", 4)}, {
+        ("dcim", "devices", 3),
+        ("dcim", "devices", 4),
+        ("dcim", "interfaces", 14),
+        ("dcim", "interfaces", 15),
+    }),
+    ({("ipam", "prefixes", 14)}, {
+        ("ipam", "aggregates", 1),
+        ("ipam", "ip_addresses", 21),
+        ("ipam", "ip_addresses", 23),
+        ("ipam", "ip_addresses", 24),
+        ("ipam", "prefixes", 11),
+        ("ipam", "prefixes", 13),
+        ("ipam", "prefixes", 14),
+        ("ipam", "prefixes", 15),
+    }),
+    ({("ipam", "ip_addresses", 22)}, {
+        ("ipam", "aggregates", 2),
+        ("ipam", "ip_addresses", 22),
+        ("ipam", "prefixes", 12),
+    }),
+])
+def test__affected_keys(joiner: Joiner, keys, expected):
+    """Joiner.affected_keys()."""
+    actual = joiner.affected_keys(keys)
+    assert actual == expected
+
+
+def test__update(joiner: Joiner):
+    """JoinIndex.update()."""
+    index = JoinIndex(joiner.tree)
+    assert index.device_ports({1}) == {
+        ("dcim", "console_ports", 17),
+        ("dcim", "interfaces", 11),
+        ("dcim", "interfaces", 12),
+    }
+    assert index.vc_members({3}) == {3, 4}
+    assert index.assigned_addresses([11, 13], "dcim.interface") == {21, 23}
+    assert index.assigned_addresses([1], "virtualization.vminterface") == {24}
+    url = joiner.tree.dcim.devices[1]["url"]
+    assert ("dcim", "interfaces", 11) in index.nested_keys({url})
+
+    del joiner.tree.dcim.interfaces[12]
+    del joiner.tree.dcim.devices[4]
+    index.update(tree=joiner.tree, keys={("dcim", "interfaces", 12), ("dcim", "devices", 4)})
+
+    assert index.device_ports({1}) == {
+        ("dcim", "console_ports", 17),
+        ("dcim", "interfaces", 11),
+    }
+    assert index.vc_members({3}) == {3}
+    assert index.scope_keys({("ipam", "ip_addresses", 22)}) == {
+        ("ipam", "aggregates", 2),
+        ("ipam", "ip_addresses", 22),
+        ("ipam", "prefixes", 12),
+    }
+
+
+def test__join_ipam(joiner: Joiner):
+    """Joiner.join_ipam()."""
+    joiner.join_ipam(ipam=True)
 
     aggregate = joiner.tree.ipam.aggregates[p.AG1]
     assert aggregate["prefix"] == p.AGGREGATE1
@@ -106,6 +173,76 @@ def test__join_ipam_ipv4(joiner: Joiner):
     assert ip_address["_ip_addresses"] == []
 
 
+def test__join_ipam__ipv6_vrf():
+    """Joiner.join_ipam() IPv6 and VRF hierarchies."""
+    tree = NbTree()
+    vrf = {"id": 1, "url": "/api/ipam/vrfs/1/", "name": "VRF1"}
+    for model, key, idx, network, vrf_ in [
+        ("aggregates", "prefix", 1, "2001:db8::/32", None),
+        ("prefixes", "prefix", 11, "2001:db8::/48", None),
+        ("prefixes", "prefix", 12, "2001:db8::/64", None),
+        ("prefixes", "prefix", 13, "2001:db8::/48", vrf),
+        ("ip_addresses", "address", 21, "2001:db8::1/64", None),
+        ("ip_addresses", "address", 22, "2001:db8::1/64", vrf),
+    ]:
+        url = f"/api/ipam/{model.replace('_', '-')}/{idx}/"
+        data = {"id": idx, "url": url, key: network, "family": {"value": 6}, "vrf": vrf_}
+        getattr(tree.ipam, model)[idx] = data
+    joiner = Joiner(tree)
+    joiner.init_extra_keys()
+
+    joiner.join_ipam(ipam=True)
+
+    aggregate = tree.ipam.aggregates[1]
+    assert "_ipv4" not in aggregate
+    assert [d["id"] for d in aggregate["_sub_prefixes"]] == [11]
+    for idx, aggregate_id, super_id, sub_ids, address_ids in [
+        (11, 1, None, [12], []),
+        (12, 1, 11, [], [21]),
+        (13, 1, None, [], [22]),
+    ]:
+        prefix = tree.ipam.prefixes[idx]
+        assert prefix["_aggregate"].get("id") == aggregate_id
+        assert prefix["_super_prefix"].get("id") == super_id
+        assert [d["id"] for d in prefix["_sub_prefixes"]] == sub_ids
+        assert [d["id"] for d in prefix["_ip_addresses"]] == address_ids
+    for idx, super_id in [(21, 12), (22, 13)]:
+        ip_address = tree.ipam.ip_addresses[idx]
+        assert ip_address["_aggregate"]["id"] == 1
+        assert ip_address["_super_prefix"]["id"] == super_id
+
+
+def test__join_ipam_ipv4():
+    """Joiner.join_ipam_ipv4() only IPv4 objects of the global table."""
+    tree = NbTree()
+    vrf = {"id": 1, "url": "/api/ipam/vrfs/1/", "name": "VRF1"}
+    for idx, network, family, vrf_ in [
+        (11, "10.0.0.0/16", 4, None),
+        (12, "10.0.0.0/24", 4, None),
+        (13, "10.0.0.0/24", 4, vrf),
+        (14, "2001:db8::/48", 6, None),
+        (15, "2001:db8::/64", 6, None),
+    ]:
+        url = f"/api/ipam/prefixes/{idx}/"
+        data = {"id": idx, "url": url, "prefix": network, "family": {"value": family}, "vrf": vrf_}
+        tree.ipam.prefixes[idx] = data
+    joiner = Joiner(tree)
+    joiner.init_extra_keys()
+
+    joiner.join_ipam_ipv4(ipam=True)
+
+    for idx, super_id, sub_ids in [
+        (11, None, [12]),
+        (12, 11, []),
+        (13, None, []),
+        (14, None, []),
+        (15, None, []),
+    ]:
+        prefix = tree.ipam.prefixes[idx]
+        assert prefix["_super_prefix"].get("id") == super_id
+        assert [d["id"] for d in prefix["_sub_prefixes"]] == sub_ids
+
+
 def test__join_ipam_aggregates(joiner: Joiner):
     """Joiner._join_ipam_aggregates()."""
     joiner._join_ipam_aggregates()
@@ -126,7 +263,7 @@ def test__join_ipam_aggregates(joiner: Joiner):
     for idx, prefix, aggregate_ in [
         (p.P1, "10.0.0.0/24", "10.0.0.0/16"),
         (p.P2, "1.0.0.0/24", "1.0.0.0/16"),
-        (p.P3, "10.0.0.0/24", None),
+        (p.P3, "10.0.0.0/24", "10.0.0.0/16"),  # vrf
         (p.P4, "10.0.0.0/31", "10.0.0.0/16"),
         (p.P5, "10.0.0.0/32", "10.0.0.0/16"),
     ]:
@@ -144,7 +281,7 @@ def test__extra__join_ipam_ip_addresses(joiner: Joiner):
     for idx, network, aggregate, super_prefix, is_vrf in [
         (p.A1, p.ADDRESS1, p.AGGREGATE1, p.PREFIX1, False),
         (p.A2, p.ADDRESS2, p.AGGREGATE2, p.PREFIX2, False),
-        (p.A3, p.ADDRESS3, None, None, True),
+        (p.A3, p.ADDRESS3, p.AGGREGATE1, p.PREFIX1, True),
     ]:
         data = joiner.tree.ipam.ip_addresses[idx]
         assert data["_ipv4"] == IPv4(network)
@@ -163,7 +300,7 @@ def test__join_ipam_prefixes(joiner: Joiner):
     for idx, network, aggregate, super_prefix, sub_prefixes, vrf in [
         (p.P1, p.PREFIX1, p.AGGREGATE1, None, [p.PREFIX4], False),
         (p.P2, p.PREFIX2, p.AGGREGATE2, None, [], False),
-        (p.P3, p.PREFIX1, None, None, [], True),
+        (p.P3, p.PREFIX1, p.AGGREGATE1, None, [], True),
         (p.P4, p.PREFIX4, p.AGGREGATE1, p.PREFIX1, [p.PREFIX5], False),
         (p.P5, p.PREFIX5, p.AGGREGATE1, p.PREFIX4, [], False),
     ]:
@@ -178,45 +315,34 @@ def test__join_ipam_prefixes(joiner: Joiner):
 
 # ============================= helpers ==============================
 
-def test__filter_aggregates_ip4(joiner: Joiner):
-    """Joiner._filter_aggregates_ip4()."""
+def test__group_aggregates(joiner: Joiner):
+    """Joiner._group_aggregates()."""
     unsorted = [d["prefix"] for d in joiner.tree.ipam.aggregates.values()]
     assert unsorted == [p.AGGREGATE1, p.AGGREGATE2]
 
-    aggregates = joiner._filter_aggregates_ip4()
+    groups = joiner._group_aggregates()
 
-    actual = [d["prefix"] for d in aggregates]
-    assert actual == [p.AGGREGATE2, p.AGGREGATE1]
+    actual = {k: [d["prefix"] for d in v] for k, v in groups.items()}
+    assert actual == {4: [p.AGGREGATE2, p.AGGREGATE1]}
 
 
-def test__filter_ip_addresses_ip4(joiner: Joiner):
-    """Joiner._filter_ip_addresses_ip4()."""
+def test__group_ip_addresses(joiner: Joiner):
+    """Joiner._group_ip_addresses()."""
     unsorted = [d["address"] for d in joiner.tree.ipam.ip_addresses.values()]
     assert unsorted == [p.ADDRESS1, p.ADDRESS2, p.ADDRESS3, p.ADDRESS4]
 
-    ip_addresses = joiner._filter_ip_addresses_ip4()
-
-    actual = [d["address"] for d in ip_addresses]
-    assert actual == [p.ADDRESS2, p.ADDRESS1]
-
-
-def test__filter_prefixes_ip4(joiner: Joiner):
-    """Joiner._filter_prefixes_ip4()."""
-    unsorted = [d["prefix"] for d in joiner.tree.ipam.prefixes.values()]
-    assert unsorted == [p.PREFIX1, p.PREFIX2, p.PREFIX1, p.PREFIX4, p.PREFIX5]
-
-    prefixes = joiner._filter_prefixes_ip4()
+    groups = joiner._group_ip_addresses()
 
-    actual = [d["prefix"] for d in prefixes]
-    assert actual == [p.PREFIX2, p.PREFIX1, p.PREFIX4, p.PREFIX5]
+    actual = {k: [d["address"] for d in v] for k, v in groups.items()}
+    assert actual == {(4, 0): [p.ADDRESS2, p.ADDRESS1], (4, 1): [p.ADDRESS3, p.ADDRESS4]}
 
 
-def test__group_prefixes_ip4(joiner: Joiner):
-    """Joiner._group_prefixes_ip4()."""
+def test__group_prefixes(joiner: Joiner):
+    """Joiner._group_prefixes()."""
     unsorted = [d["prefix"] for d in joiner.tree.ipam.prefixes.values()]
     assert unsorted == [p.PREFIX1, p.PREFIX2, p.PREFIX1, p.PREFIX4, p.PREFIX5]
 
-    prefixes_d = joiner._group_prefixes_ip4()
+    groups = joiner._group_prefixes()
 
-    actual = {k: [d["prefix"] for d in ld] for k, ld in prefixes_d.items()}
-    assert actual == {0: [p.PREFIX2, p.PREFIX1], 1: [p.PREFIX4], 2: [p.PREFIX5]}
+    actual = {k: [d["prefix"] for d in v] for k, v in groups.items()}
+    assert actual == {(4, 0): [p.PREFIX2, p.PREFIX1, p.PREFIX4, p.PREFIX5], (4, 1): [p.PREFIX1]}
@@ -17,6 +17,13 @@ ATTRS = [
     "strict",
     "extended_get",
     "loners",
+    "extended_get_ttl",
+    "extended_get_size",
+    "max_in_flight",
+    "endpoint_limits",
+    "adaptive",
+    "keyset",
+    "pool_size",
     "kwargs",
 ]
 APPS = [
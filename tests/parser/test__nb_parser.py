@@ -1,5 +1,7 @@
 """Tests nbforager/parser/nb_parser.py"""
 
+from typing import Any
+
 import pytest
 
 from nbforager.exceptions import NbParserError, NbVersionError
@@ -856,6 +858,18 @@ def test__strict_str(nbp, keys: LStr, params, expected):
             nbp.strict_str(*keys)
 
 
+@pytest.mark.parametrize("params, expected", [
+    ({"data": {"url": "/api/ipam/vrfs/1/", "_partial": False}}, "/api/ipam/vrfs/1/"),
+    ({"data": {"url": "/api/ipam/vrfs/1/", "_partial": True}}, "partial object"),
+])
+def test__strict_str__partial(nbp, params, expected):
+    """NbParser.strict_str() error message of partial object."""
+    with pytest.raises(NbParserError) as exc_info:
+        nbp.strict_str("name")
+
+    assert expected in str(exc_info.value)
+
+
 @pytest.mark.parametrize("objects, params, expected", [
     ([{"id": 1}, {"id": 2}], {}, [1, 2]),
     ([{"id": 1}, {"id": 2}], {"id": 1}, [1]),
@@ -872,3 +886,139 @@ def test__find_objects(objects, params, expected):
     results = nb_parser.find_objects(objects=objects, **params)
     actual = [d["id"] for d in results]
     assert actual == expected
+
+
+@pytest.mark.parametrize("params, data, expected", [
+    ({}, {"id": 1}, True),
+    ({"id": 1}, {"id": 1}, True),
+    ({"id": [2, 1]}, {"id": 1}, True),
+    ({"id": 2}, {"id": 1}, False),
+    ({"k1__k2": "A"}, {"k1": {"k2": "A"}}, True),
+    ({"k1__k2": "A"}, {"k1": None}, False),
+    ({"k1__k2": None}, {"k1": None}, True),
+    ({"k1": {"k2": "A"}}, {"k1": {"k2": "A"}}, True),  # unhashable value
+    ({"k1": None}, {"k1": {"k2": "A"}}, False),  # unhashable object value
+    ({"tags__slug": "B"}, {"tags": [{"slug": "A"}, {"slug": "B"}]}, True),
+    ({"tags__slug": "C"}, {"tags": [{"slug": "A"}, {"slug": "B"}]}, False),
+    ({"id": 1, "tags__slug": "A"}, {"id": 1, "tags": [{"slug": "A"}]}, True),
+    ({"id": 2, "tags__slug": "A"}, {"id": 1}, False),  # single pass, tags are not checked
+    ({"tags__slug": "A"}, {"id": 1}, KeyError),
+    ({"tags": "A"}, {"id": 1}, ValueError),
+])
+def test__nb_predicate__call(params, data, expected: Any):
+    """NbPredicate.__call__()."""
+    if isinstance(expected, bool):
+        predicate = nb_parser.NbPredicate(**params)
+        actual = predicate(data)
+        assert actual is expected
+    else:
+        with pytest.raises(expected):
+            nb_parser.NbPredicate(**params)(data)
+
+
+def test__nb_predicate__and():
+    """NbPredicate.__and__(), NbPredicate.__eq__(), NbPredicate.__hash__()."""
+    predicate1 = nb_parser.NbPredicate(id=[1, 2])
+    predicate2 = nb_parser.NbPredicate(id=[2, 3])
+
+    predicate = predicate1 & predicate2
+
+    assert predicate({"id": 2}) is True
+    assert predicate({"id": 1}) is False
+    assert predicate == nb_parser.NbPredicate(id=[1, 2]) & nb_parser.NbPredicate(id=[3, 2])
+    assert predicate != predicate1
+    assert {predicate: 1}.get(predicate1 & predicate2) == 1
+    assert repr(predicate) == "<NbPredicate: id=[1, 2], id=[2, 3]>"
+    predicate3 = nb_parser.NbPredicate(site={"slug": "s1"})  # unhashable value
+    assert {predicate3: 1}.get(nb_parser.NbPredicate(site={"slug": "s1"})) == 1
+
+
+@pytest.mark.parametrize("params, expected", [
+    ({}, [1, 2]),
+    ({"k1": "A"}, [1]),
+    ({"predicate": nb_parser.NbPredicate(k1=["A", "B"])}, [1, 2]),
+    ({"predicate": nb_parser.NbPredicate(k1=["A", "B"]), "id": 2}, [2]),
+])
+def test__find_objects__predicate(params, expected):
+    """nb_parser.find_objects(predicate)."""
+    objects = [{"id": 1, "k1": "A"}, {"id": 2, "k1": "B"}]
+    results = nb_parser.find_objects(objects=objects, **params)
+    actual = [d["id"] for d in results]
+    assert actual == expected
+
+
+@pytest.mark.parametrize("objects, key, expected", [
+    ([], "id", {}),
+    ([{"id": 1}, {"id": 2}, {"id": 1}], "id", {1: [0, 2], 2: [1]}),
+    ([{"id": 1, "k1": {"k2": "A"}}, {"id": 2, "k1": None}], "k1__k2", {"A": [0], None: [1]}),
+    ([{"tags": [{"slug": "A"}, {"slug": "A"}]}, {"tags": []}], "tags__slug", {"A": [0]}),
+    ([{"id": 1, "k1": {"k2": "A"}}], "k1", None),
+])
+def test__index_objects(objects, key, expected):
+    """nb_parser.index_objects()."""
+    actual = nb_parser.index_objects(objects=objects, key=key)
+    assert actual == expected
+
+
+@pytest.mark.parametrize("key, expected", [
+    ("id", ["id"]),
+    ("site__slug", ["site", "slug"]),
+    ("tags__slug", ["tags", "slug"]),
+    ("tags", ValueError),
+    ("tags__slug__name", ValueError),
+    (1, TypeError),
+])
+def test__split_key(key, expected: Any):
+    """nb_parser.split_key()."""
+    if isinstance(expected, list):
+        actual = nb_parser.split_key(key)
+        assert actual == expected
+    else:
+        with pytest.raises(expected):
+            nb_parser.split_key(key)
+
+
+# ============================= helpers ==============================
+
+
+@pytest.mark.parametrize("path, exp_models, exp_types", [
+    ("", [], []),
+    ("https://netbox/api/ipam/vrfs/", [], []),
+    ("https://netbox/api/dcim/devices/", [("dcim/devices", "device_role", "role")], [
+        ("dcim/devices", ["primary_ip", "family"], dict),
+        ("dcim/devices", ["primary_ip4", "family"], dict),
+    ]),
+    ("https://netbox/api/extras/object-changes/",
+     [("extras/object-changes", "", "core/object-changes")], []),
+])
+def test__deprecated(path, exp_models, exp_types):
+    """nb_parser._deprecated()."""
+    actual = nb_parser._deprecated(path)
+    assert actual == (exp_models, exp_types)
+    assert nb_parser._deprecated(path) is actual
+
+
+@pytest.mark.parametrize("version, expected", [
+    ("", False),
+    ("3.6", True),
+    ("4.1.11", True),
+    ("4.2", False),
+    ("4.3.1", False),
+])
+def test__is_old_version(version, expected):
+    """nb_parser._is_old_version()."""
+    actual = nb_parser._is_old_version(version)
+    assert actual is expected
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("", ""),
+    ("https://netbox/api/dcim/devices/1/", "https://netbox/api/dcim/devices/"),
+    ("https://netbox/api/dcim/devices/12", "https://netbox/api/dcim/devices/"),
+    ("https://netbox/api/dcim/devices/", "https://netbox/api/dcim/devices/"),
+    ("/api/ipam/vrfs/1/", "/api/ipam/vrfs/"),
+])
+def test__url_path(url, expected):
+    """nb_parser._url_path()."""
+    actual = nb_parser._url_path(url)
+    assert actual == expected
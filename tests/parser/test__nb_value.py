@@ -2,7 +2,7 @@
 
 import pytest
 
-from nbforager.exceptions import NbParserError
+from nbforager.exceptions import NbParserError, NbVersionError
 from nbforager.parser.nb_value import NbValue
 from nbforager.types import DAny
 from tests.parser import params__nb_value as p
@@ -787,3 +787,46 @@ def test__is_vrf(nbv, params, expected):
     """NbValue.is_vrf()."""
     actual = nbv.is_vrf()
     assert actual == expected
+
+
+@pytest.mark.parametrize("objects, fields, strict, expected", [
+    ([], ["name"], False, {"name": []}),
+    ([{"name": "A"}, {"name": "B"}], [], False, {}),
+    ([{"name": "A", "site": {"slug": "S"}, "url": "/api/dcim/devices/1/"}, {"name": "B"}],
+     ["name", "site_slug", "name"], False, {"name": ["A", "B"], "site_slug": ["S", ""]}),
+    ([{"id": 1, "vrf": {"id": 2}}], ["id_", "is_vrf", "vrf_id"], False,
+     {"id_": [1], "is_vrf": [True], "vrf_id": [2]}),
+    ([{"name": "A"}, {"name": ""}], ["name"], True, NbParserError),
+    ([{"name": "A"}], ["is_dcim"], False, ValueError),
+    ([{"name": "A"}], ["_source"], False, ValueError),
+    ([{"name": "A"}], ["unknown"], False, ValueError),
+])
+def test__extract_many(objects, fields, strict, expected):
+    """NbValue.extract_many()."""
+    if isinstance(expected, dict):
+        actual = NbValue.extract_many(objects=objects, fields=fields, strict=strict)
+        assert actual == expected
+    else:
+        with pytest.raises(expected):
+            NbValue.extract_many(objects=objects, fields=fields, strict=strict)
+
+
+def test__extract_many__frame():
+    """NbValue.extract_many(frame=True)."""
+    pandas = pytest.importorskip("pandas")
+    objects = [{"name": "A", "site": {"slug": "S"}}, {"name": "B"}]
+
+    actual = NbValue.extract_many(objects=objects, fields=["name", "site_slug"], frame=True)
+
+    assert isinstance(actual, pandas.DataFrame)
+    assert actual.to_dict("list") == {"name": ["A", "B"], "site_slug": ["S", ""]}
+
+
+def test__extract_many__version():
+    """NbValue.extract_many(version) deprecated model."""
+    objects = [{"url": "/api/extras/object-changes/1/", "display": "A"}]
+    with pytest.raises(NbVersionError):
+        NbValue.extract_many(objects=objects, fields=["display"])
+
+    actual = NbValue.extract_many(objects=objects, fields=["display"], version="4.1")
+    assert actual == {"display": ["A"]}
@@ -0,0 +1,133 @@
+"""Tests nbforager/async_nb_api.py."""
+import asyncio
+import json
+
+import pytest
+
+from nbforager.async_nb_api import AsyncNbApi
+from nbforager.types import DAny
+
+aiohttp = pytest.importorskip("aiohttp")
+web = pytest.importorskip("aiohttp.web")
+test_utils = pytest.importorskip("aiohttp.test_utils")
+
+ADDRESSES = [{"id": i, "url": f"/api/ipam/ip-addresses/{i}/", "address": f"10.0.0.{i}/24"}
+             for i in range(1, 8)]
+VRFS = [{"id": 1, "url": "/api/ipam/vrfs/1/", "name": "VRF 1"}]
+
+
+def create_app(requests: list) -> web.Application:
+    """Stub of Netbox REST API."""
+
+    async def get_objects(request: web.Request) -> web.Response:
+        requests.append(request.path_qs)
+        objects = VRFS if "vrfs" in request.path else ADDRESSES
+        if "vrf_id" in request.query:
+            objects = objects[:1]
+        if "name" in request.query:
+            objects = [d for d in objects if d["name"] in request.query.getall("name")]
+        if "tag" in request.query:
+            return web.Response(status=400, text="tag not found")
+        limit = int(request.query.get("limit", 50))
+        offset = int(request.query.get("offset", 0))
+        data = {"count": len(objects), "results": objects[offset:offset + limit]}
+        return web.json_response(data)
+
+    async def create_object(request: web.Request) -> web.Response:
+        data = await request.json()
+        return web.json_response({"id": 9, **data}, status=201)
+
+    async def update_object(request: web.Request) -> web.Response:
+        data = await request.json()
+        return web.json_response({"id": int(request.match_info["id"]), **data})
+
+    async def delete_object(request: web.Request) -> web.Response:
+        _ = request  # noqa
+        return web.Response(status=204)
+
+    app = web.Application()
+    app.router.add_get("/api/{app}/{model}/", get_objects)
+    app.router.add_post("/api/{app}/{model}/", create_object)
+    app.router.add_patch("/api/{app}/{model}/{id}/", update_object)
+    app.router.add_delete("/api/{app}/{model}/{id}", delete_object)
+    return app
+
+
+def run(coroutine_f, **kwargs):
+    """Run coroutine against the stub of Netbox REST API."""
+
+    async def main():
+        requests: list = []
+        server = test_utils.TestServer(create_app(requests))
+        await server.start_server()
+        try:
+            params: DAny = {"host": server.host, "port": server.port, "scheme": "http", **kwargs}
+            async with AsyncNbApi(**params) as api:
+                result = await coroutine_f(api)
+        finally:
+            await server.close()
+        return result, requests
+
+    return asyncio.run(main())
+
+
+def test__connector_by_path():
+    """AsyncNbApi.connector_by_path()."""
+    api = AsyncNbApi(host="nb")
+
+    connector = api.connector_by_path("ipam/ip-addresses")
+
+    assert connector is api.ipam.ip_addresses
+    assert connector.url == "https://nb/api/ipam/ip-addresses/"
+    with pytest.raises(AttributeError):
+        _ = api.ipam.typo
+
+
+@pytest.mark.parametrize("params, kwargs, expected, count", [
+    ({"limit": 1000}, {}, [1, 2, 3, 4, 5, 6, 7], 1),
+    ({"limit": 3}, {}, [1, 2, 3, 4, 5, 6, 7], 3),
+    ({"limit": 3}, {"offset": 3}, [4, 5, 6], 1),
+    ({"limit": 3}, {"vrf": "VRF 1"}, [1], 2),
+    ({"limit": 3}, {"tag": "typo"}, [], 1),
+])
+def test__get(params, kwargs, expected, count):
+    """AsyncConnector.get()."""
+    items, requests = run(lambda api: api.ipam.ip_addresses.get(**kwargs), **params)
+
+    actual = [d["id"] for d in items]
+    assert actual == expected
+    assert len(requests) == count
+
+
+def test__get_count():
+    """AsyncConnector.get_count()."""
+    actual, requests = run(lambda api: api.ipam.ip_addresses.get_count())
+
+    assert actual == 7
+    assert requests == ["/api/ipam/ip-addresses/?brief=1&limit=1"]
+
+
+def test__create():
+    """AsyncConnector.create() create_d()."""
+    response, _ = run(lambda api: api.ipam.ip_addresses.create(address="10.0.0.9/24"))
+    assert response.status_code == 201
+    assert json.loads(response.content) == {"id": 9, "address": "10.0.0.9/24"}
+
+    actual, _ = run(lambda api: api.ipam.ip_addresses.create_d(address="10.0.0.9/24"))
+    assert actual == {"id": 9, "address": "10.0.0.9/24"}
+
+
+def test__update():
+    """AsyncConnector.update() update_d()."""
+    response, _ = run(lambda api: api.ipam.ip_addresses.update(id=1, status="active"))
+    assert response.status_code == 200
+
+    actual, _ = run(lambda api: api.ipam.ip_addresses.update_d(id=1, status="active"))
+    assert actual == {"id": 1, "status": "active"}
+
+
+def test__delete():
+    """AsyncConnector.delete()."""
+    response, _ = run(lambda api: api.ipam.ip_addresses.delete(id=1))
+
+    assert response.status_code == 204
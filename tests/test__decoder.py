@@ -0,0 +1,58 @@
+"""Tests nbforager/decoder.py."""
+import json
+from typing import Any
+
+import pytest
+
+from nbforager import decoder
+
+
+@pytest.fixture
+def restore_decoder():
+    """Restore the default decoder after the test."""
+    yield
+    decoder.set_decoder()
+
+
+def test__decoders():
+    """decoder.DECODERS."""
+    actual = list(decoder.DECODERS)
+
+    assert actual[-1] == "json"
+    assert decoder.get_decoder() is decoder.DECODERS[actual[0]]
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("", "default"),
+    ("json", json.loads),
+    ("typo", ValueError),
+    (json.loads, json.loads),
+])
+def test__set_decoder(restore_decoder, name, expected: Any):
+    """decoder.set_decoder()."""
+    if isinstance(expected, type):
+        with pytest.raises(expected):
+            decoder.set_decoder(name)
+        return
+
+    decoder.set_decoder(name)
+
+    actual = decoder.get_decoder()
+    if expected == "default":
+        expected = next(iter(decoder.DECODERS.values()))
+    assert actual is expected
+
+
+@pytest.mark.parametrize("content, expected", [
+    (b'{"id": 1, "name": "\\u00e9"}', {"id": 1, "name": "é"}),
+    ('{"id": 1}', {"id": 1}),
+    (b"[]", []),
+])
+def test__loads(restore_decoder, content, expected):
+    """decoder.loads()."""
+    for name in decoder.DECODERS:
+        decoder.set_decoder(name)
+
+        actual = decoder.loads(content)
+
+        assert actual == expected
@@ -237,6 +237,36 @@ def test__validate_values(values, expected):
     assert actual == expected
 
 
+@pytest.mark.parametrize("params_d, expected", [
+    ({}, {}),
+    ({"a": [1]}, {"a": [1]}),
+    ({"fields": ["name"]}, {"fields": ["id,url,name"]}),
+    ({"fields": ["name,id", "tags"]}, {"fields": ["id,url,name,tags"]}),
+    ({"exclude": ["config_context"]}, {"exclude": ["config_context"]}),
+    ({"exclude": ["config_context, comments", "url"]}, {"exclude": ["config_context,comments"]}),
+    ({"exclude": ["id", ""]}, {}),
+])
+def test__change_params_projection(params_d, expected):
+    """helpers.change_params_projection()."""
+    actual = helpers.change_params_projection(params_d=params_d)
+    assert actual == expected
+
+
+@pytest.mark.parametrize("params_ld, expected", [
+    ([{}], [{"id": 1, "comments": "", "config_context": {}}]),
+    ([{"exclude": ["config_context"]}], [{"id": 1, "comments": ""}]),
+    ([{"exclude": ["config_context,comments"]}], [{"id": 1}]),
+    ([{"exclude": ["comments"]}, {"exclude": ["typo"]}], [{"id": 1, "config_context": {}}]),
+])
+def test__pop_excluded_keys(params_ld, expected):
+    """helpers.pop_excluded_keys()."""
+    items = [{"id": 1, "comments": "", "config_context": {}}]
+
+    helpers.pop_excluded_keys(items=items, params_ld=params_ld)
+
+    assert items == expected
+
+
 @pytest.mark.parametrize("params_d, expected", [
     ({}, ""),
     ({"a": [1]}, "a"),
@@ -0,0 +1,112 @@
+"""Tests nbforager/messages.py."""
+import logging
+
+import pytest
+
+from nbforager.messages import Messages, Msg
+
+
+def test__msg__slots():
+    """Msg.__slots__."""
+    msg = Msg(level="info", name="A", text="B")
+    assert not hasattr(msg, "__dict__")
+    assert repr(msg) == "<Msg: INFO: : A: B>"
+
+
+@pytest.mark.parametrize("capacity, levels, exp_levels, exp_counts, exp_dropped", [
+    (0, [], [], [0, 0, 0], [0, 0, 0]),
+    (0, ["info", "warning", "error", "info"], ["info", "warning", "error", "info"],
+     [2, 1, 1], [0, 0, 0]),
+    (2, ["info", "warning", "error", "info"], ["error", "info"], [1, 0, 1], [1, 1, 0]),
+    (1, ["error", "info"], ["info"], [1, 0, 0], [0, 0, 1]),
+])
+def test__add(capacity, levels, exp_levels, exp_counts, exp_dropped):
+    """Messages.add()."""
+    msgs = Messages(name="A", capacity=capacity)
+    for level in levels:
+        msgs.add(level=level, name="A", text="B")
+
+    assert [o.level for o in msgs.items] == exp_levels
+    assert msgs.count() == len(exp_levels)
+    assert [msgs.counts[s] for s in ["info", "warning", "error"]] == exp_counts
+    assert [msgs.dropped[s] for s in ["info", "warning", "error"]] == exp_dropped
+
+
+def test__repr():
+    """Messages.__repr__()."""
+    msgs = Messages(capacity=2)
+    msgs.info("A")
+    assert repr(msgs) == "<Messages: msgs=1, info=1>"
+
+    msgs.warning("B")
+    msgs.error("C")
+    assert repr(msgs) == "<Messages: msgs=2, warning=1, error=1, dropped=1>"
+
+    msgs.clear()
+    assert repr(msgs) == "<Messages: >"
+
+
+@pytest.mark.parametrize("levels, exp_warnings, exp_error", [
+    ([], False, False),
+    (["info"], False, False),
+    (["warning", "info", "info"], True, False),  # dropped warning
+    (["error", "info", "info"], True, True),  # dropped error
+])
+def test__is_warnings(levels, exp_warnings, exp_error):
+    """Messages.is_warnings(), Messages.is_error()."""
+    msgs = Messages(capacity=2)
+    for level in levels:
+        msgs.add(level=level, name="", text="")
+
+    assert msgs.is_warnings() is exp_warnings
+    assert msgs.is_error() is exp_error
+
+
+def test__update():
+    """Messages.update()."""
+    msgs1 = Messages(name="A")
+    msgs1.info("1")
+    msgs2 = Messages(name="B")
+    msgs2.warning("2")
+
+    msgs1.update([msgs2, msgs2, msgs1])
+
+    assert [o.text for o in msgs1.items] == ["1", "2"]
+    assert msgs1.counts["warning"] == 1
+
+
+@pytest.mark.parametrize("capacity, batch, texts, exp_logs, exp_flush", [
+    (0, 0, ["1", "2", "3"], [], ["A: 1", "A: 2", "A: 3"]),
+    (2, 0, ["1", "2", "3", "4"], ["A: 1", "A: 2"], ["A: 3", "A: 4"]),  # logged before drop
+    (0, 2, ["1", "2", "3"], ["A: 1", "A: 2"], ["A: 3"]),
+    (0, 1, ["1", "2", "3"], ["A: 1", "A: 2", "A: 3"], []),
+    (2, 3, ["1", "2", "3", "4"], ["A: 1", "A: 2"], ["A: 3", "A: 4"]),  # logged before drop
+    (2, 3, ["1", "2", "3", "4", "5"], ["A: 1", "A: 2", "A: 3", "A: 4"], ["A: 5"]),
+])
+def test__flush(caplog, capacity, batch, texts, exp_logs, exp_flush):
+    """Messages.flush() on adding by batches."""
+    caplog.set_level(logging.INFO)
+    msgs = Messages(name="A", capacity=capacity, batch=batch)
+    for text in texts:
+        msgs.info(text)
+    assert [r.message for r in caplog.records] == exp_logs
+
+    caplog.clear()
+    msgs.flush()
+    msgs.flush()
+    assert [r.message for r in caplog.records] == exp_flush
+
+
+def test__logging(caplog):
+    """Messages.logging()."""
+    caplog.set_level(logging.INFO)
+    msgs = Messages(name="A")
+    msgs.info("1")
+    msgs.add(level="example", name="", text="2")
+
+    msgs.logging()
+
+    assert [(r.levelname, r.message) for r in caplog.records] == [
+        ("INFO", "A: 1"),
+        ("WARNING", "EXAMPLE: 2"),
+    ]
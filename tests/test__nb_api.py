@@ -50,6 +50,16 @@ def test__init__(api_):
     assert set(actual).symmetric_difference(set(expected)) == set()
     assert actual == expected
 
+    # connectors are created on the first access
+    api = NbApi(host="nb")
+    assert not [s for s in vars(api.ipam) if s[0].islower()]
+    assert api.ipam.vrfs is api.connector_by_path("ipam/vrfs")
+    assert [s for s in vars(api.ipam) if s[0].islower()] == ["vrfs"]
+
+    # unknown keyword argument
+    with pytest.raises(TypeError):
+        NbApi(host="nb", max_inflight=2)
+
 @pytest.mark.parametrize("params", [
     ({"host": "nb", "token": "token", "scheme": "http", "port": 2, "verify": False, "limit": 2,
       "url_length": 2, "threads": 2, "interval": 2, "timeout": 2, "max_retries": 2, "sleep": 2,
@@ -123,15 +133,31 @@ def test__url_api(api, params, expected):
 
 @pytest.mark.parametrize("threads, expected", [
     (2, 2),
+    (20, 20),
 ])
 def test__threads(api_, threads, expected):
     """NbApi.threads() setter."""
     assert api_.threads == 1
 
+    created = api_.ipam.vrfs
     api_.threads = threads
 
     assert api_.threads == expected
+    assert created.threads == expected
     assert api_.dcim.devices.threads == expected
+    assert api_.pool.threads == expected
+    assert api_.session.get_adapter("https://")._pool_maxsize == max(expected, 10)
+
+
+def test__enter__():
+    """NbApi.__enter__() __exit__() close()."""
+    with NbApi(host="nb", threads=2) as api:
+        assert api.dcim.devices.pool is api.pool
+        assert api.ipam.vrfs.pool is api.pool
+        api.pool.submit(int).result()
+        assert api.pool.running is True
+
+    assert api.pool.running is False
 
 
 # ============================= methods ==============================
@@ -212,6 +238,8 @@ def test__copy(api_, host, expected):
 
     actual = api2.host
     assert actual == expected
+    assert api2.session is api_.session
+    assert api2.ipam.vrfs._session is api_.dcim.devices._session is api_.session
 
 
 @pytest.mark.parametrize("params, expected", [
@@ -1,18 +1,22 @@
 """Tests nbforager/nb_forager.py."""
 import inspect
+from copy import deepcopy
 from pathlib import Path
+from typing import Any
 from unittest.mock import Mock
 from unittest.mock import patch, mock_open
 
+import dictdiffer
 import pytest
 import requests_mock
 from _pytest.monkeypatch import MonkeyPatch
 
-from nbforager import ami, nb_forager
+from nbforager import ami, nb_forager, nb_tree
 from nbforager.nb_api import NbApi
 from nbforager.nb_cache import NbCache
 from nbforager.nb_forager import NbForager
 from nbforager.nb_tree import NbTree
+from nbforager.types import DAny
 from tests import functions as func
 from tests import params as p
 from tests.fixtures import nbf, nbf_, nbf_r
@@ -60,6 +64,13 @@ def test__init(nbf_: NbForager):
         "strict",
         "extended_get",
         "loners",
+        "extended_get_ttl",
+        "extended_get_size",
+        "max_in_flight",
+        "endpoint_limits",
+        "adaptive",
+        "keyset",
+        "pool_size",
         "cache",
         "kwargs",
     ]
@@ -136,6 +147,9 @@ def test__init(nbf_: NbForager):
     diff = set(params).difference(set(api.ipam.aggregates._init_params))
     assert diff == {"cache"}
 
+    with pytest.raises(TypeError):
+        NbForager(host="nb", max_inflight=2)  # type: ignore
+
 
 def test__host(nbf_: NbForager):
     """NbForager.host."""
@@ -212,7 +226,7 @@ def test__read_cache(nbf_: NbForager):
     """NbForager.read_cache()."""
     tree = NbTree()
     tree.ipam.vrfs.update(func.vrf_d([1]))  # pylint: disable=E1101
-    meta = {"write_time": "2000-12-31 23:59:59"}
+    meta = {"write_time": "2000-12-31 23:59:59", "models": ["ipam/prefixes"]}
     return_value = {"tree": tree.model_dump(), "status": {"meta": meta}}
     patch("pathlib.Path.open", mock_open()).start()
     patch("pickle.load", return_value=return_value).start()
@@ -221,6 +235,7 @@ def test__read_cache(nbf_: NbForager):
     nbf_.read_cache()
     assert nbf_.root.ipam.vrfs[1]["id"] == 1
     assert nbf_.status["meta"] == meta
+    assert nbf_.root.ipam.requested() == ["prefixes", "vrfs"]
 
 
 def test__write_cache(nbf_: NbForager, monkeypatch: MonkeyPatch):
@@ -241,6 +256,85 @@ def test__get_status(nbf_: NbForager):
         assert actual == {"netbox-version": "3.6.5"}
 
 
+def test__complete():
+    """NbForager.complete()."""
+    nbf = NbForager(host="netbox")
+    vrf1 = {"id": 1, "url": "https://netbox/api/ipam/vrfs/1/", "name": "A", "comments": ""}
+    nbf.root.ipam.vrfs[1] = {"id": 1, "url": vrf1["url"], "_partial": True}
+    nbf.root.ipam.vrfs[2] = {"id": 2, "url": "https://netbox/api/ipam/vrfs/2/"}
+
+    with requests_mock.Mocker() as mock:
+        mock.get("https://netbox/api/ipam/vrfs/?id=1", json={"results": [vrf1]})
+        nbf.join_tree(complete=True)
+
+    assert nbf.root.ipam.vrfs[1]["comments"] == ""
+    assert nbf.root.ipam.vrfs[1]["_partial"] is False
+    assert nbf.tree.ipam.vrfs[1]["comments"] == ""
+    assert "comments" not in nbf.root.ipam.vrfs[2]
+
+
+@pytest.mark.parametrize("version, url", [
+    ("4.1.0", "https://netbox/api/core/object-changes/"),
+    ("3.7.0", "https://netbox/api/extras/object-changes/"),
+])
+def test__sync(version, url):
+    """NbForager.sync()."""
+    nbf = NbForager(host="netbox")
+    nbf.status = {"netbox-version": version, "meta": {"write_time": "2026-01-01 00:00:00"}}
+    vrfs = {i: {"id": i, "url": f"https://netbox/api/ipam/vrfs/{i}/", "name": "B"} for i in [1, 3]}
+    nbf.root.ipam.vrfs.update({
+        1: {"id": 1, "name": "A", "_nested": True},
+        2: {"id": 2, "name": "A"},
+        5: {"id": 5, "name": "A"},
+    })
+    changes = [
+        {"id": 1, "time": "1", "action": {"value": "update"}, "changed_object_id": 1},
+        {"id": 2, "time": "1", "action": {"value": "delete"}, "changed_object_id": 2},
+        {"id": 3, "time": "1", "action": {"value": "create"}, "changed_object_id": 3},
+        {"id": 5, "time": "2", "action": {"value": "delete"}, "changed_object_id": 4},
+        {"id": 4, "time": "1", "action": {"value": "create"}, "changed_object_id": 4},
+    ]
+    changes = [{**d, "changed_object_type": "ipam.vrf"} for d in changes]
+    changes.append({"id": 6, "time": "1", "action": {"value": "create"}, "changed_object_id": 1,
+                    "changed_object_type": "dcim.device"})
+    changes = [{**d, "url": f"{url}{d['id']}/"} for d in changes]
+
+    with requests_mock.Mocker() as mock:
+        mock.get(f"{url}?time_after=2026-01-01+00:00:00", json={"results": changes})
+        mock.get("https://netbox/api/ipam/vrfs/?id=1&id=3", json={"results": list(vrfs.values())})
+        keys = nbf.sync()
+
+    assert keys == {("ipam", "vrfs", i) for i in [1, 2, 3, 4]}
+    actual = {i: (d["name"], d.get("_nested")) for i, d in nbf.root.ipam.vrfs.items()}
+    assert actual == {1: ("B", True), 3: ("B", False), 5: ("A", None)}
+    assert nbf.root.dcim.devices == {}
+    assert nbf.status["meta"]["write_time"] > "2026-01-01 00:00:00"
+
+    nbf.status = {}
+    with pytest.raises(ValueError):
+        nbf.sync()
+
+
+def test__sync__requested():
+    """NbForager.sync() creates objects in the requested model without objects."""
+    url = "https://netbox/api/core/object-changes/"
+    nbf = NbForager(host="netbox")
+    nbf.status = {"netbox-version": "4.1.0", "meta": {"write_time": "2026-01-01 00:00:00"}}
+    vrf = {"id": 1, "url": "https://netbox/api/ipam/vrfs/1/", "name": "A"}
+    changes = [{"id": 1, "time": "1", "action": {"value": "create"}, "changed_object_id": 1,
+                "changed_object_type": "ipam.vrf", "url": f"{url}1/"}]
+
+    with requests_mock.Mocker() as mock:
+        mock.get("https://netbox/api/ipam/vrfs/", json={"results": []})
+        nbf.ipam.vrfs.get()
+        mock.get(f"{url}?time_after=2026-01-01+00:00:00", json={"results": changes})
+        mock.get("https://netbox/api/ipam/vrfs/?id=1", json={"results": [vrf]})
+        keys = nbf.sync()
+
+    assert keys == {("ipam", "vrfs", 1)}
+    assert list(nbf.root.ipam.vrfs) == [1]
+
+
 def test__join_tree(nbf_r: NbForager):
     """NbForager.join_tree()."""
     assert nbf_r.tree.ipam.aggregates == {}
@@ -285,6 +379,159 @@ def test__join_tree(nbf_r: NbForager):
     assert ip_address["_super_prefix"]["prefix"] == p.PREFIX1
 
 
+@pytest.mark.parametrize("ipam_all, exp_aggregate, exp_prefix", [
+    (False, {}, {}),
+    (True, {"id": 1}, {"id": 11}),
+])
+def test__join_tree__ipam_all(ipam_all, exp_aggregate, exp_prefix):
+    """NbForager.join_tree(ipam_all) IPv6 objects."""
+    nbf = NbForager(host="netbox")
+    for model, key, idx, network in [
+        ("aggregates", "prefix", 1, "2001:db8::/32"),
+        ("prefixes", "prefix", 11, "2001:db8::/48"),
+        ("prefixes", "prefix", 12, "2001:db8::/64"),
+    ]:
+        url = f"/api/ipam/{model}/{idx}/"
+        data = {"id": idx, "url": url, key: network, "family": {"value": 6}, "vrf": None}
+        getattr(nbf.root.ipam, model)[idx] = data
+
+    nbf.join_tree(ipam=True, ipam_all=ipam_all)
+
+    prefix = nbf.tree.ipam.prefixes[12]
+    assert {k: v for k, v in prefix["_aggregate"].items() if k == "id"} == exp_aggregate
+    assert {k: v for k, v in prefix["_super_prefix"].items() if k == "id"} == exp_prefix
+
+
+@pytest.mark.parametrize("inplace", [False, True])
+def test__join_tree__inplace(inplace):
+    """NbForager.join_tree(inplace)."""
+    nbf_r = NbForager(host="netbox")
+    nb_tree.insert_tree(src=deepcopy(func.full_tree()), dst=nbf_r.root)
+    nbf_r.tree.ipam.vrfs[9] = {"id": 9}  # absent in root
+    nbf_r.tree.ipam.prefixes[p.P1] = {"id": p.P1}  # replaced by root
+
+    nbf_r.join_tree(ipam=True, inplace=inplace)
+
+    assert nbf_r.tree.ipam.vrfs[9] == {"id": 9}
+    root_prefix = nbf_r.root.ipam.prefixes[p.P1]
+    tree_prefix = nbf_r.tree.ipam.prefixes[p.P1]
+    assert tree_prefix["_sub_prefixes"][0]["prefix"] == p.PREFIX4
+    assert (root_prefix is tree_prefix) is inplace
+    assert ("_sub_prefixes" in root_prefix) is inplace
+
+
+def _summary(tree: NbTree) -> DAny:
+    """Represent the joined objects by URLs, to compare the trees with cyclic links."""
+
+    def _value(value: Any, nested: bool = False) -> Any:
+        if isinstance(value, dict):
+            if value.get("url") and not nested:
+                return value["url"]
+            return {k: _value(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [_value(v, nested) for v in value]
+        return str(value)
+
+    summary: DAny = {}
+    for app in tree.apps():
+        for model in getattr(tree, app).models():
+            for idx, data in getattr(getattr(tree, app), model).items():
+                summary[f"{app}/{model}/{idx}"] = {
+                    k: _value(v, nested=not k.startswith("_")) for k, v in data.items()
+                }
+    return summary
+
+
+def _rename_interface(root: NbTree) -> None:
+    root.dcim.interfaces[11]["name"] = "GigabitEthernet9"
+
+
+def _move_ip_address(root: NbTree) -> None:
+    root.ipam.ip_addresses[21]["assigned_object_id"] = 13
+
+
+def _delete_interface(root: NbTree) -> None:
+    del root.dcim.interfaces[12]
+
+
+def _delete_prefix(root: NbTree) -> None:
+    del root.ipam.prefixes[14]
+    root.ipam.prefixes[15]["_depth"] = 1
+
+
+def _create_prefix(root: NbTree) -> None:
+    root.ipam.prefixes[16] = {**root.ipam.prefixes[14], "id": 16, "prefix": "10.0.0.0/25",
+                              "url": "/api/ipam/prefixes/16/"}
+    root.ipam.prefixes[14]["_depth"] = 2
+    root.ipam.prefixes[15]["_depth"] = 3
+
+
+def _rename_device(root: NbTree) -> None:
+    root.dcim.devices[1]["name"] = "DEVICE9"
+
+
+def _resize_aggregate(root: NbTree) -> None:
+    root.ipam.aggregates[1]["prefix"] = "10.0.0.0/28"
+
+
+def _delete_vc_member(root: NbTree) -> None:
+    del root.dcim.devices[4]
+
+
+@pytest.mark.parametrize("change, keys", [
+    (_rename_interface, {("dcim", "interfaces", 11)}),
+    (_move_ip_address, {("ipam", "ip_addresses", 21)}),
+    (_delete_interface, {("dcim", "interfaces", 12)}),
+    (_delete_prefix, {("ipam", "prefixes", 14), ("ipam", "prefixes", 15)}),
+    (_create_prefix, {("ipam", "prefixes", 16), ("ipam", "prefixes", 14),
+                      ("ipam", "prefixes", 15)}),
+    (_rename_device, {("dcim", "devices", 1)}),
+    (_resize_aggregate, {("ipam", "aggregates", 1)}),
+    (_delete_vc_member, {("dcim", "devices", 4)}),
+])
+def test__join_tree__keys(nbf_r: NbForager, change, keys):
+    """NbForager.join_tree(keys) the same as the full join."""
+    nbf_r.join_tree(dcim=True, ipam=True)
+    change(nbf_r.root)
+
+    nbf_r.join_tree(dcim=True, ipam=True, keys=keys)
+
+    nbf2 = NbForager(host="netbox")
+    nb_tree.insert_tree(src=nbf_r.root, dst=nbf2.root)
+    nbf2.join_tree(dcim=True, ipam=True)
+    actual = _summary(nbf_r.tree)
+    expected = _summary(nbf2.tree)
+    diff = list(dictdiffer.diff(actual, expected))
+    assert not diff
+
+
+@pytest.mark.parametrize("changes", [
+    [(_rename_interface, {("dcim", "interfaces", 11)}),
+     (_delete_interface, {("dcim", "interfaces", 12)})],
+    [(_create_prefix, {("ipam", "prefixes", 16), ("ipam", "prefixes", 14),
+                       ("ipam", "prefixes", 15)}),
+     (_delete_prefix, {("ipam", "prefixes", 14), ("ipam", "prefixes", 15)})],
+    [(_resize_aggregate, {("ipam", "aggregates", 1)}),
+     (_move_ip_address, {("ipam", "ip_addresses", 21)})],
+    [(_rename_device, {("dcim", "devices", 1)}),
+     (_delete_vc_member, {("dcim", "devices", 4)})],
+])
+def test__join_tree__keys_indexed(nbf_r: NbForager, changes):
+    """NbForager.join_tree(keys) repeated, the indexes are updated on each join."""
+    nbf_r.join_tree(dcim=True, ipam=True)
+    for change, keys in changes:
+        change(nbf_r.root)
+        nbf_r.join_tree(dcim=True, ipam=True, keys=keys)
+
+    nbf2 = NbForager(host="netbox")
+    nb_tree.insert_tree(src=nbf_r.root, dst=nbf2.root)
+    nbf2.join_tree(dcim=True, ipam=True)
+    actual = _summary(nbf_r.tree)
+    expected = _summary(nbf2.tree)
+    diff = list(dictdiffer.diff(actual, expected))
+    assert not diff
+
+
 @pytest.mark.parametrize("version, expected", [
     ("", "0.0.0"),
     ("3.6.5", "3.6.5"),
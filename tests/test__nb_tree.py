@@ -1,11 +1,13 @@
 """Tests nbforager/nb_tree.py."""
 import difflib
+from copy import deepcopy
 from typing import Any
 
 import pytest
 
 from nbforager import nb_tree, NbApi
 from nbforager.nb_tree import NbTree
+from nbforager.parser.nb_parser import NbPredicate
 from nbforager.types import DAny, LStr
 from tests import functions as func
 from tests import params as p
@@ -77,6 +79,101 @@ def test__count():
     assert tree.count() == 14
 
 
+@pytest.mark.parametrize("params, expected", [
+    ({}, [1, 2, 3]),
+    ({"name": "A"}, [1, 3]),
+    ({"name": ["B", "A"]}, [1, 2, 3]),
+    ({"name": "C"}, []),
+    ({"site__slug": "s1"}, [1, 2]),
+    ({"site__slug": None}, [3]),
+    ({"tags__slug": "t2"}, [1, 3]),
+    ({"tags__slug": ["t1", "t2"]}, [1, 2, 3]),
+    ({"name": "A", "tags__slug": "t1"}, [1]),
+    ({"site": {"slug": "s1"}}, [1, 2]),  # unhashable value
+    ({"site": [{"slug": "s1"}], "name": "B"}, [2]),
+    ({"predicate": NbPredicate(name="A")}, [1, 3]),
+    ({"predicate": NbPredicate(name="A"), "site__slug": "s1"}, [1]),
+    ({"tags": "t1"}, ValueError),
+])
+def test__find(params, expected: Any):
+    """BaseTree.find()."""
+    tree = NbTree()
+    tree.dcim.devices.update({
+        1: {"id": 1, "name": "A", "site": {"slug": "s1"}, "tags": [{"slug": "t1"}, {"slug": "t2"}]},
+        2: {"id": 2, "name": "B", "site": {"slug": "s1"}, "tags": [{"slug": "t1"}]},
+        3: {"id": 3, "name": "A", "site": None, "tags": [{"slug": "t2"}, {"slug": "t2"}]},
+    })
+    if isinstance(expected, list):
+        for indexed in [False, True, True]:  # scan, build and use the index
+            actual = [d["id"] for d in tree.dcim.find("devices", indexed=indexed, **params)]
+            assert actual == expected
+    else:
+        with pytest.raises(expected):
+            tree.dcim.find("devices", **params)
+
+
+def test__find__changed():
+    """BaseTree.find() objects changed in place."""
+    tree = NbTree()
+    tree.ipam.vrfs.update(func.vrf_d([1, 2]))
+    for indexed in [False, True]:
+        assert [d["id"] for d in tree.ipam.find("vrfs", indexed=indexed, id=1)] == [1]
+
+    # object is replaced
+    vrf = {"id": 1, "name": "NEW"}
+    tree.ipam.vrfs[1] = vrf
+    for indexed in [False, True]:
+        assert tree.ipam.find("vrfs", indexed=indexed, id=1)[0] is vrf
+
+    # value is changed
+    tree.ipam.vrfs[2]["name"] = "NEW"
+    assert [d["id"] for d in tree.ipam.find("vrfs", name="NEW")] == [1, 2]
+
+
+def test__invalidate():
+    """BaseTree.invalidate()."""
+    tree = NbTree()
+    tree.ipam.vrfs.update(func.vrf_d([1, 2]))
+    assert [d["id"] for d in tree.ipam.find("vrfs", indexed=True, id=3)] == []
+
+    # number of objects is changed
+    tree.ipam.vrfs.update(func.vrf_d([3]))
+    assert [d["id"] for d in tree.ipam.find("vrfs", indexed=True, id=3)] == [3]
+
+    # value is changed in place
+    assert [d["id"] for d in tree.ipam.find("vrfs", indexed=True, name="NEW")] == []
+    tree.ipam.vrfs[1]["name"] = "NEW"
+    assert [d["id"] for d in tree.ipam.find("vrfs", indexed=True, name="NEW")] == []
+    tree.ipam.invalidate("vrfs")
+    assert [d["id"] for d in tree.ipam.find("vrfs", indexed=True, name="NEW")] == [1]
+
+    # dictionary is replaced
+    tree.ipam.vrfs = func.vrf_d([5, 6, 7])
+    assert [d["id"] for d in tree.ipam.find("vrfs", indexed=True, id=5)] == [5]
+
+    # copy builds own indexes
+    assert [d["id"] for d in tree.ipam.find("vrfs", indexed=True, name="NEW")] == []
+    tree_ = deepcopy(tree)
+    tree_.ipam.vrfs[5]["name"] = "NEW"
+    tree_.invalidate()
+    assert [d["id"] for d in tree_.ipam.find("vrfs", indexed=True, name="NEW")] == [5]
+    assert [d["id"] for d in tree.ipam.find("vrfs", indexed=True, name="NEW")] == []
+
+
+def test__requested():
+    """BaseTree.requested()."""
+    tree = NbTree()
+    tree.ipam.vrfs.update(func.vrf_d([1]))
+    assert tree.ipam.requested() == ["vrfs"]
+
+    tree.ipam.mark_requested("prefixes")
+    tree.ipam.vrfs.clear()
+    assert tree.ipam.requested() == ["prefixes"]
+
+    tree.clear()
+    assert tree.ipam.requested() == []
+
+
 def test__models():
     """NbTree.models()"""
     tree = NbTree()
@@ -130,6 +227,21 @@ def test__get_child(child: Any, exp_id, exp_object):
             nb_tree._get_child(child=child, tree=tree)
 
 
+@pytest.mark.parametrize("copy, expected", [
+    (True, False),
+    (False, True),
+])
+def test__join_tree__copy(copy, expected):
+    """nb_tree.join_tree(copy)."""
+    tree: NbTree = deepcopy(func.full_tree())
+
+    actual = nb_tree.join_tree(tree, copy=copy)
+
+    assert (actual is tree) is expected
+    assert ("tags" in tree.dcim.interfaces[p.D1P1]["device"]) is expected
+    assert "tags" in actual.dcim.interfaces[p.D1P1]["device"]
+
+
 def test__join_dcim_devices__circuit():
     """nb_tree.join_tree() circuit termination."""
     tree: NbTree = func.full_tree()
@@ -247,6 +359,18 @@ def test__missed_urls(caplog, urls, expected, errors):
     assert logs == errors
 
 
+def test__partial_ids():
+    """nb_tree.partial_ids()"""
+    tree = func.full_tree()
+    assert nb_tree.partial_ids(tree) == {}
+
+    tree.ipam.vrfs[1]["_partial"] = True
+    tree.dcim.devices[1]["_partial"] = False
+
+    actual = nb_tree.partial_ids(tree)
+    assert actual == {"ipam/vrfs": [1]}
+
+
 @pytest.mark.parametrize("object_type, path, expected", [
     # path=False
     ("ipam.ipaddress", False, ("ipam", "ip_addresses")),